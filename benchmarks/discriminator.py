@@ -0,0 +1,96 @@
+"""
+Compare speed of loading of JSON via `oneOf` schema with and without discriminator.
+
+Run from root of the repository:
+
+    python benchmarks/discriminator.py
+"""
+
+import json
+import tempfile
+import timeit
+from pathlib import Path
+
+from flask import Flask
+from flask_first import First
+
+NUMBER = 2000
+VARIANTS = 40
+
+
+def make_spec(with_discriminator: bool) -> dict:
+    """Specification of polymorphic events with `VARIANTS` types of events."""
+    schemas = {
+        f'Event{number}': {
+            'type': 'object',
+            'required': ['event_type', f'field_{number}'],
+            'properties': {
+                'event_type': {'type': 'string'},
+                f'field_{number}': {'type': 'string'},
+                'created': {'type': 'string', 'format': 'date-time'},
+            },
+        }
+        for number in range(VARIANTS)
+    }
+    schemas['Event'] = {'oneOf': [{'$ref': f'#/components/schemas/{name}'} for name in schemas]}
+    if with_discriminator:
+        schemas['Event']['discriminator'] = {'propertyName': 'event_type'}
+
+    return {
+        'openapi': '3.1.0',
+        'info': {'title': 'Events', 'version': '1.0.0'},
+        'paths': {
+            '/events': {
+                'post': {
+                    'operationId': 'create_event',
+                    'requestBody': {
+                        'content': {
+                            'application/json': {'schema': {'$ref': '#/components/schemas/Event'}}
+                        }
+                    },
+                    'responses': {'201': {'description': 'Created'}},
+                }
+            }
+        },
+        'components': {'schemas': schemas},
+    }
+
+
+def measure(with_discriminator: bool, tmp_dir: str) -> float:
+    path_to_spec = Path(tmp_dir, f'openapi_{with_discriminator}.json')
+    path_to_spec.write_text(json.dumps(make_spec(with_discriminator)))
+    first = First(path_to_spec, Flask('benchmark'))
+
+    def create_event() -> tuple:
+        return {}, 201
+
+    first.add_view_func(create_event)
+    operation = first._operations[('create_event', 'POST')]
+    event = {
+        'event_type': f'Event{VARIANTS - 1}',
+        f'field_{VARIANTS - 1}': 'value',
+        'created': '2024-01-01T00:00:00Z',
+    }
+
+    operation.load_request_json(event)
+    seconds = min(
+        timeit.repeat(lambda: operation.load_request_json(event), number=NUMBER, repeat=5)
+    )
+    return seconds / NUMBER * 1_000_000
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        without_discriminator = measure(False, tmp_dir)
+        with_discriminator = measure(True, tmp_dir)
+
+    print(f'Loading of JSON via oneOf of {VARIANTS} schemas')
+    print(f'{"without discriminator, us":>26}{"with discriminator, us":>26}{"speedup":>10}')
+    print(
+        f'{without_discriminator:>26.1f}{with_discriminator:>26.1f}'
+        f'{without_discriminator / with_discriminator:>9.1f}x'
+    )
+
+
+if __name__ == '__main__':
+    main()
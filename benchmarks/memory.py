@@ -0,0 +1,97 @@
+"""
+Measure memory used by the specification in every worker.
+
+Run from root of the repository:
+
+    python benchmarks/memory.py
+
+Every case is measured in a new process with all operations prepared for requests. Python heap is
+measured via `tracemalloc`, resident size of the whole process is read from `/proc`, so Linux is
+required.
+"""
+
+import json
+import subprocess  # nosec
+import sys
+import tempfile
+from copy import deepcopy
+from pathlib import Path
+
+from flask_first.first.loaders.yaml_loader import YAMLReader
+
+PATH_TO_SPEC = Path(Path(__file__).parent, 'openapi.yaml')
+COPIES_OF_PATHS = 100
+CASES = {
+    'eager': {},
+    'lazy': {'FIRST_LAZY_COMPILE': True},
+}
+
+WORKER = '''
+import gc
+import resource
+import sys
+import tracemalloc
+
+tracemalloc.start()
+from flask import Flask
+from flask_first import First
+
+app = Flask('memory')
+app.config.update({config})
+first = First(sys.argv[1], app)
+for operation_id in first.spec.operation_routes:
+    def view() -> None:
+        pass
+
+    view.__name__ = operation_id
+    first.add_view_func(view)
+for operation in first._operations.values():
+    operation.prepare()
+gc.collect()
+
+heap, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+with open('/proc/self/statm') as f:
+    rss = int(f.read().split()[1]) * resource.getpagesize()
+print(heap, rss)
+'''
+
+
+def make_spec(copies: int) -> dict:
+    """Specification with paths copied `copies` times, similar to specification of big service."""
+    spec = YAMLReader(PATH_TO_SPEC).load().store[PATH_TO_SPEC.name]
+    paths = spec['paths']
+    spec['paths'] = {}
+    for number in range(copies):
+        for route, path_item in paths.items():
+            path_item = deepcopy(path_item)
+            for operation in path_item.values():
+                operation['operationId'] = f'{operation["operationId"]}_{number}'
+            spec['paths'][f'/v{number}{route}'] = path_item
+    return spec
+
+
+def measure(path_to_spec: Path, config: dict) -> tuple[int, int]:
+    result = subprocess.run(  # nosec
+        [sys.executable, '-c', WORKER.format(config=config), str(path_to_spec)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    heap, rss = result.stdout.split()
+    return int(heap), int(rss)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path_to_spec = Path(tmp_dir, 'openapi.json')
+        path_to_spec.write_text(json.dumps(make_spec(COPIES_OF_PATHS)))
+
+        print(f'{"case":<10}{"Python heap, MiB":>20}{"resident size, MiB":>22}')
+        for name, config in CASES.items():
+            heap, rss = measure(path_to_spec, config)
+            print(f'{name:<10}{heap / 2**20:>20.1f}{rss / 2**20:>22.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare speed of validating of requests by view functions and by `FirstWSGIMiddleware`.
+
+Run from root of the repository:
+
+    python benchmarks/middleware.py
+"""
+
+import timeit
+from pathlib import Path
+
+from flask import Flask
+from flask_first import First
+from flask_first.middleware import FirstWSGIMiddleware
+from validation_engine import ARGS
+from validation_engine import JSON
+
+PATH_TO_SPEC = Path(Path(__file__).parent, 'openapi.yaml')
+NUMBER = 2000
+INVALID_JSON = {**JSON, 'lines': 'not list'}
+INVALID_ARGS = {**ARGS, 'page': 'first'}
+
+
+def create_app(with_middleware: bool) -> Flask:
+    app = Flask('benchmark')
+    first = First(PATH_TO_SPEC, app)
+
+    @app.errorhandler(Exception)
+    def bad_request(error: Exception) -> tuple:
+        return {'message': str(error)}, 400
+
+    def orders_list() -> list:
+        return []
+
+    def create_order() -> tuple:
+        return {}, 201
+
+    first.add_view_func(orders_list)
+    first.add_view_func(create_order)
+    if with_middleware:
+        app.wsgi_app = FirstWSGIMiddleware(app.wsgi_app, first)
+    return app
+
+
+def measure(with_middleware: bool) -> dict:
+    client = create_app(with_middleware).test_client()
+    cases = {
+        'valid POST': lambda: client.post('/orders', json=JSON),
+        'invalid POST': lambda: client.post('/orders', json=INVALID_JSON),
+        'valid GET': lambda: client.get('/orders', query_string=ARGS),
+        'invalid GET': lambda: client.get('/orders', query_string=INVALID_ARGS),
+    }
+    results = {}
+    for name, case in cases.items():
+        case()
+        seconds = min(timeit.repeat(case, number=NUMBER, repeat=5))
+        results[name] = seconds / NUMBER * 1_000_000
+    return results
+
+
+def main() -> None:
+    view_results = measure(with_middleware=False)
+    middleware_results = measure(with_middleware=True)
+
+    print(f'{"case":<16}{"view function, us":>20}{"middleware, us":>18}')
+    for name, view_time in view_results.items():
+        print(f'{name:<16}{view_time:>20.1f}{middleware_results[name]:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Measure overhead of Flask-First for endpoints of application, which are not in the specification.
+
+Run from root of the repository:
+
+    python benchmarks/non_spec_endpoint.py
+"""
+
+import timeit
+from pathlib import Path
+
+from flask import Flask
+from flask_first import First
+
+PATH_TO_SPEC = Path(Path(__file__).parent, 'openapi.yaml')
+NUMBER = 5000
+
+
+def create_app(with_first: bool) -> Flask:
+    app = Flask('benchmark')
+
+    @app.route('/health', methods=['GET', 'POST'])
+    def health() -> dict:
+        return {'status': 'OK'}
+
+    if with_first:
+        first = First(PATH_TO_SPEC, app)
+
+        def orders_list() -> list:
+            return []
+
+        first.add_view_func(orders_list)
+    return app
+
+
+def measure(with_first: bool) -> dict:
+    client = create_app(with_first).test_client()
+    cases = {
+        'GET request': lambda: client.get('/health'),
+        'POST request': lambda: client.post('/health', json={'status': 'OK'}),
+        'static file': lambda: client.get('/static/missing.js'),
+    }
+    results = {}
+    for name, case in cases.items():
+        case()
+        seconds = min(timeit.repeat(case, number=NUMBER, repeat=5))
+        results[name] = seconds / NUMBER * 1_000_000
+    return results
+
+
+def main() -> None:
+    without_first = measure(with_first=False)
+    with_first = measure(with_first=True)
+
+    print(f'{"case":<16}{"without First, us":>20}{"with First, us":>18}')
+    for name, time in without_first.items():
+        print(f'{name:<16}{time:>20.1f}{with_first[name]:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Measure memory shared between workers forked from master process with loaded specification.
+
+Run from root of the repository:
+
+    python benchmarks/preload.py
+
+Every case is measured in a new master process, it loads the specification like
+`gunicorn --preload` and forks workers. Every worker validates requests to all operations and runs
+garbage collector, then reads private and shared memory of itself from `/proc`, so Linux is
+required.
+"""
+
+import gc
+import json
+import os
+import subprocess  # nosec
+import sys
+import tempfile
+from pathlib import Path
+
+from flask import Flask
+from flask_first import First
+from memory import make_spec
+from validation_engine import ARGS
+from validation_engine import JSON
+
+COPIES_OF_PATHS = 100
+WORKERS = 4
+CASES = {
+    'not frozen': {},
+    'frozen': {'FIRST_PRELOAD_FREEZE': True},
+}
+
+
+def create_first(path_to_spec: Path, config: dict) -> First:
+    app = Flask('preload')
+    app.config.update(config)
+    first = First(path_to_spec, app)
+    for operation_id in first.spec.operation_routes:
+
+        def view() -> dict:
+            return {}
+
+        view.__name__ = operation_id
+        first.add_view_func(view)
+    for operation in first._operations.values():
+        operation.prepare()
+    return first
+
+
+def read_memory() -> tuple[int, int]:
+    """Private and shared memory of current process in KiB."""
+    memory = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if value.strip().endswith('kB'):
+                memory[name] = int(value.split()[0])
+    private = memory['Private_Clean'] + memory['Private_Dirty']
+    shared = memory['Shared_Clean'] + memory['Shared_Dirty']
+    return private, shared
+
+
+def work(first: First) -> None:
+    client = first.app.test_client()
+    for route in first.spec.resolved_spec['paths']:
+        client.get(route, query_string=ARGS)
+        client.post(route, json=JSON)
+    gc.collect()
+
+
+def measure(path_to_spec: Path, config: dict) -> tuple[int, int]:
+    first = create_first(path_to_spec, config)
+    pipes = []
+    for _ in range(WORKERS):
+        read_fd, write_fd = os.pipe()
+        if os.fork() == 0:
+            os.close(read_fd)
+            work(first)
+            os.write(write_fd, json.dumps(read_memory()).encode())
+            os._exit(0)
+        os.close(write_fd)
+        pipes.append(read_fd)
+
+    private = shared = 0
+    for read_fd in pipes:
+        with os.fdopen(read_fd) as f:
+            worker_private, worker_shared = json.loads(f.read())
+        private += worker_private
+        shared += worker_shared
+    for _ in range(WORKERS):
+        os.wait()
+
+    return private // WORKERS, shared // WORKERS
+
+
+def main() -> None:
+    if not hasattr(os, 'fork'):
+        sys.exit('Forking of processes is not supported.')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path_to_spec = Path(tmp_dir, 'openapi.json')
+        path_to_spec.write_text(json.dumps(make_spec(COPIES_OF_PATHS)))
+
+        print(f'{WORKERS} workers, memory of every worker')
+        print(f'{"case":<12}{"private, MiB":>16}{"shared, MiB":>16}')
+        for name in CASES:
+            result = subprocess.run(  # nosec
+                [sys.executable, __file__, str(path_to_spec), name],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            private, shared = json.loads(result.stdout)
+            print(f'{name:<12}{private / 2**10:>16.1f}{shared / 2**10:>16.1f}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        print(json.dumps(measure(Path(sys.argv[1]), CASES[sys.argv[2]])))
+    else:
+        main()
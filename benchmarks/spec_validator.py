@@ -0,0 +1,59 @@
+"""
+Compare speed of validators of specification.
+
+Run from root of the repository:
+
+    python benchmarks/spec_validator.py
+"""
+
+import timeit
+from copy import deepcopy
+from functools import partial
+from pathlib import Path
+
+from flask_first.first.loaders import load_from_file
+from flask_first.first.validator import Validator
+from openapi_spec_validator import validate
+
+PATH_TO_SPEC = Path(Path(__file__).parent, 'openapi.yaml')
+NUMBER = 5
+COPIES_OF_PATHS = (1, 50)
+
+
+def make_spec(copies: int) -> dict:
+    """Specification with paths copied `copies` times, similar to specification of big service."""
+    spec = load_from_file(PATH_TO_SPEC)
+    paths = spec['paths']
+    spec['paths'] = {}
+    for number in range(copies):
+        for route, path_item in paths.items():
+            path_item = deepcopy(path_item)
+            for operation in path_item.values():
+                operation['operationId'] = f'{operation["operationId"]}_{number}'
+            spec['paths'][f'/v{number}{route}'] = path_item
+    return spec
+
+
+def main() -> None:
+    validators = {
+        'openapi-spec-validator': validate,
+        'flask-first': lambda spec: Validator(spec).validate(),
+    }
+
+    print(f'{"paths":<8}' + ''.join(f'{name + ", ms":>28}' for name in validators) + '   speedup')
+    for copies in COPIES_OF_PATHS:
+        spec = make_spec(copies)
+        times = []
+        for validator in validators.values():
+            validator(spec)
+            seconds = min(timeit.repeat(partial(validator, spec), number=NUMBER, repeat=3))
+            times.append(seconds / NUMBER * 1000)
+        print(
+            f'{len(spec["paths"]):<8}'
+            + ''.join(f'{t:>28.2f}' for t in times)
+            + f'{times[0] / times[1]:>9.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
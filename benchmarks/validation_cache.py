@@ -0,0 +1,63 @@
+"""
+Measure speed of GET requests with the same query string with and without validation cache.
+
+Run from root of the repository:
+
+    python benchmarks/validation_cache.py
+"""
+
+import tempfile
+import timeit
+from pathlib import Path
+
+import yaml
+from flask import Flask
+from flask_first import First
+from validation_engine import ARGS
+from validation_engine import ENGINES
+
+PATH_TO_SPEC = Path(Path(__file__).parent, 'openapi.yaml')
+NUMBER = 2000
+CACHE_SIZE = 10000
+
+
+def create_first(path_to_spec: Path, validation_engine: str) -> First:
+    app = Flask('benchmark')
+    app.config['FIRST_VALIDATION_ENGINE'] = validation_engine
+    first = First(path_to_spec, app)
+
+    def orders_list() -> list:
+        return []
+
+    first.add_view_func(orders_list)
+    return first
+
+
+def measure(path_to_spec: Path, validation_engine: str) -> float:
+    client = create_first(path_to_spec, validation_engine).app.test_client()
+
+    def case():
+        return client.get('/orders', query_string=ARGS)
+
+    case()
+    seconds = min(timeit.repeat(case, number=NUMBER, repeat=5))
+    return seconds / NUMBER * 1_000_000
+
+
+def main() -> None:
+    spec = yaml.safe_load(PATH_TO_SPEC.read_text())
+    spec['paths']['/orders']['get']['x-first-validation-cache'] = CACHE_SIZE
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path_to_cached_spec = Path(tmp_dir, 'openapi.yaml')
+        path_to_cached_spec.write_text(yaml.safe_dump(spec))
+
+        print(f'{"engine":<14}{"without cache, us":>20}{"with cache, us":>18}')
+        for engine in ENGINES:
+            without_cache = measure(PATH_TO_SPEC, engine)
+            with_cache = measure(path_to_cached_spec, engine)
+            print(f'{engine:<14}{without_cache:>20.1f}{with_cache:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare speed of validation engines.
+
+Run from root of the repository:
+
+    python benchmarks/validation_engine.py
+"""
+
+import timeit
+from pathlib import Path
+
+from flask import Flask
+from flask_first import First
+
+PATH_TO_SPEC = Path(Path(__file__).parent, 'openapi.yaml')
+NUMBER = 2000
+ENGINES = ('marshmallow', 'compiled')
+
+JSON = {
+    'customer': {
+        'uuid': '7c5d8bd8-59b9-4c2f-8e5c-0d0bb6d8e3f5',
+        'name': 'Customer',
+        'email': 'customer@example.com',
+        'phone': None,
+    },
+    'comment': 'Call before delivery.',
+    'is_gift': False,
+    'lines': [
+        {'sku': f'SKU-{number}', 'quantity': number, 'price': 9.99, 'tags': ['new', 'sale']}
+        for number in range(1, 21)
+    ],
+}
+ARGS = {'page': '2', 'per_page': '50', 'status': 'paid', 'created_from': '2024-01-01'}
+
+
+def create_first(validation_engine: str) -> First:
+    app = Flask('benchmark')
+    app.config['FIRST_VALIDATION_ENGINE'] = validation_engine
+    first = First(PATH_TO_SPEC, app)
+
+    def orders_list() -> list:
+        return []
+
+    def create_order() -> tuple:
+        return {}, 201
+
+    first.add_view_func(orders_list)
+    first.add_view_func(create_order)
+    return first
+
+
+def measure(validation_engine: str) -> dict:
+    first = create_first(validation_engine)
+    create_order = first._operations[('create_order', 'POST')]
+    orders_list = first._operations[('orders_list', 'GET')]
+    client = first.app.test_client()
+
+    cases = {
+        'load JSON': lambda: create_order.load_request_json(JSON),
+        'load args': lambda: orders_list.args_loader.load(ARGS),
+        'POST request': lambda: client.post('/orders', json=JSON),
+        'GET request': lambda: client.get('/orders', query_string=ARGS),
+    }
+    results = {}
+    for name, case in cases.items():
+        case()
+        seconds = min(timeit.repeat(case, number=NUMBER, repeat=5))
+        results[name] = seconds / NUMBER * 1_000_000
+    return results
+
+
+def main() -> None:
+    results = {engine: measure(engine) for engine in ENGINES}
+
+    print(f'{"case":<16}{"marshmallow, us":>18}{"compiled, us":>18}{"speedup":>10}')
+    for name, marshmallow_time in results['marshmallow'].items():
+        compiled_time = results['compiled'][name]
+        print(
+            f'{name:<16}{marshmallow_time:>18.1f}{compiled_time:>18.1f}'
+            f'{marshmallow_time / compiled_time:>9.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
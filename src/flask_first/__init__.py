@@ -1,20 +1,41 @@
+import copy
+import functools
+import gc
+import importlib
+import inspect
+import pkgutil
 import re
+import threading
+import warnings
+from collections.abc import Callable
+from collections.abc import Iterable
 from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import Optional
 
-import marshmallow
 from flask import Flask
 from flask import Request
 from flask import request
 from flask import Response
 from marshmallow.exceptions import ValidationError
 from werkzeug.datastructures import MultiDict
+from werkzeug.wrappers import Request as WSGIRequest
 
+from .cli import first_cli
 from .first import RequestSerializer
 from .first import Specification
 from .first.exceptions import FirstException
 from .first.exceptions import FirstResponseJSONValidation
 from .first.exceptions import FirstValidation
-from .swagger_ui import add_swagger_ui_blueprint
+from .first.operations import Operation
+from .first.validation_cache import CachedError
+from .first.validation_cache import CacheInfo
+from .first.validation_cache import MAX_QUERY_STRING_LENGTH
+
+# Key of WSGI environ with endpoint and serialized data of request validated by
+# `FirstWSGIMiddleware`.
+SERIALIZED_REQUEST_ENVIRON_KEY = 'flask_first.serialized_request'
 
 
 class First:
@@ -24,7 +45,7 @@ class First:
 
     def __init__(
         self,
-        path_to_spec: str or Path,
+        path_to_spec: str or Path or ModuleType,
         app: Flask = None,
         swagger_ui_path: str or Path = None,
     ) -> None:
@@ -32,27 +53,28 @@ class First:
         self.path_to_spec = path_to_spec
         self.swagger_ui_path = swagger_ui_path
         self.spec = None
+        self.frozen = False
+
+        # Dispatch table of registered operations: (endpoint, METHOD) -> Operation.
+        self._operations = {}
+        self._reload_lock = threading.Lock()
+        self.watch_thread = None
+        self._stop_watching = threading.Event()
+        # Background warm-up of lazy schemas is started by the first request of the process.
+        self._warm_up_pending = False
+        self._warm_up_lock = threading.Lock()
 
         if self.app is not None:
             self.init_app(app)
 
-        self._mapped_routes_from_spec = []
-
     @staticmethod
     def route_to_openapi_format(route: str) -> str:
         return route.replace('<', '{').replace('>', '}').replace('int:', '').replace('float:', '')
 
     def _route_registration_in_flask(self, func: callable) -> None:
-        route = method = ''
-
-        for path, path_item in self.spec.resolved_spec['paths'].items():
-            for method_name, operation in path_item.items():
-                route_from_spec = operation.get('operationId')
-                if route_from_spec == func.__name__:
-                    route: str = path
-                    method: str = method_name
-
-        if not route:
+        try:
+            route, method = self.spec.operation_routes[func.__name__]
+        except KeyError:
             raise FirstException(
                 f'Route function <{func.__name__}> not found in OpenAPI specification!'
             )
@@ -71,22 +93,15 @@ class First:
         else:
             rule = route
 
-        self.app.add_url_rule(rule, func.__name__, func, methods=[method.upper()])
-
-        self._mapped_routes_from_spec.append(rule)
-
-    @staticmethod
-    def _extract_method_from_request(request_obj: Request) -> str:
-        return request_obj.method.lower()
-
-    @staticmethod
-    def _extract_route_from_request(request_obj: Request) -> str:
-        if request_obj.url_rule is not None:
-            route = request_obj.url_rule.rule
-        else:
-            route = request_obj.url_rule
+        self.app.add_url_rule(
+            rule, func.__name__, self._make_validating_view(func), methods=[method.upper()]
+        )
 
-        return route
+        operation = Operation(self.spec, route, method)
+        self._operations[(func.__name__, method.upper())] = operation
+        if self.frozen:
+            self._prepare_operation(operation)
+            gc.freeze()
 
     @staticmethod
     def _extract_json_from_request(request_obj: Request) -> dict or None:
@@ -97,144 +112,188 @@ class First:
 
         return json
 
-    @staticmethod
-    def _resolved_params(payload: MultiDict) -> dict:
-        # payload.to_dict(flat=False) serializing all arguments as list for correct receipt of
-        # arguments of same name:
-        # {'first_arg': ['1'], 'second_arg': ['10'], 'args_list': ['1', '2']}
-
-        serialized_payload = {}
-        for key, value in payload.to_dict(flat=False).items():
-            if len(value) == 1:
-                serialized_payload[key] = value[0]
-            else:
-                serialized_payload[key] = value
+    def _get_operation(self, request_obj: Request) -> Optional[Operation]:
+        return self._operations.get((request_obj.endpoint, request_obj.method))
 
-        return serialized_payload
+    def _validating_request(self, operation: Operation) -> None:
+        if request.content_type != 'application/json' and request.method not in ('GET',):
+            return
 
-    @staticmethod
-    def _arg_to_list(args: dict, schema_fields: dict) -> dict:
-        for arg in args:
-            arg_value = schema_fields.get(arg, ...)
+        if request.method in ('OPTIONS',):
+            return
 
-            if arg_value is ...:
-                continue
+        request.extensions = {
+            'first': self._serialize_request(
+                operation,
+                request,
+                view_args=request.view_args,
+                json=self._extract_json_from_request(request),
+            )
+        }
 
-            if isinstance(arg_value, marshmallow.fields.List) and not isinstance(args[arg], list):
-                args[arg] = [args[arg]]
+    @staticmethod
+    def _make_validation_cache_key(
+        environ: dict, headers: dict, cookies: dict, view_args: Optional[dict]
+    ) -> Optional[tuple]:
+        """Key of request in validation cache of its operation, `None` if it is not cached."""
+        query_string = environ.get('QUERY_STRING', '')
+        if len(query_string) > MAX_QUERY_STRING_LENGTH:
+            return None
+
+        return (
+            query_string,
+            tuple(headers.items()),
+            tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in cookies.items()
+            ),
+            tuple(view_args.items()) if view_args else (),
+        )
 
-        return args
+    def _serialize_request(
+        self,
+        operation: Operation,
+        request_obj: WSGIRequest,
+        view_args: Optional[dict],
+        json: Any,
+    ) -> dict:
+        """
+        Validate data of request and return serialized data for `request.extensions`. Only headers
+        and cookies declared in the operation are read from request. Results for requests without
+        JSON are taken from validation cache of the operation if it is enabled.
+        """
+        parameters = operation.parameters
+        headers = parameters.extract_headers(request_obj.environ)
+        # Cookies are not parsed for operations without declared cookies.
+        cookies = parameters.extract_cookies(request_obj.cookies) if parameters.cookie_names else {}
+
+        validation_cache = operation.validation_cache
+        cache_key = None
+        if validation_cache is not None and json is None:
+            cache_key = self._make_validation_cache_key(
+                request_obj.environ, headers, cookies, view_args
+            )
 
-    def _register_request_validation(self) -> None:
-        @self.app.before_request
-        def add_request_validating() -> None:
-            if request.content_type != 'application/json' and request.method not in ('GET',):
-                return
+        if cache_key is not None:
+            result = validation_cache.get(cache_key)
+            if isinstance(result, CachedError):
+                result.raise_error()
+            if result is not validation_cache.MISSING:
+                # Every request gets own copy, so changes in view functions do not affect cache.
+                return copy.deepcopy(result)
+
+        try:
+            serialized_request = self._validate_request_data(
+                operation, headers, cookies, view_args, request_obj.args, json
+            )
+        except FirstValidation as e:
+            if cache_key is not None:
+                validation_cache.set(cache_key, CachedError(e))
+            raise
 
-            if request.method in ('OPTIONS',):
-                return
+        if cache_key is not None:
+            validation_cache.set(cache_key, copy.deepcopy(serialized_request))
+        return serialized_request
 
-            route = self._extract_route_from_request(request)
-            if route not in self._mapped_routes_from_spec:
-                return
+    @staticmethod
+    def _validate_request_data(
+        operation: Operation,
+        headers: dict,
+        cookies: dict,
+        view_args: Optional[dict],
+        args: MultiDict,
+        json: Any,
+    ) -> dict:
+        request_serializer = RequestSerializer(
+            operation.spec,
+            operation.method,
+            operation.route,
+            headers=headers,
+            cookies=cookies,
+            path_params=view_args,
+            params=operation.parameters.query_parser.parse(args),
+            json=json,
+            operation=operation,
+        )
+        request_serializer.validate()
+
+        return {
+            'headers': request_serializer.serialized_headers,
+            'view_args': request_serializer.serialized_path_params,
+            'args': request_serializer.serialized_params,
+            'cookies': request_serializer.serialized_cookies,
+            'json': request_serializer.serialized_json,
+        }
+
+    def _make_validating_view(self, func: Callable) -> Callable:
+        """
+        Wrap view function into validating of request, so only requests to operations of the
+        specification are validated and other endpoints of application are not affected.
+        """
+        view = self.app.ensure_sync(func)
+
+        @functools.wraps(func)
+        def validating_view(**kwargs) -> Any:
+            if self._warm_up_pending:
+                self._start_warm_up()
+            # Operation is taken from the dispatch table on every request, so reloaded operation
+            # is used at once. HEAD and OPTIONS requests are not in the table.
+            operation = self._get_operation(request)
+            if operation is not None:
+                endpoint, serialized_request = request.environ.get(
+                    SERIALIZED_REQUEST_ENVIRON_KEY, (None, None)
+                )
+                if endpoint == request.endpoint:
+                    # Request is already validated by `FirstWSGIMiddleware`.
+                    request.extensions = {'first': serialized_request}
+                else:
+                    self._validating_request(operation)
+            return view(**kwargs)
 
-            route_as_in_spec = self.route_to_openapi_format(route)
+        return validating_view
 
-            method = self._extract_method_from_request(request)
-            params_schemas = self.spec.deserialized_spec['paths'][route_as_in_spec][method].get(
-                'parameters'
-            )
-            args = self._resolved_params(request.args)
-            if params_schemas:
-                args_schema = params_schemas.get('args')
-                if args_schema:
-                    schema_fields = args_schema().fields
-                    args = self._arg_to_list(args, schema_fields)
-
-            headers = request.headers
-            view_args = request.view_args
-            cookies = self._resolved_params(request.cookies)
-            json = self._extract_json_from_request(request)
-
-            request_serializer = RequestSerializer(
-                self.spec,
-                method,
-                route_as_in_spec,
-                headers=dict(headers),
-                cookies=cookies,
-                path_params=view_args,
-                params=args,
-                json=json,
-            )
-            request_serializer.validate()
-
-            request.extensions = {
-                'first': {
-                    'headers': request_serializer.serialized_headers,
-                    'view_args': request_serializer.serialized_path_params,
-                    'args': request_serializer.serialized_params,
-                    'cookies': request_serializer.serialized_cookies,
-                    'json': request_serializer.serialized_json,
-                }
-            }
+    def _start_warm_up(self) -> None:
+        with self._warm_up_lock:
+            if self._warm_up_pending:
+                self._warm_up_pending = False
+                self.spec.warm_up(background=True)
 
     def _register_response_validation(self) -> None:
         @self.app.after_request
         def add_response_validating(response: Response) -> Response:
-            route = self._extract_route_from_request(request)
-            if route not in self._mapped_routes_from_spec:
+            operation = self._get_operation(request)
+            if operation is None:
                 return response
 
-            route_as_in_spec = self.route_to_openapi_format(route)
+            route = operation.route
+            method = operation.method
 
-            try:
-                route_schema: dict = self.spec.deserialized_spec['paths'][route_as_in_spec]
-            except KeyError as e:
-                raise FirstResponseJSONValidation(
-                    f'Route <{e.args[0]}> not defined in specification.'
-                )
-
-            method = self._extract_method_from_request(request)
-            try:
-                method_schema: dict = route_schema[method]
-            except KeyError as e:
-                raise FirstResponseJSONValidation(
-                    f'Method <{e.args[0]}> not defined in <{route_as_in_spec}>'
-                )
-
-            http_code_schema: dict = method_schema['responses'].get(str(response.status_code))
-            if http_code_schema is None:
+            response_spec = operation.responses.get(str(response.status_code))
+            if response_spec is None:
                 try:
-                    http_code_schema: dict = method_schema['responses']['default']
+                    response_spec = operation.responses['default']
                 except KeyError as e:
                     raise FirstResponseJSONValidation(
                         f'HTTP code <{str(response.status_code)}> or <{e.args[0]}> '
-                        f'responses not defined in route <{route_as_in_spec}>'
+                        f'responses not defined in route <{route}>'
                     )
 
-            content: dict = http_code_schema['content']
+            content_types = response_spec.content_types
 
             response_content_type = response.content_type
 
-            if response_content_type not in content and '*/*' not in content:
+            if response_content_type not in content_types and '*/*' not in content_types:
                 raise FirstValidation(
-                    f'Content type <{response_content_type}> not in <{content.keys()}>'
+                    f'Content type <{response_content_type}> not in <{sorted(content_types)}>'
                 )
 
-            if response_content_type == 'application/json':
+            if (
+                response_content_type == 'application/json'
+                and response_spec.json_schema is not None
+            ):
                 json = response.get_json()
-                json_schema = content[response.content_type]['schema']
                 try:
-                    if isinstance(json, list):
-                        json_schema._load(json, None)
-                    elif 'allOf' in json_schema._declared_fields:
-                        json_schema().load({'allOf': json})
-                    elif 'anyOf' in json_schema._declared_fields:
-                        json_schema().load({'anyOf': json})
-                    elif 'oneOf' in json_schema._declared_fields:
-                        json_schema().load({'oneOf': json})
-                    else:
-                        json_schema().load(json)
+                    operation.load_json(response_spec.json_schema, json)
                 except ValidationError as e:
                     raise FirstResponseJSONValidation(
                         f'For <{method} {route}> and response body <{json}> raised error'
@@ -248,21 +307,202 @@ class First:
         self.app.config.setdefault('FIRST_RESPONSE_VALIDATION', False)
         self.app.config.setdefault('FIRST_EXPERIMENTAL_VALIDATOR', False)
         self.app.config.setdefault('FIRST_DATETIME_FORMAT', None)
+        self.app.config.setdefault('FIRST_SPEC_CACHE_DIR', None)
+        self.app.config.setdefault('FIRST_LAZY_COMPILE', False)
+        self.app.config.setdefault('FIRST_VALIDATION_ENGINE', 'marshmallow')
+        self.app.config.setdefault('FIRST_LOADER_WORKERS', None)
+        self.app.config.setdefault('FIRST_SPEC_VALIDATION', 'always')
+        self.app.config.setdefault('FIRST_SPEC_RELOAD_INTERVAL', None)
+        self.app.config.setdefault('FIRST_PRELOAD_FREEZE', False)
         self.app.extensions['first'] = self
+        self.app.cli.add_command(first_cli)
 
         self.spec = Specification(
             self.path_to_spec,
             experimental_validator=self.app.config['FIRST_EXPERIMENTAL_VALIDATOR'],
             datetime_format=self.app.config['FIRST_DATETIME_FORMAT'],
+            cache_dir=self.app.config['FIRST_SPEC_CACHE_DIR'],
+            lazy_compile=bool(self.app.config['FIRST_LAZY_COMPILE']),
+            validation_engine=self.app.config['FIRST_VALIDATION_ENGINE'],
+            loader_workers=self.app.config['FIRST_LOADER_WORKERS'],
+            spec_validation=self.app.config['FIRST_SPEC_VALIDATION'],
         )
+        # Thread is not started in the process making the application, so workers forked from it,
+        # for example by `gunicorn --preload`, do not inherit locks held by the thread.
+        self._warm_up_pending = self.app.config['FIRST_LAZY_COMPILE'] == 'background'
 
         if self.swagger_ui_path:
-            add_swagger_ui_blueprint(self.app, self.spec, self.swagger_ui_path)
+            from .swagger_ui import add_swagger_ui_blueprint
 
-        self._register_request_validation()
+            add_swagger_ui_blueprint(self.app, lambda: self.spec, self.swagger_ui_path)
 
         if self.app.config['FIRST_RESPONSE_VALIDATION']:
             self._register_response_validation()
 
+        if self.app.config['FIRST_SPEC_RELOAD_INTERVAL']:
+            self.watch_spec(self.app.config['FIRST_SPEC_RELOAD_INTERVAL'])
+
+        if self.app.config['FIRST_PRELOAD_FREEZE']:
+            self.freeze()
+
+    def _prepare_operation(self, operation: Operation) -> None:
+        operation.prepare()
+        if self.app.config['FIRST_RESPONSE_VALIDATION']:
+            for response in operation.responses.values():
+                if isinstance(response.json_schema, type):
+                    self.spec.get_schema_instance(response.json_schema)
+
+    def freeze(self) -> None:
+        """
+        Make all schemas and loaders of the specification and registered operations, so requests do
+        not change shared objects, and move all objects of the process out of reach of garbage
+        collector. Call it in master process before forking of workers, for example with
+        `gunicorn --preload`, so memory with the specification stays shared between workers.
+        Operations registered after it are made and frozen at once.
+        """
+        self.spec.warm_up()
+        self._warm_up_pending = False
+        for operation in self._operations.values():
+            self._prepare_operation(operation)
+
+        gc.collect()
+        gc.freeze()
+        self.frozen = True
+
+    def reload_spec(self) -> frozenset[tuple[str, str]]:
+        """
+        Load the specification again after changing of its files. Only changed files are read and
+        only changed operations are made again, the dispatch table is replaced at once, so requests
+        in progress are finished with the previous operations. Returns changed operations as
+        `(route, method)`.
+        """
+        with self._reload_lock:
+            spec, changed_operations = self.spec.reload()
+
+            operations = dict(self._operations)
+            for (endpoint, method), operation in self._operations.items():
+                if (operation.route, operation.method) not in changed_operations:
+                    continue
+
+                if spec.operation_routes.get(endpoint) != (operation.route, operation.method):
+                    raise FirstException(
+                        f'Operation <{endpoint}> is moved from <{method} {operation.route}> or'
+                        f' removed from specification, restart application for applying it.'
+                    )
+
+                new_operation = Operation(spec, operation.route, operation.method)
+                new_operation.prepare()
+                operations[(endpoint, method)] = new_operation
+
+            self.spec = spec
+            self._operations = operations
+
+        return changed_operations
+
+    def _watching_spec(self, interval: float) -> None:
+        failed_files_stats = None
+        while not self._stop_watching.wait(interval):
+            files_stats = self.spec.read_files_stats()
+            if files_stats == self.spec.files_stats or files_stats == failed_files_stats:
+                continue
+
+            try:
+                self.reload_spec()
+            except Exception as e:
+                # Files with error are not loaded again until they are changed.
+                failed_files_stats = files_stats
+                warnings.warn(f'Specification is not reloaded: {e!r}', stacklevel=2)
+            else:
+                failed_files_stats = None
+
+    def watch_spec(self, interval: float = 1.0) -> threading.Thread:
+        """Reload the specification in background thread, when its files are changed."""
+        self._stop_watching.clear()
+        self.watch_thread = threading.Thread(
+            target=self._watching_spec, args=(interval,), name='flask-first-watch', daemon=True
+        )
+        self.watch_thread.start()
+        return self.watch_thread
+
+    def stop_watching_spec(self) -> None:
+        self._stop_watching.set()
+        if self.watch_thread is not None:
+            self.watch_thread.join()
+            self.watch_thread = None
+
     def add_view_func(self, func) -> None:
         self._route_registration_in_flask(func)
+
+    def _find_view_funcs(self, module: ModuleType) -> Iterable[Callable]:
+        """Functions of module and its submodules, which are named as operations."""
+        modules = [module]
+        if hasattr(module, '__path__'):
+            for module_info in pkgutil.walk_packages(module.__path__, f'{module.__name__}.'):
+                modules.append(importlib.import_module(module_info.name))
+
+        for found_module in modules:
+            for obj in vars(found_module).values():
+                # Functions imported from other modules are registered with their own module.
+                if (
+                    inspect.isfunction(obj)
+                    and obj.__module__ == found_module.__name__
+                    and obj.__name__ in self.spec.operation_routes
+                ):
+                    yield obj
+
+    def add_view_funcs(self, views: ModuleType or Iterable[Callable]) -> list[str]:
+        """
+        Register several view functions at once. If module is passed, all its functions named as
+        operations of the specification are registered, modules of package are imported and
+        searched too. Returns `operationId` of operations without view functions.
+        """
+        view_funcs = self._find_view_funcs(views) if isinstance(views, ModuleType) else views
+
+        funcs_by_name = {}
+        for func in view_funcs:
+            if funcs_by_name.setdefault(func.__name__, func) is not func:
+                raise FirstException(
+                    f'Several route functions <{func.__name__}> in'
+                    f' <{funcs_by_name[func.__name__].__module__}> and <{func.__module__}>!'
+                )
+
+        for func in funcs_by_name.values():
+            self._route_registration_in_flask(func)
+
+        return self.unmapped_operations()
+
+    def add_lazy_view_funcs(self, handler_template: Optional[str] = None) -> list[str]:
+        """
+        Register all operations of the specification with view functions, which are imported on
+        the first request. Function is taken from extension `x-first-handler` of operation in format
+        `package.module:function` or from `handler_template` formatted with `operation_id`, for
+        example, `'views.{operation_id}:view'`. Operations with registered view functions are
+        skipped. Returns `operationId` of operations without view functions.
+        """
+        from .lazy_view import get_handler
+        from .lazy_view import LazyView
+
+        registered = {endpoint for endpoint, _ in self._operations}
+        for operation_id, (route, method) in self.spec.operation_routes.items():
+            if operation_id in registered:
+                continue
+
+            operation = self.spec.resolved_spec['paths'][route][method]
+            handler = get_handler(operation, operation_id, handler_template)
+            if handler is not None:
+                self._route_registration_in_flask(LazyView(operation_id, handler))
+
+        return self.unmapped_operations()
+
+    def validation_cache_info(self) -> dict[str, CacheInfo]:
+        """Hits, misses and sizes of validation caches of registered operations by endpoints."""
+        return {
+            endpoint: operation.validation_cache.cache_info()
+            for (endpoint, _), operation in self._operations.items()
+            if operation.validation_cache is not None
+        }
+
+    def unmapped_operations(self) -> list[str]:
+        """`operationId` of operations of the specification without registered view functions."""
+        registered = {endpoint for endpoint, _ in self._operations}
+        return sorted(set(self.spec.operation_routes) - registered)
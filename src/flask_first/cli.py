@@ -0,0 +1,78 @@
+"""Commands of Flask-First for Flask CLI."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from .first.artifact import write_artifact
+from .first.operations import Operation
+from .first.specification import Specification
+
+first_cli = AppGroup('first', help='Commands of Flask-First.')
+
+
+@first_cli.command('compile')
+@click.option(
+    '--spec',
+    'path_to_spec',
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help='Path to the specification. Default is the specification of application.',
+)
+@click.option(
+    '--output',
+    '-o',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Path to the artifact. Default is path to the specification with suffix `.py`.',
+)
+def compile_command(path_to_spec: Optional[Path], output: Optional[Path]) -> None:
+    """Compile the specification into Python module, which can be passed to `First` instead."""
+    if path_to_spec is None:
+        path_to_spec = current_app.extensions['first'].spec.path
+    if output is None:
+        output = path_to_spec.with_suffix('.py')
+
+    spec = Specification(
+        path_to_spec,
+        experimental_validator=current_app.config['FIRST_EXPERIMENTAL_VALIDATOR'],
+        datetime_format=current_app.config['FIRST_DATETIME_FORMAT'],
+        lazy_compile=True,
+        loader_workers=current_app.config['FIRST_LOADER_WORKERS'],
+    )
+    operations = [
+        Operation(spec, route, method)
+        for route, path_item in spec.resolved_spec['paths'].items()
+        for method in path_item
+        if method in spec.HTTP_METHODS
+    ]
+    write_artifact(spec, operations, output)
+
+    click.echo(f'Specification <{path_to_spec}> is compiled into <{output}>.')
+
+
+@first_cli.command('validate')
+@click.option(
+    '--spec',
+    'path_to_spec',
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help='Path to the specification. Default is the specification of application.',
+)
+def validate_command(path_to_spec: Optional[Path]) -> None:
+    """Validate the specification, so workers with `FIRST_SPEC_VALIDATION = 'once'` skip it."""
+    if path_to_spec is None:
+        path_to_spec = current_app.extensions['first'].spec.path
+
+    spec = Specification(
+        path_to_spec,
+        experimental_validator=current_app.config['FIRST_EXPERIMENTAL_VALIDATOR'],
+        datetime_format=current_app.config['FIRST_DATETIME_FORMAT'],
+        cache_dir=current_app.config['FIRST_SPEC_CACHE_DIR'],
+        lazy_compile=True,
+        loader_workers=current_app.config['FIRST_LOADER_WORKERS'],
+        spec_validation='off',
+    )
+    spec.validate()
+
+    click.echo(f'Specification <{path_to_spec}> is valid.')
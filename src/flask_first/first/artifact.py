@@ -0,0 +1,121 @@
+"""
+Specification compiled ahead of time into Python module by command `flask first compile`. Module
+contains parsed files of the specification, table of operations and validators, so workers start
+without reading of specification files and making of schemas.
+"""
+
+import importlib.util
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from pprint import pformat
+from types import ModuleType
+from typing import Optional
+
+from ..schema.schema_compiler import FACTORY_SOURCE_IMPORTS
+from ..schema.schema_compiler import make_function_factory_source
+from .exceptions import FirstException
+from .spec_cache import hash_file
+
+ARTIFACT_FORMAT_VERSION = 2
+
+
+def is_artifact(path_to_spec: ModuleType or str or Path) -> bool:
+    return isinstance(path_to_spec, ModuleType) or Path(path_to_spec).suffix == '.py'
+
+
+def load_artifact(path_to_spec: ModuleType or str or Path) -> ModuleType:
+    if isinstance(path_to_spec, ModuleType):
+        artifact = path_to_spec
+    else:
+        path = Path(path_to_spec)
+        module_spec = importlib.util.spec_from_file_location(f'_first_artifact_{path.stem}', path)
+        artifact = importlib.util.module_from_spec(module_spec)
+        try:
+            module_spec.loader.exec_module(artifact)
+        except OSError as e:
+            raise FirstException(f'Artifact <{path}> not loaded: {e!r}')
+
+    if getattr(artifact, 'ARTIFACT_FORMAT_VERSION', None) != ARTIFACT_FORMAT_VERSION:
+        raise FirstException(
+            f'Module <{artifact.__name__}> is not artifact of specification for this version of'
+            ' Flask-First. Make it again via command `flask first compile`.'
+        )
+
+    return artifact
+
+
+def get_source_path(artifact: ModuleType) -> Path:
+    """Path to the root file of specification from which artifact was compiled."""
+    artifact_file = getattr(artifact, '__file__', None)
+    if artifact_file is None:
+        return Path(artifact.SOURCE)
+    return Path(os.path.normpath(Path(Path(artifact_file).parent, artifact.SOURCE)))
+
+
+def is_stale(artifact: ModuleType, datetime_format: Optional[str]) -> bool:
+    """
+    Artifact is stale if specification files are changed after compiling. Artifact deployed without
+    specification files is not checked.
+    """
+    if artifact.DATETIME_FORMAT != datetime_format:
+        return True
+
+    source_path = get_source_path(artifact)
+    if not source_path.exists():
+        return False
+
+    try:
+        files_hashes = {
+            file: hash_file(Path(source_path.parent, file)) for file in artifact.SOURCE_FILES
+        }
+    except OSError:
+        return True
+
+    return files_hashes != artifact.SOURCE_FILES
+
+
+def _format(value: object) -> str:
+    return pformat(value, width=100, sort_dicts=False)
+
+
+def render_artifact(spec, operations: Iterable, path: Path) -> str:
+    """Make source of artifact for specification and its operations."""
+    source = os.path.relpath(spec.path.resolve(), Path(path).resolve().parent)
+
+    factories = []
+    validators = {}
+    for operation in operations:
+        for request_part, schema, unknown in operation.request_schemas():
+            name = f'_make_validator_{len(factories)}'
+            factory = make_function_factory_source(schema, name, unknown, spec.datetime_format)
+            if factory is not None:
+                factories.append(factory)
+                validators[(operation.route, operation.method, request_part)] = f'{name}()'
+
+    validators_table = ''.join(f'    {key!r}: {value},\n' for key, value in validators.items())
+    factories_source = '\n\n\n'.join(factories)
+    return (
+        f'"""Specification <{source}> compiled via `flask first compile`. Do not edit."""\n\n'
+        f'{FACTORY_SOURCE_IMPORTS}\n'
+        f'ARTIFACT_FORMAT_VERSION = {ARTIFACT_FORMAT_VERSION!r}\n'
+        f'SOURCE = {source!r}\n'
+        f'SOURCE_FILES = {_format(spec.files_hashes)}\n'
+        f'DATETIME_FORMAT = {spec.datetime_format!r}\n'
+        f'STORE = {_format(spec.reader.store)}\n'
+        f'OPERATIONS = {_format(spec.operation_routes)}\n\n\n'
+        f'{factories_source}\n\n\n'
+        f'VALIDATORS = {{\n{validators_table}}}\n'
+    )
+
+
+def write_artifact(spec, operations: Iterable, path: str or Path) -> None:
+    path = Path(path)
+    artifact_source = render_artifact(spec, operations, path)
+
+    # Workers can import the artifact while it is written, so file is replaced atomically.
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        f.write(artifact_source)
+    os.replace(tmp_path, path)
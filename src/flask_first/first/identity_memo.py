@@ -0,0 +1,29 @@
+from collections.abc import Hashable
+from typing import Any
+from typing import Optional
+
+
+class IdentityMemo:
+    """
+    Results of processing of nodes of the specification by identity of node, so shared node is
+    processed once. Node is stored with its result for keep its `id` unique while memo is used.
+    """
+
+    MISSING = object()
+
+    def __init__(self):
+        self._results = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, node: Any, kind: Optional[Hashable] = None) -> Any:
+        """Stored result for node or `IdentityMemo.MISSING`."""
+        _, result = self._results.get((kind, id(node)), (None, self.MISSING))
+        return result
+
+    def set(self, node: Any, result: Any, kind: Optional[Hashable] = None) -> None:
+        self._results[(kind, id(node))] = (node, result)
+
+    def clear(self) -> None:
+        self._results.clear()
@@ -1,3 +1,18 @@
+from pathlib import Path
+
 from .yaml_loader import load_from_yaml
+from .yaml_loader import RefResolver
+from .yaml_loader import YAMLReader
+
+
+def load_from_file(path: Path or str) -> dict:
+    reader = YAMLReader(Path(path)).load()
+    resolved_obj = RefResolver(reader).resolving()
+    return resolved_obj.resolved_spec
+
+
+# Every file is parsed by its extension, so specification in JSON is loaded as any other.
+load_from_json = load_from_file
+
 
-__all__ = ['load_from_yaml']
+__all__ = ['load_from_file', 'load_from_json', 'load_from_yaml']
@@ -1,42 +1,109 @@
+import json
 from collections.abc import Hashable
-from copy import deepcopy
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 from pathlib import Path
 from typing import Any
-
-import yaml
+from typing import Optional
 
 from ..exceptions import FirstResolverError
 from ..exceptions import FirstYAMLReaderError
+from ..identity_memo import IdentityMemo
+
+# Key of node in the store: (file, keys of node in the file).
+NodeKey = tuple[str, tuple]
+
+
+def get_safe_loader() -> type:
+    """PyYAML is imported on first reading of YAML file, not on import of the extension."""
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML is built without LibYAML.
+        from yaml import SafeLoader
+    return SafeLoader
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'SafeLoader':
+        return get_safe_loader()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def stat_file(path: Path) -> Optional[tuple[int, int]]:
+    """Time of modification and size of file, `None` if file not exists."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
 class YAMLReader:
     """
-    Open OpenAPI specification from yaml file. The specification from multiple files is supported.
+    Open OpenAPI specification from yaml or json file. The specification from multiple files is
+    supported, every file is parsed by its extension.
+
+    Files are read level by level: all files referenced from the already read files are read in
+    a pool of `max_workers` threads. Files are stored and errors are raised in the order of links
+    in the specification, so result does not depend on the order of reading.
     """
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, max_workers: Optional[int] = None):
         self.path = path
         self.root_file_name = self.path.name
+        self.max_workers = max_workers
         self.store = {}
+        self.stats = {}
+        self._previous = None
 
     @staticmethod
     def _yaml_to_dict(path: Path) -> dict:
+        import yaml
+
+        SafeLoader = get_safe_loader()
         with open(path) as f:
-            s = yaml.safe_load(f)
+            s = yaml.load(f, Loader=SafeLoader)
         return s
 
-    def add_file_to_store(self, file_path: str) -> None:
+    @staticmethod
+    def _json_to_dict(path: Path) -> dict:
+        with open(path, 'rb') as f:
+            s = json.load(f)
+        return s
+
+    def _file_to_dict(self, path: Path) -> dict:
+        """Parser is chosen for every file by its extension, so JSON and YAML files can be mixed."""
+        if path.suffix.lower() == '.json':
+            return self._json_to_dict(path)
+        return self._yaml_to_dict(path)
+
+    def _read_file(self, file_path: str) -> tuple[Optional[tuple[int, int]], Any]:
+        """Read file with its stat. File not changed since previous loading is not read again."""
         path_to_spec_file = Path(self.path.parent, file_path)
+        stat = stat_file(path_to_spec_file)
 
+        previous = self._previous
+        if stat is not None and previous is not None and previous.stats.get(file_path) == stat:
+            return stat, previous.store[file_path]
+
+        return stat, self._file_to_dict(path_to_spec_file)
+
+    def _read_referenced_file(self, file_path: str) -> tuple[Optional[tuple[int, int]], Any]:
         try:
-            self.store[file_path] = self._yaml_to_dict(path_to_spec_file)
+            return self._read_file(file_path)
         except FileNotFoundError:
             raise FirstYAMLReaderError(f'No such file or directory: <{file_path}>')
 
+    def add_file_to_store(self, file_path: str) -> None:
+        self.stats[file_path], self.store[file_path] = self._read_referenced_file(file_path)
         return self.store[file_path]
 
-    def search_file(self, obj: dict or list) -> None:
+    def search_file(self, obj: dict or list, file_paths: Optional[dict] = None) -> dict:
+        """Find paths of files referenced from `obj` and not read yet, in order of links."""
+        if file_paths is None:
+            file_paths = {}
+
         if isinstance(obj, dict):
             ref = obj.get('$ref')
             if ref:
@@ -46,31 +113,159 @@ class YAMLReader:
                     raise FirstYAMLReaderError(f'"$ref" with value <{ref}> is not valid.')
 
                 if file_path and file_path not in self.store:
-                    self.search_file(self.add_file_to_store(file_path))
+                    file_paths[file_path] = None
             else:
                 for _, v in obj.items():
-                    self.search_file(v)
+                    self.search_file(v, file_paths)
 
         elif isinstance(obj, list):
             for item in obj:
-                self.search_file(item)
+                self.search_file(item, file_paths)
 
-        else:
-            return
+        return file_paths
+
+    def _read_files(self, file_paths: list[str]) -> list[tuple[Optional[tuple[int, int]], Any]]:
+        if len(file_paths) < 2 or self.max_workers == 1:
+            return [self._read_referenced_file(file_path) for file_path in file_paths]
 
-    def load(self) -> 'YAMLReader':
-        root_file = self._yaml_to_dict(self.path)
-        self.store[self.root_file_name] = root_file
-        self.search_file(root_file)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Results are iterated in order of files, so the first failed file raises its error.
+            return list(executor.map(self._read_referenced_file, file_paths))
+
+    def restore(self, store: dict[str, Any]) -> 'YAMLReader':
+        """Take parsed files of the specification from `store` without reading them."""
+        self.store = store
         return self
 
+    def load(self, previous: Optional['YAMLReader'] = None) -> 'YAMLReader':
+        """
+        Read the specification. Files not changed since loading of `previous` reader are taken from
+        its store without reading.
+        """
+        self._previous = previous
+        try:
+            self.stats[self.root_file_name], root_file = self._read_file(self.root_file_name)
+            self.store[self.root_file_name] = root_file
+
+            files = [root_file]
+            while files:
+                file_paths = {}
+                for file in files:
+                    self.search_file(file, file_paths)
+
+                stats_and_files = self._read_files(list(file_paths))
+                files = [file for _, file in stats_and_files]
+                for file_path, (stat, file) in zip(file_paths, stats_and_files):
+                    self.stats[file_path] = stat
+                    self.store[file_path] = file
+        finally:
+            self._previous = None
+
+        return self
+
+    def get_node(self, node_key: NodeKey) -> Any:
+        """Node of the store, `...` if it not exists."""
+        file_path, keys = node_key
+        node = self.store.get(file_path, ...)
+        for key in keys:
+            if not isinstance(node, (dict, list)):
+                return ...
+            try:
+                node = node[key]
+            except (KeyError, IndexError, TypeError):
+                return ...
+        return node
+
+    @staticmethod
+    def _parse_ref(file_path: str, ref: Any) -> Optional[NodeKey]:
+        try:
+            file_path_from_ref, node_path = ref.split('#/')
+        except (AttributeError, ValueError):
+            return None
+        return file_path_from_ref or file_path, tuple(node_path.split('/'))
+
+    def _collect_dependencies(self, file_path: str, obj: Any, dependencies: set) -> None:
+        if isinstance(obj, dict):
+            if '$ref' in obj:
+                node_key = self._parse_ref(file_path, obj['$ref'])
+                if node_key is not None and node_key not in dependencies:
+                    dependencies.add(node_key)
+                    self._collect_dependencies(node_key[0], self.get_node(node_key), dependencies)
+                return
+            for value in obj.values():
+                self._collect_dependencies(file_path, value, dependencies)
+
+        elif isinstance(obj, list):
+            for item in obj:
+                self._collect_dependencies(file_path, item, dependencies)
+
+    def operation_dependencies(self, route: str, method: str) -> set[NodeKey]:
+        """
+        Nodes of the store which the operation is made of: node of the operation, common
+        parameters of its path and all nodes from `$ref` reached from them.
+        """
+        file_path = self.root_file_name
+        node_key = (file_path, ('paths', route))
+        node = self.get_node(node_key)
+
+        dependencies = set()
+        # Path item can be link to another file.
+        while isinstance(node, dict) and '$ref' in node and node_key not in dependencies:
+            dependencies.add(node_key)
+            node_key = self._parse_ref(file_path, node['$ref'])
+            if node_key is None:
+                break
+            file_path = node_key[0]
+            node = self.get_node(node_key)
+
+        if node_key is not None:
+            for key in (method, 'parameters'):
+                dependencies.add((file_path, (*node_key[1], key)))
+                if isinstance(node, dict):
+                    self._collect_dependencies(file_path, node.get(key), dependencies)
+
+        return dependencies
+
+    def changed_operations(
+        self, previous: 'YAMLReader', operations: Iterable[tuple[str, str]]
+    ) -> frozenset[tuple[str, str]]:
+        """Operations `(route, method)` which differ from the same operations of `previous`."""
+        changed_files = {
+            file_path
+            for file_path in self.store.keys() | previous.store.keys()
+            if self.store.get(file_path, ...) is not previous.store.get(file_path, ...)
+        }
+
+        def is_changed(route: str, method: str) -> bool:
+            dependencies = self.operation_dependencies(route, method)
+            if dependencies != previous.operation_dependencies(route, method):
+                return True
+            return any(
+                self.get_node(node_key) != previous.get_node(node_key)
+                for node_key in dependencies
+                if node_key[0] in changed_files
+            )
+
+        return frozenset(operation for operation in operations if is_changed(*operation))
+
 
 class RefResolver:
-    """Resolve links to various parts of the specification."""
+    """
+    Resolve links to various parts of the specification.
+
+    Every `(file, node path)` link is resolved once and the resolved node is shared between all
+    places of usage. Files from the store are not changed, nodes without links are reused as is.
+    """
 
     def __init__(self, yaml_reader: YAMLReader):
         self.yaml_reader = yaml_reader
         self.resolved_spec = None
+        self._resolved_refs = {}
+        self._resolving_refs = set()
+        self._resolved_nodes = IdentityMemo()
+        # id of resolved schema -> (schema, indexes of its branches for values of discriminator).
+        # Branches are kept beside the specification, so the specification is not changed.
+        self.discriminator_branches = {}
 
     def _get_schema_via_local_ref(self, file_path: str, node_path: str) -> dict:
         keys = node_path.split('/')
@@ -79,9 +274,7 @@ class RefResolver:
             return source_dict[key]
 
         try:
-            return deepcopy(
-                reduce(get_value_of_key_from_dict, keys, self.yaml_reader.store[file_path])
-            )
+            return reduce(get_value_of_key_from_dict, keys, self.yaml_reader.store[file_path])
         except KeyError:
             raise FirstResolverError(f'No such path: "{node_path}"')
 
@@ -97,43 +290,102 @@ class RefResolver:
 
         return obj
 
+    def _discriminator_branches(self, file_path: str, obj: dict) -> Optional[dict[str, int]]:
+        """
+        Indexes of branches of `oneOf` or `anyOf` for values of discriminator property. Branches are
+        known only by their `$ref`, so they are found before resolving.
+        """
+        discriminator = obj.get('discriminator')
+        # The same keyword as for making of schema is used.
+        branches = obj.get('anyOf') or obj.get('oneOf')
+        if not isinstance(discriminator, dict) or not isinstance(branches, list):
+            return None
+
+        indexes = {}
+        for index, branch in enumerate(branches):
+            if isinstance(branch, dict) and isinstance(branch.get('$ref'), str):
+                file_path_from_ref, _, node_path = branch['$ref'].partition('#/')
+                indexes[(file_path_from_ref or file_path, node_path)] = index
+
+        branches_by_value = {}
+        for value, ref in (discriminator.get('mapping') or {}).items():
+            if '#/' in ref:
+                file_path_from_ref, _, node_path = ref.partition('#/')
+                ref_key = (file_path_from_ref or file_path, node_path)
+            else:
+                # Name of schema from components of the root file.
+                ref_key = (self.yaml_reader.root_file_name, f'components/schemas/{ref}')
+            if ref_key in indexes:
+                branches_by_value[value] = indexes[ref_key]
+
+        # Name of schema is also value of discriminator property for its branch.
+        for (_, node_path), index in indexes.items():
+            branches_by_value.setdefault(node_path.rsplit('/', 1)[-1], index)
+        return branches_by_value
+
+    def _resolving_ref(self, file_path: str, ref: Any) -> Any:
+        try:
+            file_path_from_ref, node_path = ref.split('#/')
+        except (AttributeError, ValueError):
+            raise FirstResolverError(
+                f'"$ref" with value <{ref}> is not valid in file <{file_path}>'
+            )
+
+        ref_key = (file_path_from_ref or file_path, node_path)
+        resolved_obj = self._resolved_refs.get(ref_key, ...)
+        if resolved_obj is not ...:
+            return resolved_obj
+
+        if ref_key in self._resolving_refs:
+            raise FirstResolverError(f'"$ref" with value <{ref}> is circular in file <{file_path}>')
+
+        self._resolving_refs.add(ref_key)
+        resolved_obj = self._resolving_all_refs(
+            ref_key[0], self._get_schema(file_path, file_path_from_ref, node_path)
+        )
+        self._resolving_refs.discard(ref_key)
+
+        self._resolved_refs[ref_key] = resolved_obj
+        return resolved_obj
+
     def _resolving_all_refs(self, file_path: str, obj: Any) -> Any:
+        if not isinstance(obj, (dict, list)):
+            return obj
+
+        if isinstance(obj, dict) and '$ref' in obj:
+            return self._resolving_ref(file_path, obj['$ref'])
+
+        resolved_obj = self._resolved_nodes.get(obj)
+        if resolved_obj is not IdentityMemo.MISSING:
+            return resolved_obj
+
         if isinstance(obj, dict):
-            ref = obj.get('$ref', ...)
-            if ref is not ...:
-                try:
-                    file_path_from_ref, node_path = ref.split('#/')
-                except (AttributeError, ValueError):
-                    raise FirstResolverError(
-                        f'"$ref" with value <{ref}> is not valid in file <{file_path}>'
-                    )
-
-                if file_path_from_ref:
-                    obj = self._resolving_all_refs(
-                        file_path_from_ref,
-                        self._get_schema(file_path, file_path_from_ref, node_path),
-                    )
-                else:
-                    obj = self._resolving_all_refs(
-                        file_path, self._get_schema(file_path, file_path_from_ref, node_path)
-                    )
+            resolved_obj = {key: self._resolving_all_refs(file_path, v) for key, v in obj.items()}
+            is_changed = any(resolved_obj[key] is not v for key, v in obj.items())
+        else:
+            resolved_obj = [self._resolving_all_refs(file_path, item) for item in obj]
+            is_changed = any(new is not old for new, old in zip(resolved_obj, obj))
 
-            else:
-                for key, value in obj.items():
-                    obj[key] = self._resolving_all_refs(file_path, value)
+        if not is_changed:
+            resolved_obj = obj
 
-        if isinstance(obj, list):
-            objs = []
-            for item_obj in obj:
-                objs.append(self._resolving_all_refs(file_path, item_obj))
-            obj = objs
+        if isinstance(obj, dict):
+            discriminator_branches = self._discriminator_branches(file_path, obj)
+            if discriminator_branches:
+                self.discriminator_branches[id(resolved_obj)] = (
+                    resolved_obj,
+                    discriminator_branches,
+                )
 
-        return obj
+        self._resolved_nodes.set(obj, resolved_obj)
+        return resolved_obj
 
     def resolving(self) -> 'RefResolver':
         root_file_path = self.yaml_reader.root_file_name
         root_spec = self.yaml_reader.store[root_file_path]
         self.resolved_spec = self._resolving_all_refs(root_file_path, root_spec)
+        # Nodes of files are not needed after resolving, they are not kept by memo.
+        self._resolved_nodes.clear()
         return self
 
 
@@ -0,0 +1,404 @@
+import sys
+from collections.abc import Iterator
+from collections.abc import Mapping
+from functools import partial
+from typing import Any
+from typing import Optional
+
+from marshmallow import EXCLUDE
+from marshmallow import fields
+from marshmallow import RAISE
+from marshmallow import Schema
+from werkzeug.datastructures import MultiDict
+
+from ..schema.schema_compiler import CompiledLoader
+from ..schema.schema_maker import MULTI_SCHEMA_FIELDS
+from .query_parser import QueryParser
+from .specification import Specification
+from .validation_cache import make_validation_cache
+from .validation_cache import ValidationCache
+
+DEFAULT_CONTENT_TYPE = 'application/json'
+# Headers of request without prefix `HTTP_` in WSGI environ.
+ENVIRON_HEADERS = frozenset({'CONTENT_TYPE', 'CONTENT_LENGTH'})
+
+
+def get_environ_key(header_name: str) -> str:
+    """Key of header in WSGI environ, so names of headers are case-insensitive."""
+    key = header_name.upper().replace('-', '_')
+    return key if key in ENVIRON_HEADERS else f'HTTP_{key}'
+
+
+def load_json(spec: Specification, json_schema: type or fields.Field, json: Any) -> Any:
+    """Load JSON of request or response via schema from the specification."""
+    if not isinstance(json_schema, type):
+        return json_schema.deserialize(json)
+
+    schema = spec.get_schema_instance(json_schema)
+    for multiple_field in MULTI_SCHEMA_FIELDS:
+        if multiple_field in schema.declared_fields:
+            # Data is loaded via field of the keyword, so it is returned in the key of the keyword.
+            return schema.load({multiple_field: json})
+    return schema.load(json)
+
+
+class ParameterSet:
+    """Loaders of parameters of operation, `None` for parameters not described in operation."""
+
+    __slots__ = (
+        'headers',
+        'cookies',
+        'view_args',
+        'args',
+        'query_parser',
+        'header_names',
+        'cookie_names',
+        'defined',
+    )
+
+    def __init__(
+        self,
+        headers: Optional[Schema or CompiledLoader] = None,
+        cookies: Optional[Schema or CompiledLoader] = None,
+        view_args: Optional[Schema or CompiledLoader] = None,
+        args: Optional[Schema or CompiledLoader] = None,
+        query_parser: Optional[QueryParser] = None,
+        header_names: tuple[tuple[str, str], ...] = (),
+        cookie_names: tuple[str, ...] = (),
+        defined: bool = False,
+    ):
+        self.headers = headers
+        self.cookies = cookies
+        self.view_args = view_args
+        self.args = args
+        # Parser of arguments of request for loader of `args`.
+        self.query_parser = query_parser or QueryParser([])
+        # Declared headers as (name, key in WSGI environ) and declared cookies.
+        self.header_names = header_names
+        self.cookie_names = cookie_names
+        self.defined = defined
+
+    def __bool__(self) -> bool:
+        return self.defined
+
+    def extract_headers(self, environ: Mapping) -> dict:
+        """Declared headers of request, other headers are not read."""
+        return {name: environ[key] for name, key in self.header_names if key in environ}
+
+    def select_headers(self, headers: Mapping) -> dict:
+        """Declared headers from mapping of headers, names of headers are case-insensitive."""
+        values = {name.lower(): value for name, value in headers.items()}
+        return {
+            name: values[name.lower()] for name, _ in self.header_names if name.lower() in values
+        }
+
+    def select_cookies(self, cookies: Mapping) -> dict:
+        """Declared cookies from mapping of cookies."""
+        return {name: cookies[name] for name in self.cookie_names if name in cookies}
+
+    def extract_cookies(self, cookies: MultiDict) -> dict:
+        """Declared cookies of request, repeated cookies are kept as list."""
+        extracted = {}
+        for name in self.cookie_names:
+            values = cookies.getlist(name)
+            if values:
+                extracted[name] = values[0] if len(values) == 1 else values
+        return extracted
+
+
+class RequestBodySpec:
+    """
+    JSON of request described in operation. Schema of JSON is taken from the deserialized
+    specification only if compiled loader is not made or it does not accept data.
+    """
+
+    __slots__ = ('operation', 'json_loader', '_json_schema')
+
+    def __init__(self, operation: 'Operation', json_loader: Optional[CompiledLoader] = None):
+        self.operation = operation
+        self.json_loader = json_loader
+
+    @property
+    def json_schema(self) -> type or fields.Field:
+        try:
+            return self._json_schema
+        except AttributeError:
+            pass
+
+        content = self.operation.schema['requestBody']['content']
+        self._json_schema = content[DEFAULT_CONTENT_TYPE]['schema']
+        return self._json_schema
+
+    def load_via_schema(self, json: Any) -> Any:
+        return load_json(self.operation.spec, self.json_schema, json)
+
+    def load(self, json: Any) -> Any:
+        if self.json_loader is not None:
+            return self.json_loader.load(json)
+        return self.load_via_schema(json)
+
+
+class ResponseSpec:
+    """Content types of response and schema of its JSON, `None` if JSON is not described."""
+
+    __slots__ = ('content_types', 'json_schema')
+
+    def __init__(self, content_types: frozenset, json_schema: Optional[type or fields.Field]):
+        self.content_types = content_types
+        self.json_schema = json_schema
+
+    @classmethod
+    def from_schema(cls, response_schema: Mapping) -> 'ResponseSpec':
+        content = response_schema.get('content') or {}
+        json_content = content.get(DEFAULT_CONTENT_TYPE)
+        return cls(
+            frozenset(sys.intern(content_type) for content_type in content),
+            None if json_content is None else json_content.get('schema'),
+        )
+
+
+class Operation:
+    """
+    Operation from the specification prepared for validating of requests. Only data needed for
+    validating is kept, it is taken from the deserialized specification on first usage. The nested
+    dicts of the specification stay available via `schema` and `resolved_schema`.
+    """
+
+    DEFAULT_CONTENT_TYPE = DEFAULT_CONTENT_TYPE
+    PARAMETERS_UNKNOWN = {'headers': EXCLUDE, 'cookies': EXCLUDE, 'view_args': RAISE, 'args': RAISE}
+    # Type of parameters -> key of its schema in parameters of the converted specification.
+    PARAMETERS_KEYS = {
+        'headers': 'header_args',
+        'cookies': 'cookies',
+        'view_args': 'view_args',
+        'args': 'args',
+    }
+    PREPARED_PROPERTIES = (
+        'parameters',
+        'request_body',
+        'json_schema',
+        'responses',
+        'validation_cache',
+    )
+    # Methods of operations with results of validating stored in cache.
+    CACHED_METHODS = frozenset({'get'})
+
+    __slots__ = (
+        'spec',
+        'route',
+        'method',
+        '_parameters',
+        '_request_body',
+        '_responses',
+        '_validation_cache',
+    )
+
+    def __init__(self, spec: Specification, route: str, method: str):
+        self.spec = spec
+        self.route = sys.intern(route)
+        self.method = sys.intern(method.lower())
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.method.upper()} {self.route}>'
+
+    @property
+    def schema(self) -> Mapping:
+        return self.spec.deserialized_spec['paths'][self.route][self.method]
+
+    @property
+    def resolved_schema(self) -> dict:
+        return self.spec.resolved_spec['paths'][self.route][self.method]
+
+    @property
+    def resolved_parameters(self) -> dict:
+        return self.resolved_schema.get('parameters') or {}
+
+    def _get_schema_instance(self, schema_class: Optional[type], **kwargs) -> Optional[Schema]:
+        if schema_class is None:
+            return None
+        return self.spec.get_schema_instance(schema_class, **kwargs)
+
+    def _get_parameters_schema(self, parameters_type: str) -> type:
+        return self.schema['parameters'][self.PARAMETERS_KEYS[parameters_type]]
+
+    def _load_parameters(self, parameters_type: str, data: dict) -> dict:
+        schema = self._get_schema_instance(
+            self._get_parameters_schema(parameters_type),
+            unknown=self.PARAMETERS_UNKNOWN[parameters_type],
+        )
+        return schema.load(data)
+
+    def _get_loader(
+        self, parameters_type: str, resolved_parameters: dict
+    ) -> Optional[Schema or CompiledLoader]:
+        parameters_key = self.PARAMETERS_KEYS[parameters_type]
+        if parameters_key not in resolved_parameters:
+            return None
+
+        unknown = self.PARAMETERS_UNKNOWN[parameters_type]
+        if self.spec.validation_engine == 'compiled':
+            function = self.spec.compile_schema(
+                resolved_parameters[parameters_key],
+                unknown,
+                key=(self.route, self.method, parameters_type),
+            )
+            if function is not None:
+                # Marshmallow schema is made only for data not accepted by compiled function.
+                return CompiledLoader(function, partial(self._load_parameters, parameters_type))
+
+        return self._get_schema_instance(
+            self._get_parameters_schema(parameters_type), unknown=unknown
+        )
+
+    def _get_raw_parameters(self) -> list[dict]:
+        path_item = self.spec.raw_spec['paths'][self.route]
+        return [*path_item.get('parameters', ()), *path_item[self.method].get('parameters', ())]
+
+    @staticmethod
+    def _get_declared_names(raw_parameters: list[dict], location: str) -> tuple[str, ...]:
+        return tuple(
+            dict.fromkeys(
+                sys.intern(parameter['name'])
+                for parameter in raw_parameters
+                if parameter.get('in') == location
+            )
+        )
+
+    @property
+    def parameters(self) -> ParameterSet:
+        try:
+            return self._parameters
+        except AttributeError:
+            pass
+
+        resolved_parameters = self.resolved_parameters
+        loaders = {
+            parameters_type: self._get_loader(parameters_type, resolved_parameters)
+            for parameters_type in self.PARAMETERS_UNKNOWN
+        }
+        raw_parameters = self._get_raw_parameters()
+        self._parameters = ParameterSet(
+            **loaders,
+            query_parser=QueryParser.from_parameters(raw_parameters),
+            header_names=tuple(
+                (name, sys.intern(get_environ_key(name)))
+                for name in self._get_declared_names(raw_parameters, 'header')
+            ),
+            cookie_names=self._get_declared_names(raw_parameters, 'cookie'),
+            defined=bool(resolved_parameters),
+        )
+        return self._parameters
+
+    @property
+    def headers_loader(self) -> Optional[Schema or CompiledLoader]:
+        return self.parameters.headers
+
+    @property
+    def cookies_loader(self) -> Optional[Schema or CompiledLoader]:
+        return self.parameters.cookies
+
+    @property
+    def view_args_loader(self) -> Optional[Schema or CompiledLoader]:
+        return self.parameters.view_args
+
+    @property
+    def args_loader(self) -> Optional[Schema or CompiledLoader]:
+        return self.parameters.args
+
+    def _get_resolved_json_schema(self) -> Optional[dict]:
+        """Resolved schema of JSON of request, `None` if request body has no JSON content."""
+        request_body = self.resolved_schema.get('requestBody')
+        if request_body is None:
+            return None
+        json_content = (request_body.get('content') or {}).get(self.DEFAULT_CONTENT_TYPE)
+        return None if json_content is None else json_content.get('schema')
+
+    @property
+    def request_body(self) -> Optional[RequestBodySpec]:
+        """JSON of request, `None` if request body of operation has no JSON content."""
+        try:
+            return self._request_body
+        except AttributeError:
+            pass
+
+        request_body = None
+        resolved_json_schema = self._get_resolved_json_schema()
+        if resolved_json_schema is not None:
+            request_body = RequestBodySpec(self)
+            if self.spec.validation_engine == 'compiled':
+                function = self.spec.compile_schema(
+                    resolved_json_schema, key=(self.route, self.method, 'json')
+                )
+                if function is not None:
+                    request_body.json_loader = CompiledLoader(
+                        function, request_body.load_via_schema
+                    )
+
+        self._request_body = request_body
+        return request_body
+
+    @property
+    def json_schema(self) -> Optional[type]:
+        request_body = self.request_body
+        return None if request_body is None else request_body.json_schema
+
+    @property
+    def json_loader(self) -> Optional[CompiledLoader]:
+        """Compiled loader of JSON of request, `None` if JSON is loaded via marshmallow schema."""
+        request_body = self.request_body
+        return None if request_body is None else request_body.json_loader
+
+    def request_schemas(self) -> Iterator[tuple[str, dict, str]]:
+        """Resolved schemas of parameters and JSON of request with `unknown` for loading them."""
+        resolved_schema = self.resolved_schema
+        resolved_parameters = resolved_schema.get('parameters') or {}
+        for parameters_type, unknown in self.PARAMETERS_UNKNOWN.items():
+            parameters_key = self.PARAMETERS_KEYS[parameters_type]
+            if parameters_key in resolved_parameters:
+                yield parameters_type, resolved_parameters[parameters_key], unknown
+
+        resolved_json_schema = self._get_resolved_json_schema()
+        if resolved_json_schema is not None:
+            yield 'json', resolved_json_schema, RAISE
+
+    @property
+    def responses(self) -> dict[str, ResponseSpec]:
+        try:
+            return self._responses
+        except AttributeError:
+            pass
+
+        self._responses = {
+            sys.intern(str(code)): ResponseSpec.from_schema(response_schema)
+            for code, response_schema in self.schema['responses'].items()
+        }
+        return self._responses
+
+    @property
+    def validation_cache(self) -> Optional[ValidationCache]:
+        """Cache of results of validating of requests, `None` if it is not enabled."""
+        try:
+            return self._validation_cache
+        except AttributeError:
+            pass
+
+        validation_cache = None
+        if self.method in self.CACHED_METHODS:
+            raw_operation = self.spec.raw_spec['paths'][self.route][self.method]
+            validation_cache = make_validation_cache(
+                raw_operation, raw_operation.get('operationId', f'{self.method} {self.route}')
+            )
+        self._validation_cache = validation_cache
+        return validation_cache
+
+    def load_json(self, json_schema: type or fields.Field, json: Any) -> Any:
+        """Load JSON of request or response via schema from the specification."""
+        return load_json(self.spec, json_schema, json)
+
+    def load_request_json(self, json: Any) -> Any:
+        return self.request_body.load(json)
+
+    def prepare(self) -> None:
+        """Make schemas and loaders of the operation before the first request."""
+        for name in self.PREPARED_PROPERTIES:
+            getattr(self, name)
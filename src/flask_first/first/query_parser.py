@@ -0,0 +1,109 @@
+from typing import Any
+from typing import Optional
+
+from werkzeug.datastructures import MultiDict
+
+DELIMITERS = {'form': ',', 'spaceDelimited': ' ', 'pipeDelimited': '|'}
+
+
+def _single_or_list(values: list) -> Any:
+    """Repeated arguments are kept as list, so loading of them via schema fails."""
+    return values[0] if len(values) == 1 else values
+
+
+class QueryParameter:
+    """Query parameter of operation with its kind of schema, `style` and `explode`."""
+
+    __slots__ = ('name', 'kind', 'style', 'explode', 'delimiter')
+
+    def __init__(self, name: str, kind: str, style: str = 'form', explode: Optional[bool] = None):
+        self.name = name
+        self.kind = kind
+        self.style = style
+        self.explode = style == 'form' if explode is None else explode
+        self.delimiter = DELIMITERS.get(style, ',')
+
+    @classmethod
+    def from_parameter(cls, parameter: dict) -> 'QueryParameter':
+        schema = parameter.get('schema') or {}
+        kind = schema.get('type')
+        if kind not in ('array', 'object'):
+            kind = 'scalar'
+        return cls(
+            parameter['name'], kind, parameter.get('style', 'form'), parameter.get('explode')
+        )
+
+    def _split(self, values: list) -> list:
+        items = []
+        for value in values:
+            if value:
+                items.extend(value.split(self.delimiter))
+        return items
+
+    def parse(self, values: list) -> Any:
+        if self.kind == 'array':
+            return values if self.explode else self._split(values)
+
+        if self.kind == 'object' and not self.explode and self.style == 'form':
+            items = self._split(values)
+            return dict(zip(items[::2], items[1::2]))
+
+        return _single_or_list(values)
+
+
+class QueryParser:
+    """
+    Parser of arguments of request made once for operation. Arrays and objects are read from
+    `MultiDict` of arguments according to `style` and `explode` of parameters, undeclared arguments
+    are kept for failing of loading via schema.
+    """
+
+    __slots__ = ('parameters', 'exploded_properties', 'deep_objects')
+
+    def __init__(self, parameters: list[QueryParameter], properties: Optional[dict] = None):
+        self.parameters = {parameter.name: parameter for parameter in parameters}
+        # Name of property of exploded object in `form` style -> name of parameter.
+        self.exploded_properties = {}
+        self.deep_objects = set()
+        for parameter in parameters:
+            if parameter.kind != 'object':
+                continue
+            if parameter.style == 'deepObject':
+                self.deep_objects.add(parameter.name)
+            elif parameter.style == 'form' and parameter.explode:
+                for property_name in (properties or {}).get(parameter.name, ()):
+                    if property_name not in self.parameters:
+                        self.exploded_properties[property_name] = parameter.name
+
+    @classmethod
+    def from_parameters(cls, parameters: list[dict]) -> 'QueryParser':
+        """Parser of query parameters from list of parameters of path and operation."""
+        query_parameters = {}
+        properties = {}
+        for parameter in parameters:
+            if parameter.get('in') != 'query':
+                continue
+            query_parameters[parameter['name']] = QueryParameter.from_parameter(parameter)
+            properties[parameter['name']] = (parameter.get('schema') or {}).get('properties') or {}
+        return cls(list(query_parameters.values()), properties)
+
+    def parse(self, args: MultiDict) -> dict:
+        result = {}
+        for name, values in args.lists():
+            parameter = self.parameters.get(name)
+            if parameter is not None:
+                result[name] = parameter.parse(values)
+                continue
+
+            owner, property_name = self.exploded_properties.get(name), name
+            if owner is None and name.endswith(']') and '[' in name:
+                owner, _, property_name = name[:-1].partition('[')
+                if owner not in self.deep_objects:
+                    owner = None
+
+            obj = result.setdefault(owner, {}) if owner is not None else None
+            if isinstance(obj, dict):
+                obj[property_name] = _single_or_list(values)
+            else:
+                result[name] = _single_or_list(values)
+        return result
@@ -1,6 +1,6 @@
 import re
+from typing import Optional
 
-from marshmallow import EXCLUDE
 from marshmallow.exceptions import ValidationError
 
 from .exceptions import FirstEndpointValidation
@@ -9,6 +9,7 @@ from .exceptions import FirstRequestCookiesValidation
 from .exceptions import FirstRequestHeadersValidation
 from .exceptions import FirstRequestJSONValidation
 from .exceptions import FirstRequestPathArgsValidation
+from .operations import Operation
 from .specification import Specification
 
 
@@ -26,9 +27,11 @@ class RequestSerializer:
         path_params: dict = None,
         params: dict = None,
         json: dict = None,
+        operation: Optional[Operation] = None,
     ) -> None:
         self.spec = spec
         self._paths_schema = self.spec.deserialized_spec['paths']
+        self.operation = operation
 
         self.method = method.lower()
         self.endpoint = endpoint
@@ -64,38 +67,30 @@ class RequestSerializer:
             )
 
     def _validating_headers(self) -> FirstRequestHeadersValidation or None:
-        params_schemas = self._paths_schema[self.endpoint][self.method].get('parameters')
-        if params_schemas:
-            headers_schema = params_schemas.get('headers')
-            if headers_schema:
-                try:
-                    self.serialized_headers = headers_schema(unknown=EXCLUDE).load(self.headers)
-                except ValidationError as e:
-                    raise FirstRequestHeadersValidation(str(e))
-        else:
-            if self.path_params:
-                raise FirstRequestHeadersValidation('Headers of request not in specification.')
+        # Clients send many headers not described in specification, only declared are passed.
+        parameters = self.operation.parameters
+        self.serialized_headers = parameters.select_headers(self.headers or {})
+        if parameters.headers:
+            try:
+                self.serialized_headers = parameters.headers.load(self.serialized_headers)
+            except ValidationError as e:
+                raise FirstRequestHeadersValidation(str(e))
 
     def _validating_cookies(self) -> FirstRequestCookiesValidation or None:
-        params_schemas = self._paths_schema[self.endpoint][self.method].get('parameters')
-        if params_schemas:
-            cookies_schema = params_schemas.get('cookies')
-            if cookies_schema:
-                try:
-                    self.serialized_cookies = cookies_schema(unknown=EXCLUDE).load(self.headers)
-                except ValidationError as e:
-                    raise FirstRequestCookiesValidation(str(e))
-        else:
-            if self.path_params:
-                raise FirstRequestCookiesValidation('Cookies of request not in specification.')
+        parameters = self.operation.parameters
+        self.serialized_cookies = parameters.select_cookies(self.cookies or {})
+        if parameters.cookies:
+            try:
+                self.serialized_cookies = parameters.cookies.load(self.serialized_cookies)
+            except ValidationError as e:
+                raise FirstRequestCookiesValidation(str(e))
 
     def _validating_path_params(self) -> FirstRequestPathArgsValidation or None:
-        params_schemas = self._paths_schema[self.endpoint][self.method].get('parameters')
-        if params_schemas:
-            path_params_schema = params_schemas.get('view_args')
-            if path_params_schema:
+        if self.operation.parameters:
+            view_args_loader = self.operation.parameters.view_args
+            if view_args_loader:
                 try:
-                    self.serialized_path_params = path_params_schema().load(self.path_params)
+                    self.serialized_path_params = view_args_loader.load(self.path_params)
                 except ValidationError as e:
                     raise FirstRequestPathArgsValidation(str(e))
         else:
@@ -105,12 +100,11 @@ class RequestSerializer:
                 )
 
     def _validating_params(self) -> FirstRequestArgsValidation or None:
-        params_schemas = self._paths_schema[self.endpoint][self.method].get('parameters')
-        if params_schemas:
-            args_schema = params_schemas.get('args')
-            if args_schema:
+        if self.operation.parameters:
+            args_loader = self.operation.parameters.args
+            if args_loader:
                 try:
-                    self.serialized_params = args_schema().load(self.params)
+                    self.serialized_params = args_loader.load(self.params)
                 except ValidationError as e:
                     raise FirstRequestArgsValidation(str(e))
         else:
@@ -118,21 +112,9 @@ class RequestSerializer:
                 raise FirstRequestArgsValidation('Parameters of request not in specification.')
 
     def _validating_json(self) -> FirstRequestJSONValidation or None:
-        request_body = self._paths_schema[self.endpoint][self.method].get('requestBody')
-        if request_body:
-            content = self._paths_schema[self.endpoint][self.method]['requestBody']['content']
-            json_schema = content[self.DEFAULT_CONTENT_TYPE]['schema']
+        if self.operation.request_body:
             try:
-                if isinstance(self.json, list):
-                    self.serialized_json = json_schema._load(self.json, None)
-                elif 'allOf' in json_schema._declared_fields:
-                    self.serialized_json = json_schema().load({'allOf': self.json})
-                elif 'anyOf' in json_schema._declared_fields:
-                    self.serialized_json = json_schema().load({'anyOf': self.json})
-                elif 'oneOf' in json_schema._declared_fields:
-                    self.serialized_json = json_schema().load({'oneOf': self.json})
-                else:
-                    self.serialized_json = json_schema().load(self.json)
+                self.serialized_json = self.operation.load_request_json(self.json)
             except ValidationError as e:
                 raise FirstRequestJSONValidation(str(e))
         else:
@@ -140,8 +122,12 @@ class RequestSerializer:
                 raise FirstRequestJSONValidation('JSON of request not in specification.')
 
     def validate(self):
-        self._validating_endpoint()
-        self._validating_method()
+        # Operation from the dispatch table of the extension is already checked.
+        if self.operation is None:
+            self._validating_endpoint()
+            self._validating_method()
+            self.operation = Operation(self.spec, self.endpoint, self.method)
+
         self._validating_headers()
         self._validating_cookies()
         self._validating_path_params()
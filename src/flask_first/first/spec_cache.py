@@ -0,0 +1,159 @@
+"""Persistent on-disk cache of the loaded specification."""
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import warnings
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+from typing import Optional
+
+CACHE_FORMAT_VERSION = 4
+
+
+def hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """Directory of the current user for cache of Flask-First, like `~/.cache/flask_first`."""
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path(Path.home(), '.cache'), 'flask_first')
+
+
+def is_private(path: Path) -> bool:
+    """Path is owned by the current user and other users can not write to it."""
+    try:
+        path_stat = path.stat()
+    except OSError:
+        return False
+
+    # Owners of files are not checked on platforms without users like Windows.
+    if hasattr(os, 'getuid') and path_stat.st_uid != os.getuid():
+        return False
+    return not path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def has_not_string_keys(obj: Any) -> bool:
+    """Check dicts for keys which are not strings, JSON silently converts such keys."""
+    if isinstance(obj, dict):
+        return any(
+            not isinstance(key, str) or has_not_string_keys(value) for key, value in obj.items()
+        )
+    if isinstance(obj, list):
+        return any(has_not_string_keys(item) for item in obj)
+    return False
+
+
+class SpecCache:
+    """
+    Store parsed files of the specification in `cache_dir`, links between them are resolved again
+    after loading, so resolved nodes are shared like after reading of files. Cache is valid while
+    content of every file of the specification is unchanged.
+    """
+
+    def __init__(self, cache_dir: str or Path, path_to_spec: Path):
+        self.cache_dir = Path(cache_dir)
+        self.path_to_spec = Path(path_to_spec).resolve()
+
+        cache_name = hashlib.sha256(str(self.path_to_spec).encode()).hexdigest()
+        self.cache_file = Path(self.cache_dir, f'{cache_name}.json')
+
+    def hash_files(self, files: Iterable[str]) -> dict[str, str]:
+        return {file: hash_file(Path(self.path_to_spec.parent, file)) for file in files}
+
+    def load(self) -> Optional[dict]:
+        try:
+            with open(self.cache_file) as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if payload.get('version') != CACHE_FORMAT_VERSION:
+            return None
+
+        try:
+            files_hashes = self.hash_files(payload['files'])
+        except OSError:
+            return None
+
+        if files_hashes != payload['files']:
+            return None
+
+        return payload
+
+    def dump(self, store: dict[str, Any]) -> None:
+        """Save parsed files of the specification: name of file -> content of file."""
+        payload = {
+            'version': CACHE_FORMAT_VERSION,
+            'files': self.hash_files(store),
+            'store': store,
+        }
+
+        # Values are not converted, so specification with values not supported by JSON, like
+        # dates or not quoted HTTP codes from YAML, is not cached.
+        try:
+            if has_not_string_keys(store):
+                raise TypeError('keys of objects must be strings')
+            data = json.dumps(payload)
+        except (TypeError, ValueError) as e:
+            warnings.warn(
+                f'Cache of specification not saved, specification contains values not supported'
+                f' by JSON: {e!r}',
+                stacklevel=2,
+            )
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Several workers can write the cache at the same time, so file is replaced atomically.
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            warnings.warn(
+                f'Cache of specification not saved to <{self.cache_dir}>: {e!r}', stacklevel=2
+            )
+
+
+class ValidationMarker:
+    """
+    Marker of the specification which passed validation. Marker is valid while content of every
+    file of the specification is unchanged. Markers are stored in `markers_dir`, by default in
+    cache directory of the current user. Markers are trusted only in directory of the current user,
+    which other users can not write to, so they can not turn off validation.
+    """
+
+    def __init__(
+        self,
+        markers_dir: Optional[str or Path],
+        files_hashes: dict[str, str],
+        experimental_validator: bool = False,
+    ):
+        self.markers_dir = Path(markers_dir or default_cache_dir())
+
+        key = json.dumps([files_hashes, experimental_validator], sort_keys=True)
+        marker_name = hashlib.sha256(key.encode()).hexdigest()
+        self.marker_file = Path(self.markers_dir, f'{marker_name}.validated')
+
+    def exists(self) -> bool:
+        return (
+            self.marker_file.is_file()
+            and is_private(self.markers_dir)
+            and is_private(self.marker_file)
+        )
+
+    def save(self) -> None:
+        try:
+            self.markers_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not is_private(self.markers_dir):
+                raise PermissionError('directory is not owned by the user or writable by others')
+            self.marker_file.touch(mode=0o600)
+        except OSError as e:
+            warnings.warn(
+                f'Marker of validated specification not saved to <{self.markers_dir}>: {e!r}',
+                stacklevel=2,
+            )
@@ -1,38 +1,239 @@
-from copy import deepcopy
+import threading
+import warnings
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Mapping
 from pathlib import Path
+from types import ModuleType
+from typing import Any
 from typing import Optional
 
-from openapi_spec_validator import validate
-from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from marshmallow import RAISE
 
+from ..schema.schema_compiler import compile_schema
 from ..schema.schema_maker import make_marshmallow_schema
+from ..schema.schema_maker import SchemasCache
+from .artifact import get_source_path
+from .artifact import is_artifact
+from .artifact import is_stale
+from .artifact import load_artifact
+from .exceptions import FirstException
 from .exceptions import FirstOpenAPIValidation
-from .loaders import load_from_yaml
-from .validator import OpenAPI310ValidationError
-from .validator import Validator
+from .identity_memo import IdentityMemo
+from .loaders.yaml_loader import RefResolver
+from .loaders.yaml_loader import stat_file
+from .loaders.yaml_loader import YAMLReader
+from .spec_cache import hash_file
+from .spec_cache import SpecCache
+from .spec_cache import ValidationMarker
+
+VALIDATION_ENGINES = ('marshmallow', 'compiled')
+SPEC_VALIDATION_POLICIES = ('always', 'once', 'off')
+
+
+class LazyConvertedMapping(Mapping):
+    """Mapping with values converted on first access. Every value is converted once."""
+
+    def __init__(self, source: dict, convert: Callable[[Any], Any], lock: threading.Lock):
+        self._source = source
+        self._convert = convert
+        self._lock = lock
+        self._converted = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._converted[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if key not in self._converted:
+                self._converted[key] = self._convert(self._source[key])
+        return self._converted[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._source
+
+    def __iter__(self) -> Iterator:
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def convert_all(self) -> None:
+        for key in self._source:
+            self[key]
 
 
 class Specification:
+    HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
     def __init__(
         self,
-        path: Path or str,
+        path: Path or str or ModuleType,
         experimental_validator: bool = False,
         datetime_format: Optional[str] = None,
+        cache_dir: Optional[Path or str] = None,
+        lazy_compile: bool = False,
+        validation_engine: str = 'marshmallow',
+        loader_workers: Optional[int] = None,
+        spec_validation: str = 'always',
+        reader: Optional[YAMLReader] = None,
+        schemas_cache: Optional[SchemasCache] = None,
     ):
-        self.path = path
+        if validation_engine not in VALIDATION_ENGINES:
+            raise FirstException(
+                f'Validation engine <{validation_engine}> not in <{VALIDATION_ENGINES}>.'
+            )
+        if spec_validation not in SPEC_VALIDATION_POLICIES:
+            raise FirstException(
+                f'Validation policy <{spec_validation}> not in <{SPEC_VALIDATION_POLICIES}>.'
+            )
+
+        artifact = None
+        if is_artifact(path):
+            artifact = load_artifact(path)
+            path = get_source_path(artifact)
+            if is_stale(artifact, datetime_format):
+                warnings.warn(
+                    f'Artifact <{artifact.__name__}> is stale, specification is loaded from'
+                    f' <{path}>. Make it again via command `flask first compile`.',
+                    stacklevel=2,
+                )
+                artifact = None
+
+        self.path = Path(path)
         self.datetime_format = datetime_format
         self.experimental_validator = experimental_validator
-        self.raw_spec = load_from_yaml(self.path)
-        self._validating_openapi_file(self.path, self.experimental_validator)
+        self.cache_dir = cache_dir
+        self.lazy_compile = lazy_compile
+        self.validation_engine = validation_engine
+        self.loader_workers = loader_workers
+        self.spec_validation = spec_validation
+        self.warm_up_thread = None
+        # Reader is kept for reloading of changed files, it is `None` for cached or compiled spec.
+        self.reader = None
+
+        # Validators of operations prebuilt in artifact: (route, method, part of request).
+        self.prebuilt_validators = {}
+
+        cache = SpecCache(self.cache_dir, self.path) if self.cache_dir and not artifact else None
+        cached_spec = cache.load() if cache and reader is None else None
+        if artifact:
+            self.operation_routes = artifact.OPERATIONS
+            # Validators prebuilt by compiled engine are not used by marshmallow engine.
+            if self.validation_engine == 'compiled':
+                self.prebuilt_validators = artifact.VALIDATORS
+            # Schemas are made on first usage, so workers start without making of schemas.
+            self.lazy_compile = True
+
+        if artifact or cached_spec:
+            # Parsed files are taken from artifact or cache, links are resolved as for read files.
+            store = artifact.STORE if artifact else cached_spec['store']
+            resolver = RefResolver(YAMLReader(self.path).restore(store)).resolving()
+        else:
+            if reader is None:
+                reader = YAMLReader(self.path, max_workers=self.loader_workers).load()
+            self.reader = reader
+            resolver = RefResolver(reader).resolving()
+
+        self.files = tuple(resolver.yaml_reader.store)
+        self.raw_spec = resolver.resolved_spec
+        discriminator_branches = resolver.discriminator_branches
+        if not artifact:
+            # Cache keeps only parsed files, so cached specification is validated by the policy too.
+            self._validating_spec()
+        if cache and not cached_spec:
+            cache.dump(self.reader.store)
         self.resolved_spec = self._convert_parameters_to_schema(self.raw_spec)
-        self.deserialized_spec = self._convert_schemas(self.resolved_spec)
+
+        if not artifact:
+            self.operation_routes = self._make_operation_routes(self.resolved_spec)
+
+        self.files_stats = self.reader.stats if self.reader is not None else self.read_files_stats()
+
+        self._schemas_cache = schemas_cache or SchemasCache()
+        self._schemas_cache.set_discriminator_branches(discriminator_branches)
+        self._converted_nodes = IdentityMemo()
+        self._compile_lock = threading.Lock()
+        self._lazy_mappings = []
+        if self.lazy_compile:
+            self.deserialized_spec = self._convert_schemas_lazily(self.resolved_spec)
+        else:
+            self.deserialized_spec = self._convert_schemas(self.resolved_spec)
+            # Memo keeps every converted node, it is not needed after conversion.
+            self._converted_nodes.clear()
+
+    @property
+    def files_hashes(self) -> dict[str, str]:
+        return {file: hash_file(Path(self.path.parent, file)) for file in self.files}
+
+    def read_files_stats(self) -> dict[str, Optional[tuple[int, int]]]:
+        return {file: stat_file(Path(self.path.parent, file)) for file in self.files}
+
+    def reload(self) -> tuple['Specification', frozenset[tuple[str, str]]]:
+        """
+        Make the specification again after changing of its files. Only changed files are read
+        again, schemas are made on first access and classes of not changed schemas are reused.
+        Returns new specification and operations `(route, method)` changed in it.
+        """
+        reader = YAMLReader(self.path, max_workers=self.loader_workers).load(previous=self.reader)
+        spec = Specification(
+            self.path,
+            experimental_validator=self.experimental_validator,
+            datetime_format=self.datetime_format,
+            cache_dir=self.cache_dir,
+            lazy_compile=True,
+            validation_engine=self.validation_engine,
+            loader_workers=self.loader_workers,
+            spec_validation=self.spec_validation,
+            reader=reader,
+            schemas_cache=self._schemas_cache.fork(),
+        )
+
+        operations = {*self.operation_routes.values(), *spec.operation_routes.values()}
+        if self.reader is None:
+            return spec, frozenset(operations)
+        return spec, reader.changed_operations(self.reader, operations)
+
+    def _make_operation_routes(self, resolved_spec: dict) -> dict[str, tuple[str, str]]:
+        """Table of operations: operationId -> (route, method)."""
+        operation_routes = {}
+        for route, path_item in resolved_spec['paths'].items():
+            for method, operation in path_item.items():
+                if method in self.HTTP_METHODS and operation.get('operationId'):
+                    operation_routes[operation['operationId']] = (route, method)
+        return operation_routes
+
+    def _make_validation_marker(self) -> ValidationMarker:
+        return ValidationMarker(self.cache_dir, self.files_hashes, self.experimental_validator)
+
+    def _validating_spec(self) -> None:
+        """Validate specification according to policy of validation."""
+        if self.spec_validation == 'always':
+            self._validating_openapi_file(self.path, self.experimental_validator)
+        elif self.spec_validation == 'once' and not self._make_validation_marker().exists():
+            self.validate()
+
+    def validate(self) -> None:
+        """Validate specification and mark it as validated for policy `once`."""
+        self._validating_openapi_file(self.path, self.experimental_validator)
+        self._make_validation_marker().save()
 
     def _validating_openapi_file(self, path: Path, experimental_validator: bool):
         if experimental_validator:
+            from .validator import OpenAPI310ValidationError
+            from .validator import Validator
+
             try:
-                Validator(path).validate()
+                Validator(self.raw_spec).validate()
             except OpenAPI310ValidationError as e:
                 raise FirstOpenAPIValidation(repr(e))
+            return
+
+        # Validator imports jsonschema stack, so it is imported only for validation.
+        from openapi_spec_validator import validate
+        from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
 
         try:
             validate(self.raw_spec)
@@ -78,9 +279,14 @@ class Specification:
 
         return schemas
 
-    def _convert_parameters_to_schema(self, spec_without_refs) -> dict:
-        schema = deepcopy(spec_without_refs)
-        for _, path_item in schema['paths'].items():
+    def _convert_parameters_to_schema(self, spec_without_refs: dict) -> dict:
+        """
+        Replace lists of parameters of operations with schemas. Only paths and operations with
+        parameters are made again, other nodes are shared with the source specification.
+        """
+        paths = {}
+        for route, source_path_item in spec_without_refs['paths'].items():
+            path_item = dict(source_path_item)
             common_parameters: Optional[list] = path_item.pop('parameters', [])
             for method, operation in path_item.items():
                 parameters_from_method: Optional[list] = operation.get('parameters', [])
@@ -93,34 +299,99 @@ class Specification:
                 parameters_schemas = self._from_list_to_schemas(combined_params)
 
                 # Adding key `schema` for create regular structure. For simple using.
-                path_item[method]['parameters'] = parameters_schemas
-        return schema
+                path_item[method] = {**operation, 'parameters': parameters_schemas}
+            paths[route] = path_item
+        return {**spec_without_refs, 'paths': paths}
+
+    def get_schema_instance(self, schema_class: type, **kwargs) -> Any:
+        return self._schemas_cache.get_instance(schema_class, **kwargs)
+
+    def compile_schema(
+        self, schema: dict, unknown: str = RAISE, key: Optional[tuple] = None
+    ) -> Optional[Callable[[Any], Any]]:
+        if key in self.prebuilt_validators:
+            return self.prebuilt_validators[key]
+        return compile_schema(schema, unknown=unknown, datetime_format=self.datetime_format)
+
+    def _make_schema(self, schema: dict) -> Any:
+        return make_marshmallow_schema(
+            schema, datetime_format=self.datetime_format, schemas_cache=self._schemas_cache
+        )
 
     def _convert_schemas(self, resolved_schema: dict) -> dict or list:
-        converted_schema = deepcopy(resolved_schema)
-        if isinstance(converted_schema, dict):
-            for key, value in converted_schema.items():
-                if key in {'header_args', 'view_args', 'args', 'cookie'}:
-                    converted_schema[key] = make_marshmallow_schema(
-                        value, datetime_format=self.datetime_format
-                    )
+        """
+        Convert schemas into marshmallow schemas. Nodes without schemas are not copied, they are
+        shared with the resolved specification.
+        """
+        if not isinstance(resolved_schema, (dict, list)):
+            return resolved_schema
+
+        converted_schema = self._converted_nodes.get(resolved_schema)
+        if converted_schema is not IdentityMemo.MISSING:
+            return converted_schema
+
+        if isinstance(resolved_schema, dict):
+            converted_schema = {}
+            for key, value in resolved_schema.items():
+                if key in {'header_args', 'view_args', 'args', 'cookies'}:
+                    converted_schema[key] = self._make_schema(value)
                 elif key == 'schema':
-                    converted_schema['schema'] = make_marshmallow_schema(
-                        value, datetime_format=self.datetime_format
-                    )
+                    converted_schema['schema'] = self._make_schema(value)
                 elif key == 'schemas':
-                    for schema_name, schema_value in value.items():
-                        value[schema_name] = make_marshmallow_schema(
-                            schema_value, datetime_format=self.datetime_format
-                        )
+                    converted_schema['schemas'] = {
+                        schema_name: self._make_schema(schema_value)
+                        for schema_name, schema_value in value.items()
+                    }
                 else:
                     converted_schema[key] = self._convert_schemas(value)
-            return converted_schema
 
-        if isinstance(converted_schema, list):
-            schemas = []
-            for schema in converted_schema:
-                schemas.append(self._convert_schemas(schema))
-            return schemas
+            if all(converted_schema[key] is value for key, value in resolved_schema.items()):
+                converted_schema = resolved_schema
+        else:
+            converted_schema = [self._convert_schemas(schema) for schema in resolved_schema]
+            if all(new is old for new, old in zip(converted_schema, resolved_schema)):
+                converted_schema = resolved_schema
 
+        self._converted_nodes.set(resolved_schema, converted_schema)
         return converted_schema
+
+    def _make_lazy_mapping(self, source: dict, convert: Callable[[Any], Any]) -> Mapping:
+        lazy_mapping = LazyConvertedMapping(source, convert, self._compile_lock)
+        self._lazy_mappings.append(lazy_mapping)
+        return lazy_mapping
+
+    def _convert_schemas_lazily(self, resolved_schema: dict) -> dict:
+        """Convert schemas of every operation and component on first access to it."""
+        converted_schema = {}
+        for key, value in resolved_schema.items():
+            if key == 'paths':
+                converted_schema['paths'] = {
+                    path: self._make_lazy_mapping(path_item, self._convert_schemas)
+                    for path, path_item in value.items()
+                }
+            elif key == 'components':
+                converted_schema['components'] = {
+                    component_type: self._make_lazy_mapping(
+                        components,
+                        self._make_schema if component_type == 'schemas' else self._convert_schemas,
+                    )
+                    for component_type, components in value.items()
+                }
+            else:
+                converted_schema[key] = self._convert_schemas(value)
+        return converted_schema
+
+    def warm_up(self, background: bool = False) -> Optional[threading.Thread]:
+        """Convert all schemas which were not converted yet. Only makes sense for lazy compile."""
+        if background:
+            self.warm_up_thread = threading.Thread(
+                target=self.warm_up, name='flask-first-warm-up', daemon=True
+            )
+            self.warm_up_thread.start()
+            return self.warm_up_thread
+
+        for lazy_mapping in self._lazy_mappings:
+            lazy_mapping.convert_all()
+        with self._compile_lock:
+            self._converted_nodes.clear()
+        return None
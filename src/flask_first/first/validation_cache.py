@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import Any
+from typing import NamedTuple
+from typing import Optional
+
+from .exceptions import FirstException
+from .exceptions import FirstValidation
+
+VALIDATION_CACHE_EXTENSION = 'x-first-validation-cache'
+# Longer query strings are validated without cache, so keys of cache are not too large.
+MAX_QUERY_STRING_LENGTH = 2048
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CachedError:
+    """Validation error stored in cache, new exception is raised for every request."""
+
+    __slots__ = ('error_class', 'args')
+
+    def __init__(self, error: FirstValidation):
+        self.error_class = type(error)
+        self.args = error.args
+
+    def raise_error(self) -> None:
+        raise self.error_class(*self.args)
+
+
+class ValidationCache:
+    """
+    Bounded LRU cache of results of validating of requests to operation. Serialized data or
+    validation error is stored for key made from data of request.
+    """
+
+    MISSING = object()
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: tuple) -> Any:
+        """Stored result for key or `ValidationCache.MISSING`."""
+        with self._lock:
+            result = self._data.get(key, self.MISSING)
+            if result is self.MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+        return result
+
+    def set(self, key: tuple, result: Any) -> None:
+        with self._lock:
+            self._data[key] = result
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+def make_validation_cache(operation: dict, operation_id: str) -> Optional[ValidationCache]:
+    """Cache of operation with size from its extension `x-first-validation-cache`."""
+    maxsize = operation.get(VALIDATION_CACHE_EXTENSION)
+    if maxsize is None:
+        return None
+
+    if isinstance(maxsize, bool) or not isinstance(maxsize, int) or maxsize < 1:
+        raise FirstException(
+            f'Size of validation cache <{maxsize!r}> of operation <{operation_id}> must be positive'
+            ' integer.'
+        )
+    return ValidationCache(maxsize)
@@ -1,90 +1,658 @@
+"""
+Validator of OpenAPI 3.1 specification.
+
+Checks of every object of the specification are made once at import of module, so validation is
+a walk over the loaded specification without making of any schemas. Nodes shared between several
+places of the specification, for example, resolved links to components, are checked once.
+"""
+
+import re
+from collections.abc import Callable
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
+from typing import Optional
 
-import yaml
-from marshmallow import fields
-from marshmallow import pre_load
-from marshmallow import Schema
-from marshmallow import validate
-from marshmallow import ValidationError
+from .loaders import load_from_file
 
-OPENAPI_VERSION = '3.1.0'
-TYPES = ['array', 'boolean', 'integer', 'number', 'object', 'string']
-RE_VERSION = r'^[0-9]+.[0-9]+.[0-9]+$'
+RE_OPENAPI_VERSION = re.compile(r'^3\.1\.\d+(-.+)?$')
+RE_COMPONENT_NAME = re.compile(r'^[a-zA-Z0-9._-]+$')
+RE_HTTP_CODE = re.compile(r'^([1-5]\d{2}|[1-5]XX|default)$')
+RE_PATH_PARAMETER = re.compile(r'{([^}/]+)}')
 
-ENDPOINT_FIELD = fields.String(required=True, validate=validate.Regexp(r'^[/][0-9a-z-{}/]*[^/]$'))
-HTTP_CODE_FIELD = fields.String(required=True, validate=validate.Regexp(r'^[1-5]{1}\d{2}|default$'))
-DESCRIPTION_FIELD = fields.String(required=True)
-MEDIA_TYPE_FIELD = fields.String(required=True)
+TYPES = ('array', 'boolean', 'integer', 'null', 'number', 'object', 'string')
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+PARAMETER_LOCATIONS = ('query', 'header', 'path', 'cookie')
+SECURITY_SCHEME_TYPES = ('apiKey', 'http', 'mutualTLS', 'oauth2', 'openIdConnect')
+SECURITY_SCHEME_REQUIRED_FIELDS = {
+    'apiKey': ('name', 'in'),
+    'http': ('scheme',),
+    'mutualTLS': (),
+    'oauth2': ('flows',),
+    'openIdConnect': ('openIdConnectUrl',),
+}
+OAUTH_FLOW_REQUIRED_FIELDS = {
+    'implicit': ('authorizationUrl',),
+    'password': ('tokenUrl',),
+    'clientCredentials': ('tokenUrl',),
+    'authorizationCode': ('authorizationUrl', 'tokenUrl'),
+}
+
+Check = Callable[[Any, tuple, 'Context'], None]
+CHECKS: dict[str, Check] = {}
 
 
 class OpenAPI310ValidationError(Exception):
     """OpenAPI specification validation error."""
 
 
-class InfoSchema(Schema):
-    title = fields.String(required=True)
-    version = fields.String(required=True, validate=validate.Regexp(RE_VERSION))
+class Context:
+    """State of one validation: found errors and already checked nodes."""
+
+    __slots__ = ('errors', 'checked', 'operation_ids')
+
+    def __init__(self):
+        self.errors = []
+        self.checked = set()
+        self.operation_ids = {}
+
+    def error(self, path: tuple, message: str) -> None:
+        self.errors.append(f'{pointer(path)}: {message}')
+
+
+def pointer(path: tuple) -> str:
+    """Make JSON pointer to node of the specification."""
+    keys = (str(key).replace('~', '~0').replace('/', '~1') for key in path)
+    return '/'.join(('#', *keys))
+
+
+def _type_name(value: Any) -> str:
+    return type(value).__name__
+
+
+def _instance_of(types: type or tuple, name: str) -> Check:
+    def check(value: Any, path: tuple, ctx: Context) -> None:
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            ctx.error(path, f'must be {name}, not <{_type_name(value)}>')
+
+    return check
+
+
+def _any(value: Any, path: tuple, ctx: Context) -> None:
+    return
+
+
+STRING = _instance_of((str,), 'string')
+BOOLEAN = _instance_of((bool,), 'boolean')
+NUMBER = _instance_of((int, float), 'number')
+
+
+def _non_negative_integer(value: Any, path: tuple, ctx: Context) -> None:
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        ctx.error(path, f'must be non-negative integer, not <{value!r}>')
+
+
+def _positive_number(value: Any, path: tuple, ctx: Context) -> None:
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+        ctx.error(path, f'must be number greater than 0, not <{value!r}>')
+
+
+def _one_of_values(values: Iterable) -> Check:
+    values = tuple(values)
+
+    def check(value: Any, path: tuple, ctx: Context) -> None:
+        if value not in values:
+            ctx.error(path, f'value <{value!r}> not in <{values}>')
+
+    return check
+
+
+def _lazy(name: str) -> Check:
+    """Check registered later. Used for recursive objects."""
+
+    def check(value: Any, path: tuple, ctx: Context) -> None:
+        CHECKS[name](value, path, ctx)
+
+    return check
+
+
+def _list_of(item_check: Check, min_items: int = 0, unique: bool = False) -> Check:
+    def check(value: Any, path: tuple, ctx: Context) -> None:
+        if not isinstance(value, list):
+            ctx.error(path, f'must be array, not <{_type_name(value)}>')
+            return
+
+        if len(value) < min_items:
+            ctx.error(path, f'must contain at least {min_items} items')
+        if unique and len(set(map(repr, value))) != len(value):
+            ctx.error(path, 'items must be unique')
+
+        for index, item in enumerate(value):
+            item_check(item, (*path, index), ctx)
+
+    return check
+
+
+def _map_of(value_check: Check, key_pattern: Optional[re.Pattern] = None) -> Check:
+    def check(value: Any, path: tuple, ctx: Context) -> None:
+        if not isinstance(value, dict):
+            ctx.error(path, f'must be object, not <{_type_name(value)}>')
+            return
+
+        for key, item in value.items():
+            # Keys like not quoted HTTP codes are loaded from YAML as integers, they are not valid
+            # keys of JSON object.
+            if not isinstance(key, str):
+                ctx.error((*path, key), f'key must be string, not <{_type_name(key)}>')
+            elif key_pattern is not None and not key_pattern.match(key):
+                ctx.error((*path, key), f'key does not match <{key_pattern.pattern}>')
+            value_check(item, (*path, key), ctx)
+
+    return check
+
+
+def _object(
+    name: str,
+    fields: dict[str, Check],
+    required: tuple = (),
+    exclusive: tuple = (),
+    validate: Optional[Check] = None,
+    additional_fields: bool = False,
+) -> Check:
+    """
+    Make and register check of object with fixed fields. Fields from `exclusive` are mutually
+    exclusive. Fields `x-*` are extensions and allowed for every object.
+    """
+    required = tuple(required)
+    exclusive = tuple(exclusive)
+
+    def check(value: Any, path: tuple, ctx: Context) -> None:
+        if not isinstance(value, dict):
+            ctx.error(path, f'{name} must be object, not <{_type_name(value)}>')
+            return
+
+        node_key = (name, id(value))
+        if node_key in ctx.checked:
+            return
+        ctx.checked.add(node_key)
+
+        for field in required:
+            if field not in value:
+                ctx.error(path, f'{name} must contain field <{field}>')
+
+        if exclusive and sum(field in value for field in exclusive) > 1:
+            ctx.error(path, f'{name} must contain only one of fields <{exclusive}>')
+
+        for key, item in value.items():
+            field_check = fields.get(key)
+            if field_check is not None:
+                field_check(item, (*path, key), ctx)
+            elif not additional_fields and not str(key).startswith('x-'):
+                ctx.error((*path, key), f'field is not allowed in {name}')
+
+        if validate is not None:
+            validate(value, path, ctx)
+
+    CHECKS[name] = check
+    return check
+
+
+def _validate_schema_type(value: Any, path: tuple, ctx: Context) -> None:
+    types = value if isinstance(value, list) else [value]
+    if not types or any(not isinstance(type_, str) or type_ not in TYPES for type_ in types):
+        ctx.error(path, f'type <{value!r}> not in <{TYPES}>')
+    elif len(set(types)) != len(types):
+        ctx.error(path, 'types must be unique')
 
 
-class SchemaObjectSchema(Schema):
-    type = fields.String(required=True, validate=validate.OneOf(TYPES))
-    properties = fields.Dict(
-        keys=fields.String(required=True), values=fields.Nested(lambda: SchemaObjectSchema())
-    )
+def _schema(value: Any, path: tuple, ctx: Context) -> None:
+    """Schema Object is JSON Schema 2020-12, so it can be boolean and can contain any keywords."""
+    if isinstance(value, bool):
+        return
+    CHECKS['Schema'](value, path, ctx)
 
 
-class MediaTypeObjectSchema(Schema):
-    schema = fields.Nested(SchemaObjectSchema)
+SCHEMA = _schema
+SCHEMAS_MAP = _map_of(SCHEMA)
+SCHEMAS_LIST = _list_of(SCHEMA, min_items=1)
 
+_object(
+    'Discriminator',
+    {'propertyName': STRING, 'mapping': _map_of(STRING)},
+    required=('propertyName',),
+)
+_object(
+    'XML',
+    {
+        'name': STRING,
+        'namespace': STRING,
+        'prefix': STRING,
+        'attribute': BOOLEAN,
+        'wrapped': BOOLEAN,
+    },
+)
+_object('ExternalDocumentation', {'description': STRING, 'url': STRING}, required=('url',))
+_object(
+    'Schema',
+    {
+        'type': _validate_schema_type,
+        'enum': _list_of(_any),
+        'const': _any,
+        'properties': SCHEMAS_MAP,
+        'patternProperties': SCHEMAS_MAP,
+        'additionalProperties': SCHEMA,
+        'propertyNames': SCHEMA,
+        'unevaluatedProperties': SCHEMA,
+        'dependentSchemas': SCHEMAS_MAP,
+        '$defs': SCHEMAS_MAP,
+        'items': SCHEMA,
+        'prefixItems': SCHEMAS_LIST,
+        'contains': SCHEMA,
+        'unevaluatedItems': SCHEMA,
+        'allOf': SCHEMAS_LIST,
+        'anyOf': SCHEMAS_LIST,
+        'oneOf': SCHEMAS_LIST,
+        'not': SCHEMA,
+        'if': SCHEMA,
+        'then': SCHEMA,
+        'else': SCHEMA,
+        'required': _list_of(STRING, unique=True),
+        'dependentRequired': _map_of(_list_of(STRING, unique=True)),
+        'minLength': _non_negative_integer,
+        'maxLength': _non_negative_integer,
+        'minItems': _non_negative_integer,
+        'maxItems': _non_negative_integer,
+        'minContains': _non_negative_integer,
+        'maxContains': _non_negative_integer,
+        'minProperties': _non_negative_integer,
+        'maxProperties': _non_negative_integer,
+        'minimum': NUMBER,
+        'maximum': NUMBER,
+        'exclusiveMinimum': NUMBER,
+        'exclusiveMaximum': NUMBER,
+        'multipleOf': _positive_number,
+        'uniqueItems': BOOLEAN,
+        'pattern': STRING,
+        'format': STRING,
+        'title': STRING,
+        'description': STRING,
+        'readOnly': BOOLEAN,
+        'writeOnly': BOOLEAN,
+        'deprecated': BOOLEAN,
+        'examples': _list_of(_any),
+        'discriminator': _lazy('Discriminator'),
+        'xml': _lazy('XML'),
+        'externalDocs': _lazy('ExternalDocumentation'),
+        '$id': STRING,
+        '$schema': STRING,
+        '$anchor': STRING,
+        '$dynamicAnchor': STRING,
+        '$comment': STRING,
+        'contentEncoding': STRING,
+        'contentMediaType': STRING,
+    },
+    additional_fields=True,
+)
 
-class ResponsesObjectSchema(Schema):
-    description = DESCRIPTION_FIELD
-    content = fields.Dict(keys=MEDIA_TYPE_FIELD, values=fields.Nested(MediaTypeObjectSchema))
+EXAMPLES_MAP = _map_of(_lazy('Example'))
+HEADERS_MAP = _map_of(_lazy('Header'))
+CONTENT_MAP = _map_of(_lazy('MediaType'))
+LINKS_MAP = _map_of(_lazy('Link'))
+SERVERS_LIST = _list_of(_lazy('Server'))
+SECURITY_LIST = _list_of(_map_of(_list_of(STRING)))
 
+_object('Contact', {'name': STRING, 'url': STRING, 'email': STRING})
+_object(
+    'License',
+    {'name': STRING, 'identifier': STRING, 'url': STRING},
+    required=('name',),
+    exclusive=('identifier', 'url'),
+)
+_object(
+    'Info',
+    {
+        'title': STRING,
+        'summary': STRING,
+        'description': STRING,
+        'termsOfService': STRING,
+        'contact': CHECKS['Contact'],
+        'license': CHECKS['License'],
+        'version': STRING,
+    },
+    required=('title', 'version'),
+)
+_object(
+    'ServerVariable',
+    {'enum': _list_of(STRING, min_items=1), 'default': STRING, 'description': STRING},
+    required=('default',),
+)
+_object(
+    'Server',
+    {'url': STRING, 'description': STRING, 'variables': _map_of(CHECKS['ServerVariable'])},
+    required=('url',),
+)
+_object(
+    'Example',
+    {'summary': STRING, 'description': STRING, 'value': _any, 'externalValue': STRING},
+    exclusive=('value', 'externalValue'),
+)
 
-class OperationObjectSchema(Schema):
-    operation_id = fields.String(data_key='operationId')
-    responses = fields.Dict(keys=HTTP_CODE_FIELD, values=fields.Nested(ResponsesObjectSchema))
 
-    @pre_load
-    def normalize_nested_keys(self, data, **kwargs):
-        responses_with_key_as_str = {str(k): v for k, v in data['responses'].items()}
-        data['responses'] = responses_with_key_as_str
-        return data
+def _validate_content_of_parameter(value: dict, path: tuple, ctx: Context) -> None:
+    if ('schema' in value) == ('content' in value):
+        ctx.error(path, 'must contain only one of fields <schema> or <content>')
+    elif 'content' in value and isinstance(value['content'], dict) and len(value['content']) != 1:
+        ctx.error((*path, 'content'), 'must contain only one media type')
 
 
-class PathItemObjectSchema(Schema):
-    get = fields.Nested(OperationObjectSchema)
+PARAMETER_FIELDS = {
+    'description': STRING,
+    'required': BOOLEAN,
+    'deprecated': BOOLEAN,
+    'allowEmptyValue': BOOLEAN,
+    'style': STRING,
+    'explode': BOOLEAN,
+    'allowReserved': BOOLEAN,
+    'schema': SCHEMA,
+    'example': _any,
+    'examples': EXAMPLES_MAP,
+    'content': CONTENT_MAP,
+}
 
+_object('Header', PARAMETER_FIELDS, validate=_validate_content_of_parameter)
 
-class RootSchema(Schema):
-    openapi = fields.String(
-        required=True,
-        validate=validate.And(
-            validate.Equal(OPENAPI_VERSION), validate.Regexp(r'^[/][0-9a-z-{}/]*[^/]$')
-        ),
-    )
-    info = fields.Nested(InfoSchema, required=True)
-    paths = fields.Dict(
-        required=True,
-        keys=ENDPOINT_FIELD,
-        values=fields.Nested(PathItemObjectSchema, required=True),
-    )
+
+def _validate_parameter(value: dict, path: tuple, ctx: Context) -> None:
+    _validate_content_of_parameter(value, path, ctx)
+    if value.get('in') == 'path' and value.get('required') is not True:
+        ctx.error(path, f'path parameter <{value.get("name")}> must be required')
+
+
+_object(
+    'Parameter',
+    {'name': STRING, 'in': _one_of_values(PARAMETER_LOCATIONS), **PARAMETER_FIELDS},
+    required=('name', 'in'),
+    validate=_validate_parameter,
+)
+_object(
+    'Encoding',
+    {
+        'contentType': STRING,
+        'headers': HEADERS_MAP,
+        'style': STRING,
+        'explode': BOOLEAN,
+        'allowReserved': BOOLEAN,
+    },
+)
+_object(
+    'MediaType',
+    {
+        'schema': SCHEMA,
+        'example': _any,
+        'examples': EXAMPLES_MAP,
+        'encoding': _map_of(CHECKS['Encoding']),
+    },
+)
+_object(
+    'RequestBody',
+    {'description': STRING, 'content': CONTENT_MAP, 'required': BOOLEAN},
+    required=('content',),
+)
+_object(
+    'Link',
+    {
+        'operationRef': STRING,
+        'operationId': STRING,
+        'parameters': _map_of(_any),
+        'requestBody': _any,
+        'description': STRING,
+        'server': CHECKS['Server'],
+    },
+    exclusive=('operationRef', 'operationId'),
+)
+_object(
+    'Response',
+    {'description': STRING, 'headers': HEADERS_MAP, 'content': CONTENT_MAP, 'links': LINKS_MAP},
+    required=('description',),
+)
+
+
+RESPONSES_MAP = _map_of(CHECKS['Response'], key_pattern=RE_HTTP_CODE)
+
+
+def _responses(value: Any, path: tuple, ctx: Context) -> None:
+    if isinstance(value, dict) and not value:
+        ctx.error(path, 'Responses must contain at least one response')
+    RESPONSES_MAP(value, path, ctx)
+
+
+def _validate_operation(value: dict, path: tuple, ctx: Context) -> None:
+    operation_id = value.get('operationId')
+    if not isinstance(operation_id, str):
+        return
+
+    first_path = ctx.operation_ids.setdefault(operation_id, path)
+    if first_path != path:
+        ctx.error(
+            (*path, 'operationId'),
+            f'operationId <{operation_id}> is already used in <{pointer(first_path)}>',
+        )
+
+
+PARAMETERS_LIST = _list_of(CHECKS['Parameter'])
+
+
+def _unique_parameters(value: Any, path: tuple, ctx: Context) -> None:
+    PARAMETERS_LIST(value, path, ctx)
+    if not isinstance(value, list):
+        return
+
+    keys = [(p.get('name'), p.get('in')) for p in value if isinstance(p, dict)]
+    if len(set(keys)) != len(keys):
+        ctx.error(path, 'parameters must be unique by fields <name> and <in>')
+
+
+_object(
+    'Operation',
+    {
+        'tags': _list_of(STRING),
+        'summary': STRING,
+        'description': STRING,
+        'externalDocs': CHECKS['ExternalDocumentation'],
+        'operationId': STRING,
+        'parameters': _unique_parameters,
+        'requestBody': CHECKS['RequestBody'],
+        'responses': _responses,
+        'callbacks': _map_of(_lazy('Callback')),
+        'deprecated': BOOLEAN,
+        'security': SECURITY_LIST,
+        'servers': SERVERS_LIST,
+    },
+    validate=_validate_operation,
+)
+_object(
+    'PathItem',
+    {
+        '$ref': STRING,
+        'summary': STRING,
+        'description': STRING,
+        **{method: CHECKS['Operation'] for method in HTTP_METHODS},
+        'servers': SERVERS_LIST,
+        'parameters': _unique_parameters,
+    },
+)
+CHECKS['Callback'] = _map_of(CHECKS['PathItem'])
+
+
+def _path_parameters(parameters: Any) -> set:
+    if not isinstance(parameters, list):
+        return set()
+    return {p.get('name') for p in parameters if isinstance(p, dict) and p.get('in') == 'path'}
+
+
+def _paths(value: Any, path: tuple, ctx: Context) -> None:
+    if not isinstance(value, dict):
+        ctx.error(path, f'Paths must be object, not <{_type_name(value)}>')
+        return
+
+    for route, path_item in value.items():
+        route_path = (*path, route)
+        if str(route).startswith('x-'):
+            continue
+        if not isinstance(route, str) or not route.startswith('/'):
+            ctx.error(route_path, 'path must start with </>')
+            continue
+
+        CHECKS['PathItem'](path_item, route_path, ctx)
+        if not isinstance(path_item, dict):
+            continue
+
+        route_parameters = set(RE_PATH_PARAMETER.findall(route))
+        common_parameters = _path_parameters(path_item.get('parameters'))
+        for method in HTTP_METHODS:
+            operation = path_item.get(method)
+            if not isinstance(operation, dict):
+                continue
+            declared = common_parameters | _path_parameters(operation.get('parameters'))
+            for name in sorted(route_parameters - declared):
+                ctx.error((*route_path, method), f'path parameter <{name}> is not defined')
+
+
+def _validate_oauth_flows(value: dict, path: tuple, ctx: Context) -> None:
+    for flow_name, required_fields in OAUTH_FLOW_REQUIRED_FIELDS.items():
+        flow = value.get(flow_name)
+        if not isinstance(flow, dict):
+            continue
+        for field in required_fields:
+            if field not in flow:
+                ctx.error((*path, flow_name), f'OAuthFlow must contain field <{field}>')
+
+
+OAUTH_FLOW = _object(
+    'OAuthFlow',
+    {
+        'authorizationUrl': STRING,
+        'tokenUrl': STRING,
+        'refreshUrl': STRING,
+        'scopes': _map_of(STRING),
+    },
+    required=('scopes',),
+)
+_object(
+    'OAuthFlows',
+    {flow_name: OAUTH_FLOW for flow_name in OAUTH_FLOW_REQUIRED_FIELDS},
+    validate=_validate_oauth_flows,
+)
+
+
+def _validate_security_scheme(value: dict, path: tuple, ctx: Context) -> None:
+    for field in SECURITY_SCHEME_REQUIRED_FIELDS.get(value.get('type'), ()):
+        if field not in value:
+            ctx.error(path, f'SecurityScheme with type <{value["type"]}> must contain <{field}>')
+
+
+_object(
+    'SecurityScheme',
+    {
+        'type': _one_of_values(SECURITY_SCHEME_TYPES),
+        'description': STRING,
+        'name': STRING,
+        'in': _one_of_values(('query', 'header', 'cookie')),
+        'scheme': STRING,
+        'bearerFormat': STRING,
+        'flows': CHECKS['OAuthFlows'],
+        'openIdConnectUrl': STRING,
+    },
+    required=('type',),
+    validate=_validate_security_scheme,
+)
+
+
+def _components_map(name: str) -> Check:
+    return _map_of(CHECKS[name], key_pattern=RE_COMPONENT_NAME)
+
+
+_object(
+    'Components',
+    {
+        'schemas': _map_of(SCHEMA, key_pattern=RE_COMPONENT_NAME),
+        'responses': _components_map('Response'),
+        'parameters': _components_map('Parameter'),
+        'examples': _components_map('Example'),
+        'requestBodies': _components_map('RequestBody'),
+        'headers': _components_map('Header'),
+        'securitySchemes': _components_map('SecurityScheme'),
+        'links': _components_map('Link'),
+        'callbacks': _components_map('Callback'),
+        'pathItems': _components_map('PathItem'),
+    },
+)
+_object(
+    'Tag',
+    {'name': STRING, 'description': STRING, 'externalDocs': CHECKS['ExternalDocumentation']},
+    required=('name',),
+)
+
+
+def _openapi_version(value: Any, path: tuple, ctx: Context) -> None:
+    if not isinstance(value, str) or not RE_OPENAPI_VERSION.match(value):
+        ctx.error(path, f'version <{value!r}> is not supported, must be 3.1.x')
+
+
+TAGS_LIST = _list_of(CHECKS['Tag'])
+
+
+def _tags(value: Any, path: tuple, ctx: Context) -> None:
+    TAGS_LIST(value, path, ctx)
+    if not isinstance(value, list):
+        return
+
+    names = [tag.get('name') for tag in value if isinstance(tag, dict)]
+    if len(set(names)) != len(names):
+        ctx.error(path, 'names of tags must be unique')
+
+
+def _validate_root(value: dict, path: tuple, ctx: Context) -> None:
+    if not any(field in value for field in ('paths', 'components', 'webhooks')):
+        ctx.error(path, 'OpenAPI must contain at least one of <paths>, <components>, <webhooks>')
+
+
+_object(
+    'OpenAPI',
+    {
+        'openapi': _openapi_version,
+        'info': CHECKS['Info'],
+        'jsonSchemaDialect': STRING,
+        'servers': SERVERS_LIST,
+        'paths': _paths,
+        'webhooks': _map_of(CHECKS['PathItem']),
+        'components': CHECKS['Components'],
+        'security': SECURITY_LIST,
+        'tags': _tags,
+        'externalDocs': CHECKS['ExternalDocumentation'],
+    },
+    required=('openapi', 'info'),
+    validate=_validate_root,
+)
 
 
 class Validator:
-    def __init__(self, path: Path or str):
-        self.path = path
-        self.raw_spec = self._yaml_to_dict(self.path)
+    """
+    Validate structure of OpenAPI 3.1 specification. Specification is passed as loaded and
+    resolved dictionary or as path to the root file, which is loaded with all referenced files.
+    """
+
+    def __init__(self, spec: dict or Path or str):
+        if isinstance(spec, (Path, str)):
+            spec = load_from_file(spec)
+        self.raw_spec = spec
 
-    @staticmethod
-    def _yaml_to_dict(path: Path) -> dict:
-        with open(path) as f:
-            s = yaml.safe_load(f)
-        return s
+    def get_errors(self) -> list[str]:
+        ctx = Context()
+        CHECKS['OpenAPI'](self.raw_spec, (), ctx)
+        return ctx.errors
 
     def validate(self) -> None or OpenAPI310ValidationError:
-        try:
-            RootSchema().validate(self.raw_spec)
-        except ValidationError as e:
-            raise OpenAPI310ValidationError(e)
+        errors = self.get_errors()
+        if errors:
+            raise OpenAPI310ValidationError('\n'.join(errors))
@@ -0,0 +1,64 @@
+import importlib
+import threading
+from collections.abc import Callable
+from typing import Any
+from typing import Optional
+
+from flask import current_app
+
+from .first.exceptions import FirstException
+
+HANDLER_EXTENSION = 'x-first-handler'
+
+
+class LazyView:
+    """
+    View function of operation, which imports the real function from `package.module:function` on
+    the first request, so modules of views are not imported at start of application.
+    """
+
+    __slots__ = ('__name__', 'handler', '_func', '_lock')
+
+    def __init__(self, operation_id: str, handler: str):
+        self.__name__ = operation_id
+        self.handler = handler
+        self._func: Optional[Callable] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.__name__} {self.handler}>'
+
+    def _import_func(self) -> Callable:
+        module_name, _, func_name = self.handler.partition(':')
+        try:
+            return getattr(importlib.import_module(module_name), func_name)
+        except (ImportError, AttributeError) as e:
+            raise FirstException(
+                f'Handler <{self.handler}> of operation <{self.__name__}> not found: <{e!r}>'
+            )
+
+    @property
+    def func(self) -> Callable:
+        if self._func is None:
+            with self._lock:
+                if self._func is None:
+                    self._func = self._import_func()
+        return self._func
+
+    def __call__(self, **kwargs) -> Any:
+        return current_app.ensure_sync(self.func)(**kwargs)
+
+
+def get_handler(
+    operation: dict, operation_id: str, handler_template: Optional[str]
+) -> Optional[str]:
+    """Handler of operation from its extension `x-first-handler` or from template of handlers."""
+    handler = operation.get(HANDLER_EXTENSION)
+    if handler is None and handler_template is not None:
+        handler = handler_template.format(operation_id=operation_id)
+    if handler is not None and ':' not in handler:
+        raise FirstException(
+            f'Handler <{handler}> of operation <{operation_id}> not in format'
+            ' <package.module:function>.'
+        )
+    return handler
@@ -0,0 +1,161 @@
+"""WSGI middleware for validating of requests before Flask."""
+
+import json
+import re
+from collections.abc import Callable
+from collections.abc import Iterable
+from io import BytesIO
+from typing import Any
+from typing import Optional
+
+from werkzeug.exceptions import BadRequest
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.wrappers import Request
+from werkzeug.wrappers import Response
+
+from . import First
+from . import SERIALIZED_REQUEST_ENVIRON_KEY
+from .first.exceptions import FirstValidation
+from .first.specification import Specification
+
+
+class RouteMatcher:
+    """
+    Routes of operations of the specification compiled for matching of path of request. Path
+    parameters are matched and converted like converters of Flask used for the same routes.
+    """
+
+    PATH_PARAMETERS_TYPES = {
+        'string': (r'[^/]+', str),
+        'integer': (r'\d+', int),
+        'number': (r'\d+\.\d+', float),
+    }
+
+    def __init__(self, spec: Specification):
+        self.spec = spec
+        # (path, METHOD) -> endpoint.
+        self.static_routes = {}
+        # METHOD -> [(pattern, endpoint, converters of path parameters)].
+        self.dynamic_routes = {}
+
+        for operation_id, (route, method) in spec.operation_routes.items():
+            params_schema = spec.resolved_spec['paths'][route][method].get('parameters')
+            if params_schema and '{' in route and '}' in route:
+                self._add_dynamic_route(route, method.upper(), operation_id, params_schema)
+            else:
+                self.static_routes[(route, method.upper())] = operation_id
+
+        # Routes with less parameters are matched first, like rules of Flask.
+        for routes in self.dynamic_routes.values():
+            routes.sort(key=lambda dynamic_route: len(dynamic_route[2]))
+
+    def _add_dynamic_route(
+        self, route: str, method: str, endpoint: str, params_schema: dict
+    ) -> None:
+        converters = {}
+        pattern = ''
+        for part in re.split(r'({\S*?})', route):
+            if part.startswith('{') and part.endswith('}'):
+                name = part[1:-1]
+                param_type = params_schema['view_args']['properties'][name]['type']
+                regex, converters[name] = self.PATH_PARAMETERS_TYPES[param_type]
+                pattern += f'(?P<{name}>{regex})'
+            else:
+                pattern += re.escape(part)
+        self.dynamic_routes.setdefault(method, []).append(
+            (re.compile(pattern), endpoint, converters)
+        )
+
+    def match(self, path: str, method: str) -> Optional[tuple[str, dict]]:
+        """Endpoint and path parameters of request, `None` if route is not found."""
+        endpoint = self.static_routes.get((path, method))
+        if endpoint is not None:
+            return endpoint, {}
+
+        for pattern, endpoint, converters in self.dynamic_routes.get(method, ()):
+            match = pattern.fullmatch(path)
+            if match is not None:
+                view_args = {
+                    name: converters[name](value) for name, value in match.groupdict().items()
+                }
+                return endpoint, view_args
+        return None
+
+
+class FirstWSGIMiddleware:
+    """
+    Validate requests to registered operations before Flask and return response with HTTP code 400
+    for invalid requests. Valid requests are passed to application with serialized data, so they are
+    not validated again:
+
+        app.wsgi_app = FirstWSGIMiddleware(app.wsgi_app, first)
+    """
+
+    def __init__(self, wsgi_app: Callable, first: First):
+        self.wsgi_app = wsgi_app
+        self.first = first
+        self._route_matcher = RouteMatcher(first.spec)
+
+    @property
+    def route_matcher(self) -> RouteMatcher:
+        """Routes of the current specification, they are made again after its reloading."""
+        spec = self.first.spec
+        if self._route_matcher.spec is not spec:
+            self._route_matcher = RouteMatcher(spec)
+        return self._route_matcher
+
+    def make_error_response(self, error: Exception) -> Response:
+        """Response for invalid request, can be overridden for other format of errors."""
+        return Response(
+            json.dumps({'message': str(error)}), status=400, mimetype='application/json'
+        )
+
+    @staticmethod
+    def _read_json(request: Request) -> Any:
+        if not request.is_json:
+            return None
+
+        # Body is read once and passed to application again.
+        data = request.get_data()
+        request.environ['wsgi.input'] = BytesIO(data)
+        request.environ['CONTENT_LENGTH'] = str(len(data))
+        return request.get_json()
+
+    def _validating_request(self, environ: dict) -> Optional[Response]:
+        method = environ['REQUEST_METHOD']
+        # The same requests are validated as by view functions registered in `First`.
+        if environ.get('CONTENT_TYPE') != 'application/json' and method != 'GET':
+            return None
+
+        request = Request(environ)
+        # Body bigger than allowed by application is not read.
+        request.max_content_length = self.first.app.config.get('MAX_CONTENT_LENGTH')
+        matched = self.route_matcher.match(request.path, method)
+        if matched is None:
+            return None
+
+        endpoint, view_args = matched
+        operation = self.first._operations.get((endpoint, method))
+        if operation is None:
+            return None
+
+        try:
+            serialized_request = self.first._serialize_request(
+                operation,
+                request,
+                view_args=view_args,
+                json=self._read_json(request),
+            )
+        except RequestEntityTooLarge as e:
+            return e.get_response(environ)
+        except (FirstValidation, BadRequest) as e:
+            return self.make_error_response(e)
+
+        environ[SERIALIZED_REQUEST_ENVIRON_KEY] = (endpoint, serialized_request)
+        return None
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        error_response = self._validating_request(environ)
+        if error_response is not None:
+            return error_response(environ, start_response)
+        return self.wsgi_app(environ, start_response)
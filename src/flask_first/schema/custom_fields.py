@@ -1,70 +1,127 @@
+from typing import Any
+from typing import Optional
+
 from marshmallow import EXCLUDE
 from marshmallow import fields
+from marshmallow import Schema
 from marshmallow import ValidationError
 from marshmallow.base import SchemaABC
 
 
-class AllOf(fields.Field):
+class MultipleSchemasField(fields.Field):
+    """
+    Base field for data validated via several schemas. Every schema loads the value once and its
+    result is kept.
+    """
+
+    unknown = None
+
     def __init__(self, *nested: SchemaABC):
         self.nested = nested
+        self._schemas: Optional[tuple[Schema, ...]] = None
         super().__init__()
 
+    @property
+    def schemas(self) -> tuple[Schema, ...]:
+        """Instances of nested schemas. They are made once and are used for all values."""
+        if self._schemas is None:
+            kwargs = {'unknown': self.unknown} if self.unknown else {}
+            self._schemas = tuple(schema(**kwargs) for schema in self.nested)
+        return self._schemas
+
+    @staticmethod
+    def _load(schema: Schema, value: Any) -> tuple[Any, Optional[ValidationError]]:
+        try:
+            return schema.load(value), None
+        except ValidationError as e:
+            return None, e
+
+
+class DiscriminatedSchemasField(MultipleSchemasField):
+    """
+    Field with schema chosen by value of discriminator property, values are mapped to indexes of
+    schemas. Values not found in mapping are validated via all schemas.
+    """
+
+    def __init__(
+        self,
+        *nested: SchemaABC,
+        discriminator: Optional[str] = None,
+        discriminator_branches: Optional[dict[str, int]] = None,
+    ):
+        self.discriminator = discriminator
+        self.discriminator_branches = discriminator_branches or {}
+        super().__init__(*nested)
+
+    def _get_discriminated_schema(self, value: Any) -> Optional[Schema]:
+        if self.discriminator is None or not isinstance(value, dict):
+            return None
+
+        discriminator_value = value.get(self.discriminator)
+        if not isinstance(discriminator_value, str):
+            return None
+
+        index = self.discriminator_branches.get(discriminator_value)
+        if index is None:
+            return None
+        return self.schemas[index]
+
+    def _deserialize_discriminated(self, value: Any) -> Any:
+        schema = self._get_discriminated_schema(value)
+        if schema is None:
+            return ...
+
+        serialized_data, error = self._load(schema, value)
+        if error is not None:
+            raise ValidationError(
+                f'The value <{value}> does not match schema of <{self.discriminator}>'
+                f' <{value[self.discriminator]}>.'
+            )
+        return serialized_data
+
+
+class AllOf(MultipleSchemasField):
+    unknown = EXCLUDE
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        serialized_data = {}
+        for schema in self.schemas:
+            loaded, error = self._load(schema, value)
+            if error is not None:
+                raise ValidationError(f'The value <{value}> does not match all schemas.')
+            serialized_data = {**serialized_data, **loaded}
+        return serialized_data
+
+
+class AnyOf(DiscriminatedSchemasField):
     def _deserialize(self, value, attr, data, **kwargs):
-        errors = []
-        valid_schemas = []
-        for schema in self.nested:
-            error = schema(unknown=EXCLUDE).validate(value)
-            if error:
-                errors.append(error)
-            else:
-                valid_schemas.append(schema)
-
-        if not errors:
-            serialized_data = {}
-            for schema in valid_schemas:
-                serialized_data = {**serialized_data, **schema(unknown=EXCLUDE).load(value)}
+        serialized_data = self._deserialize_discriminated(value)
+        if serialized_data is not ...:
             return serialized_data
-        else:
-            raise ValidationError(f'The value <{value}> does not match all schemas.')
 
+        for schema in self.schemas:
+            serialized_data, error = self._load(schema, value)
+            if error is None:
+                return serialized_data
 
-class AnyOf(fields.Field):
-    def __init__(self, *nested: SchemaABC):
-        self.nested = nested
-        super().__init__()
+        raise ValidationError(f'The value <{value}> does not match any schema.')
 
-    def _deserialize(self, value, attr, data, **kwargs):
-        errors = []
-        valid_schemas = []
-        for schema in self.nested:
-            error = schema().validate(value)
-            if error:
-                errors.append(error)
-            else:
-                valid_schemas.append(schema)
-
-        if valid_schemas:
-            return valid_schemas[0]().load(value)
-        else:
-            raise ValidationError(f'The value <{value}> does not match any schema.')
-
-
-class OneOf(fields.Field):
-    def __init__(self, *nested: SchemaABC):
-        self.nested = nested
-        super().__init__()
 
+class OneOf(DiscriminatedSchemasField):
     def _deserialize(self, value, attr, data, **kwargs):
-        errors = []
-        valid_schemas = []
-        for schema in self.nested:
-            error = schema().validate(value)
-            if error:
-                errors.append(error)
-            else:
-                valid_schemas.append(schema)
-
-        if len(valid_schemas) == 1:
-            return valid_schemas[0]().load(value)
-        else:
+        serialized_data = self._deserialize_discriminated(value)
+        if serialized_data is not ...:
+            return serialized_data
+
+        matched = False
+        for schema in self.schemas:
+            loaded, error = self._load(schema, value)
+            if error is None:
+                if matched:
+                    raise ValidationError(f'The value <{value}> does not match one schema.')
+                matched = True
+                serialized_data = loaded
+
+        if not matched:
             raise ValidationError(f'The value <{value}> does not match one schema.')
+        return serialized_data
@@ -0,0 +1,353 @@
+"""
+Compiling of OpenAPI schemas into Python functions.
+
+Compiled function loads data the same way as the marshmallow schema made by `schema_maker` from
+the same OpenAPI schema, but via straight-line code. Function only accepts data which it loads
+exactly as marshmallow does, for any other data it raises `Fallback` and data is loaded via
+marshmallow schema. So results and errors of both ways are always the same.
+"""
+
+import re
+import uuid
+from collections.abc import Callable
+from datetime import timezone
+from typing import Any
+from typing import Optional
+
+from marshmallow import fields
+from marshmallow import RAISE
+from marshmallow import ValidationError
+
+from .schema_maker import FIELDS_VIA_FORMATS
+from .schema_maker import MULTI_SCHEMA_FIELDS
+
+
+class Fallback(Exception):
+    """Data can not be loaded by compiled function and must be loaded via marshmallow schema."""
+
+
+MISSING = object()
+TRUTHY = fields.Boolean.truthy
+FALSY = fields.Boolean.falsy
+
+
+class CompiledLoader:
+    """Load data via compiled function, data not accepted by it is loaded via `fallback`."""
+
+    __slots__ = ('function', 'fallback')
+
+    def __init__(self, function: Callable[[Any], Any], fallback: Callable[[Any], Any]):
+        self.function = function
+        self.fallback = fallback
+
+    def load(self, data: Any) -> Any:
+        try:
+            return self.function(data)
+        except Fallback:
+            return self.fallback(data)
+
+
+class _FunctionBuilder:
+    def __init__(self, datetime_format: Optional[str]):
+        self.datetime_format = datetime_format
+        self.lines = []
+        self.namespace = {
+            'Fallback': Fallback,
+            'MISSING': MISSING,
+            'UUID': uuid.UUID,
+            'ValidationError': ValidationError,
+            'TRUTHY': TRUTHY,
+            'FALSY': FALSY,
+        }
+        # Python expressions making constants of function, for writing function as source.
+        self.constants = {}
+        self._counter = 0
+
+    def name(self, prefix: str) -> str:
+        self._counter += 1
+        return f'{prefix}{self._counter}'
+
+    def const(self, value: Any, prefix: str = 'c', source: Optional[str] = None) -> str:
+        name = self.name(prefix)
+        self.namespace[name] = value
+        self.constants[name] = repr(value) if source is None else source
+        return name
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append('    ' * indent + line)
+
+    def fallback(self, indent: int) -> None:
+        self.emit(indent, 'raise Fallback')
+
+    def field(self, schema: dict, src: str, dst: str, indent: int, as_nested: bool = False) -> None:
+        """Mirror of `make_marshmallow_schema`."""
+        if 'nullable' in schema and schema.get('type', ...) is ...:
+            self.fallback(indent)
+        elif any(keyword in schema for keyword in MULTI_SCHEMA_FIELDS):
+            self.fallback(indent)
+        elif schema.get('format'):
+            self._nullable(schema, src, dst, indent, self._format, schema['format'])
+        elif schema.get('type') == 'object' and schema.get('properties') is not None:
+            if as_nested:
+                self._nullable(schema, src, dst, indent, self.object, schema, RAISE)
+            else:
+                self.object(schema, RAISE, src, dst, indent)
+        elif schema.get('type') == 'array':
+            self._nullable(schema, src, dst, indent, self._array, schema)
+        elif schema.get('type') in self.SCALARS:
+            self._nullable(schema, src, dst, indent, self._scalar, schema, True)
+        else:
+            self.fallback(indent)
+
+    def _nullable(self, schema: dict, src: str, dst: str, indent: int, make, *args) -> None:
+        self.emit(indent, f'if {src} is None:')
+        if schema.get('nullable'):
+            self.emit(indent + 1, f'{dst} = None')
+        else:
+            self.fallback(indent + 1)
+        self.emit(indent, 'else:')
+        make(*args, src, dst, indent + 1)
+
+    def object(self, schema: dict, unknown: str, src: str, dst: str, indent: int) -> None:
+        """Mirror of `_make_object_field`."""
+        counter = self.name('n')
+        self.emit(indent, f'if type({src}) is not dict:')
+        self.fallback(indent + 1)
+        self.emit(indent, f'{dst} = {{}}')
+        if unknown == RAISE:
+            self.emit(indent, f'{counter} = 0')
+
+        required = schema.get('required', ())
+        for field_name, field_schema in schema['properties'].items():
+            value = self.name('v')
+            result = self.name('r')
+            key = repr(field_name)
+            self.emit(indent, f'{value} = {src}.get({key}, MISSING)')
+            self.emit(indent, f'if {value} is not MISSING:')
+            if unknown == RAISE:
+                self.emit(indent + 1, f'{counter} += 1')
+
+            if (
+                field_schema.get('additionalProperties')
+                and isinstance(field_schema['additionalProperties'], dict)
+                and field_schema['additionalProperties'].get('oneOf')
+            ):
+                self.emit(indent + 1, f'if {value} is None:')
+                self.fallback(indent + 2)
+                self.emit(indent + 1, f'{result} = {value}')
+            else:
+                self.field(
+                    field_schema,
+                    value,
+                    result,
+                    indent + 1,
+                    as_nested=field_schema.get('type') == 'object',
+                )
+            self.emit(indent + 1, f'{dst}[{key}] = {result}')
+
+            if field_name in required:
+                self.emit(indent, 'else:')
+                self.fallback(indent + 1)
+
+        if unknown == RAISE:
+            self.emit(indent, f'if {counter} != len({src}):')
+            self.fallback(indent + 1)
+
+    def _array(self, schema: dict, src: str, dst: str, indent: int) -> None:
+        """Mirror of `_make_array_field`."""
+        items = schema.get('items') or {}
+        item = self.name('i')
+        result = self.name('r')
+        self.emit(indent, f'if type({src}) is not list:')
+        self.fallback(indent + 1)
+        self.emit(indent, f'{dst} = []')
+        self.emit(indent, f'for {item} in {src}:')
+
+        # Items of array are never nullable and have no validators, as in marshmallow schema.
+        if items.get('type') == 'object' and items.get('properties') is not None:
+            self.object(items, RAISE, item, result, indent + 1)
+        elif items.get('format') in FIELDS_VIA_FORMATS:
+            self.emit(indent + 1, f'if {item} is None:')
+            self.fallback(indent + 2)
+            self._format(items['format'], item, result, indent + 1)
+        elif items.get('type') in self.SCALARS:
+            self.emit(indent + 1, f'if {item} is None:')
+            self.fallback(indent + 2)
+            self._scalar(items, False, item, result, indent + 1)
+        else:
+            self.fallback(indent + 1)
+        self.emit(indent + 1, f'{dst}.append({result})')
+
+    def _format(self, data_format: str, src: str, dst: str, indent: int) -> None:
+        if data_format not in FIELDS_VIA_FORMATS:
+            self.fallback(indent)
+        elif data_format == 'uuid':
+            self.emit(indent, f'if type({src}) is not str:')
+            self.fallback(indent + 1)
+            self.emit(indent, 'try:')
+            self.emit(indent + 1, f'{dst} = UUID({src})')
+            self.emit(indent, 'except ValueError:')
+            self.fallback(indent + 1)
+        else:
+            if data_format == 'date-time':
+                field = FIELDS_VIA_FORMATS['date-time'](
+                    format=self.datetime_format, default_timezone=timezone.utc
+                )
+                source = (
+                    f"FIELDS_VIA_FORMATS['date-time']"
+                    f'(format={self.datetime_format!r}, default_timezone=timezone.utc)'
+                )
+            else:
+                field = FIELDS_VIA_FORMATS[data_format]()
+                source = f'FIELDS_VIA_FORMATS[{data_format!r}]()'
+            field_name = self.const(field, prefix='f', source=source)
+            self.emit(indent, 'try:')
+            self.emit(indent + 1, f'{dst} = {field_name}.deserialize({src})')
+            self.emit(indent, 'except ValidationError:')
+            self.fallback(indent + 1)
+
+    def _scalar(self, schema: dict, with_validators: bool, src: str, dst: str, indent: int) -> None:
+        """Mirror of `FIELDS_VIA_TYPES` fields and `_make_field_validators`."""
+        data_type = schema['type']
+        if data_type == 'string':
+            self.emit(indent, f'if type({src}) is not str:')
+            self.fallback(indent + 1)
+            self.emit(indent, f'{dst} = {src}')
+        elif data_type == 'integer':
+            self.emit(indent, f'if type({src}) is int:')
+            self.emit(indent + 1, f'{dst} = {src}')
+            self.emit(indent, f'elif type({src}) is str:')
+            self.emit(indent + 1, 'try:')
+            self.emit(indent + 2, f'{dst} = int({src})')
+            self.emit(indent + 1, 'except ValueError:')
+            self.fallback(indent + 2)
+            self.emit(indent, 'else:')
+            self.fallback(indent + 1)
+        elif data_type == 'number':
+            self.emit(indent, f'if type({src}) is float:')
+            self.emit(indent + 1, f'{dst} = {src}')
+            self.emit(indent, f'elif type({src}) is int or type({src}) is str:')
+            self.emit(indent + 1, 'try:')
+            self.emit(indent + 2, f'{dst} = float({src})')
+            self.emit(indent + 1, 'except (ValueError, OverflowError):')
+            self.fallback(indent + 2)
+            self.emit(indent, 'else:')
+            self.fallback(indent + 1)
+            # Special values `nan` and `inf` are not allowed.
+            self.emit(indent, f'if {dst} - {dst} != 0.0:')
+            self.fallback(indent + 1)
+        elif data_type == 'boolean':
+            self.emit(indent, 'try:')
+            self.emit(indent + 1, f'if {src} in TRUTHY:')
+            self.emit(indent + 2, f'{dst} = True')
+            self.emit(indent + 1, f'elif {src} in FALSY:')
+            self.emit(indent + 2, f'{dst} = False')
+            self.emit(indent + 1, 'else:')
+            self.fallback(indent + 2)
+            self.emit(indent, 'except TypeError:')
+            self.fallback(indent + 1)
+
+        if with_validators:
+            self._validators(schema, dst, indent)
+
+    def _validators(self, schema: dict, value: str, indent: int) -> None:
+        conditions = []
+        if schema['type'] == 'string':
+            if schema.get('minLength') is not None:
+                conditions.append(f'len({value}) < {schema["minLength"]!r}')
+            if schema.get('maxLength') is not None:
+                conditions.append(f'len({value}) > {schema["maxLength"]!r}')
+            if schema.get('pattern'):
+                regex = self.const(
+                    re.compile(schema['pattern']),
+                    prefix='re',
+                    source=f"re.compile({schema['pattern']!r})",
+                )
+                conditions.append(f'{regex}.match({value}) is None')
+
+        if schema['type'] in ('integer', 'number'):
+            if schema.get('minimum') is not None:
+                conditions.append(f'{value} < {self.const(schema["minimum"])}')
+            if schema.get('maximum') is not None:
+                conditions.append(f'{value} > {self.const(schema["maximum"])}')
+
+        if schema.get('enum'):
+            conditions.append(f'{value} not in {self.const(schema["enum"])}')
+
+        for condition in conditions:
+            self.emit(indent, f'if {condition}:')
+            self.fallback(indent + 1)
+
+    SCALARS = ('string', 'integer', 'number', 'boolean')
+
+
+def _build_function(
+    schema: dict, unknown: str, datetime_format: Optional[str]
+) -> Optional[_FunctionBuilder]:
+    if not isinstance(schema, dict) or any(keyword in schema for keyword in MULTI_SCHEMA_FIELDS):
+        return None
+
+    if schema.get('type') == 'object' and schema.get('properties') is None:
+        return None
+
+    builder = _FunctionBuilder(datetime_format)
+    builder.emit(0, 'def load(data):')
+    if schema.get('type') == 'object' and not schema.get('format'):
+        builder.object(schema, unknown, 'data', 'result', 1)
+    else:
+        builder.field(schema, 'data', 'result', 1)
+    builder.emit(1, 'return result')
+    return builder
+
+
+def compile_schema(
+    schema: dict, unknown: str = RAISE, datetime_format: Optional[str] = None
+) -> Optional[Callable[[Any], Any]]:
+    """
+    Compile OpenAPI schema into function loading data. Function loads data as marshmallow schema
+    made by `make_marshmallow_schema` loaded with `unknown`. Returns `None` for schemas which are
+    always loaded via marshmallow.
+    """
+    builder = _build_function(schema, unknown, datetime_format)
+    if builder is None:
+        return None
+
+    source = '\n'.join(builder.lines)
+    # Source is generated from the specification only, it contains no data from requests.
+    exec(compile(source, '<flask_first compiled schema>', 'exec'), builder.namespace)  # nosec
+    function = builder.namespace['load']
+    function.source = source
+    return function
+
+
+def make_function_factory_source(
+    schema: dict, name: str, unknown: str = RAISE, datetime_format: Optional[str] = None
+) -> Optional[str]:
+    """
+    Make source of function `name` returning function compiled from OpenAPI schema. Source needs
+    names imported in `FACTORY_SOURCE_IMPORTS`.
+    """
+    builder = _build_function(schema, unknown, datetime_format)
+    if builder is None:
+        return None
+
+    lines = [f'def {name}():']
+    lines.extend(f'    {constant} = {source}' for constant, source in builder.constants.items())
+    lines.extend(f'    {line}' for line in builder.lines)
+    lines.append('    return load')
+    return '\n'.join(lines)
+
+
+FACTORY_SOURCE_IMPORTS = """\
+import datetime
+import re
+from datetime import timezone
+from uuid import UUID
+
+from flask_first.schema.schema_compiler import FALSY
+from flask_first.schema.schema_compiler import Fallback
+from flask_first.schema.schema_compiler import MISSING
+from flask_first.schema.schema_compiler import TRUTHY
+from flask_first.schema.schema_maker import FIELDS_VIA_FORMATS
+from marshmallow import ValidationError
+"""
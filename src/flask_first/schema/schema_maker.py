@@ -1,3 +1,5 @@
+import json
+from collections.abc import Callable
 from datetime import timezone
 from typing import Any
 from typing import Optional
@@ -11,6 +13,7 @@ from marshmallow.fields import Boolean
 from marshmallow.fields import Field
 from marshmallow.fields import Nested
 
+from ..first.identity_memo import IdentityMemo
 from .custom_fields import AllOf
 from .custom_fields import AnyOf
 from .custom_fields import OneOf
@@ -57,30 +60,103 @@ class HashmapSchema(Schema):
         unknown = INCLUDE
 
 
-def _make_object_field(
-    schema: dict, as_nested: bool = True, datetime_format: Optional[str] = None
-) -> fields.Nested or type:
-    fields_obj = {}
-    for field_name, field_schema in schema['properties'].items():
-        if (
-            field_schema.get('additionalProperties')
-            and isinstance(field_schema['additionalProperties'], dict)
-            and field_schema['additionalProperties'].get('oneOf')
-        ):
-            field = HashmapField()
-        elif field_schema['type'] == 'object':
-            field = make_marshmallow_schema(
-                field_schema, as_nested=True, datetime_format=datetime_format
-            )
-        else:
-            field = make_marshmallow_schema(field_schema, datetime_format=datetime_format)
-
-        if field_name in schema.get('required', ()):
-            field.required = True
+class SchemasCache:
+    """
+    Storage of schema classes made from OpenAPI schemas. Equal OpenAPI schemas, for example the same
+    component from `$ref` in several operations, are made into one schema class.
+    """
+
+    def __init__(self):
+        self._schemas_by_id = IdentityMemo()
+        self._schemas_by_key = {}
+        self._instances = {}
+        self._discriminator_branches = {}
+
+    @staticmethod
+    def _make_key(schema: dict or list) -> str:
+        return json.dumps(schema, sort_keys=True, default=str)
+
+    def get_or_make(self, kind: str, schema: dict or list, make: Callable[[], type]) -> type:
+        schema_class = self._schemas_by_id.get(schema, kind)
+        if schema_class is not IdentityMemo.MISSING:
+            return schema_class
+
+        key = (kind, self._make_key(schema))
+        schema_class = self._schemas_by_key.get(key)
+        if schema_class is None:
+            schema_class = self._schemas_by_key[key] = make()
+
+        self._schemas_by_id.set(schema, schema_class, kind)
+        return schema_class
+
+    def set_discriminator_branches(self, discriminator_branches: dict[int, tuple]) -> None:
+        """
+        Set indexes of branches of schemas with discriminator found by resolver of links:
+        `id` of schema -> (schema, value of discriminator -> index of branch).
+        """
+        self._discriminator_branches = discriminator_branches
+
+    def get_discriminator_branches(self, schema: dict) -> Optional[dict[str, int]]:
+        _, discriminator_branches = self._discriminator_branches.get(id(schema), (None, None))
+        return discriminator_branches
+
+    def fork(self) -> 'SchemasCache':
+        """New cache with the same schema classes, sources of schemas are not kept in it."""
+        schemas_cache = SchemasCache()
+        schemas_cache._schemas_by_key = dict(self._schemas_by_key)
+        schemas_cache._instances = dict(self._instances)
+        return schemas_cache
+
+    def get_instance(self, schema_class: type[Schema], **kwargs) -> Schema:
+        """
+        Get instance of schema class, made once for every set of arguments. Instances are shared
+        between requests and threads, loading of data does not change them.
+        """
+        key = (schema_class, tuple(sorted(kwargs.items())))
+        instance = self._instances.get(key)
+        if instance is None:
+            instance = self._instances[key] = schema_class(**kwargs)
+        return instance
 
-        fields_obj[field_name] = field
 
-    schema_object = Schema.from_dict(fields_obj)
+def _make_object_field(
+    schema: dict,
+    as_nested: bool = True,
+    datetime_format: Optional[str] = None,
+    schemas_cache: Optional[SchemasCache] = None,
+) -> fields.Nested or type:
+    def make_schema_object() -> type:
+        fields_obj = {}
+        for field_name, field_schema in schema['properties'].items():
+            if (
+                field_schema.get('additionalProperties')
+                and isinstance(field_schema['additionalProperties'], dict)
+                and field_schema['additionalProperties'].get('oneOf')
+            ):
+                field = HashmapField()
+            elif field_schema['type'] == 'object':
+                field = make_marshmallow_schema(
+                    field_schema,
+                    as_nested=True,
+                    datetime_format=datetime_format,
+                    schemas_cache=schemas_cache,
+                )
+            else:
+                field = make_marshmallow_schema(
+                    field_schema, datetime_format=datetime_format, schemas_cache=schemas_cache
+                )
+
+            if field_name in schema.get('required', ()):
+                field.required = True
+
+            fields_obj[field_name] = field
+
+        return Schema.from_dict(fields_obj)
+
+    if schemas_cache is None:
+        schema_object = make_schema_object()
+    else:
+        schema_object = schemas_cache.get_or_make('object', schema, make_schema_object)
 
     if as_nested:
         return fields.Nested(schema_object)
@@ -88,11 +164,17 @@ def _make_object_field(
         return schema_object
 
 
-def _make_array_field(schema: dict, datetime_format: Optional[str] = None) -> fields.Field:
+def _make_array_field(
+    schema: dict,
+    datetime_format: Optional[str] = None,
+    schemas_cache: Optional[SchemasCache] = None,
+) -> fields.Field:
     data_type = schema['items']['type']
     data_format = schema['items'].get('format')
     if data_type == 'object':
-        nested_field = _make_object_field(schema['items'], datetime_format=datetime_format)
+        nested_field = _make_object_field(
+            schema['items'], datetime_format=datetime_format, schemas_cache=schemas_cache
+        )
         nested_field.many = True
         field = nested_field
     elif data_format in FIELDS_VIA_FORMATS:
@@ -110,10 +192,41 @@ def _make_array_field(schema: dict, datetime_format: Optional[str] = None) -> fi
     return field
 
 
-def _make_multiple_field(schemas: list, field_name: str) -> type:
-    schemas = (make_marshmallow_schema(schema) for schema in schemas)
-    fields_map = {'oneOf': OneOf, 'anyOf': AnyOf, 'allOf': AllOf}
-    return Schema.from_dict({field_name: fields_map[field_name](*schemas)})
+def _make_multiple_field(
+    parent_schema: dict,
+    field_name: str,
+    datetime_format: Optional[str] = None,
+    schemas_cache: Optional[SchemasCache] = None,
+) -> type:
+    schemas = parent_schema[field_name]
+    discriminator_branches = None
+    if schemas_cache is not None and field_name != 'allOf':
+        discriminator_branches = schemas_cache.get_discriminator_branches(parent_schema)
+
+    def make_schema_object() -> type:
+        nested = (
+            make_marshmallow_schema(
+                schema, datetime_format=datetime_format, schemas_cache=schemas_cache
+            )
+            for schema in schemas
+        )
+        kwargs = {}
+        if discriminator_branches:
+            kwargs = {
+                'discriminator': parent_schema['discriminator']['propertyName'],
+                'discriminator_branches': discriminator_branches,
+            }
+        fields_map = {'oneOf': OneOf, 'anyOf': AnyOf, 'allOf': AllOf}
+        return Schema.from_dict({field_name: fields_map[field_name](*nested, **kwargs)})
+
+    if schemas_cache is None:
+        return make_schema_object()
+    if discriminator_branches:
+        # Schemas with discriminator are made with indexes of their branches.
+        kind = f'{field_name} {json.dumps(discriminator_branches, sort_keys=True)}'
+        return schemas_cache.get_or_make(kind, parent_schema, make_schema_object)
+    # Other schemas are shared by their branches.
+    return schemas_cache.get_or_make(field_name, schemas, make_schema_object)
 
 
 def _make_field_validators(schema: dict) -> list[validate.Validator]:
@@ -135,16 +248,19 @@ def _make_field_validators(schema: dict) -> list[validate.Validator]:
 
 
 def make_marshmallow_schema(
-    schema: dict, as_nested: bool = False, datetime_format: Optional[str] = None
+    schema: dict,
+    as_nested: bool = False,
+    datetime_format: Optional[str] = None,
+    schemas_cache: Optional[SchemasCache] = None,
 ) -> type[HashmapSchema] or Field or Nested or type or Boolean or Any:
     if 'nullable' in schema and schema.get('type', ...) is ...:
         field = FIELDS_VIA_TYPES['boolean']()
     elif 'allOf' in schema:
-        field = _make_multiple_field(schema['allOf'], 'allOf')
+        field = _make_multiple_field(schema, 'allOf', datetime_format, schemas_cache)
     elif 'anyOf' in schema:
-        field = _make_multiple_field(schema['anyOf'], 'anyOf')
+        field = _make_multiple_field(schema, 'anyOf', datetime_format, schemas_cache)
     elif 'oneOf' in schema:
-        field = _make_multiple_field(schema['oneOf'], 'oneOf')
+        field = _make_multiple_field(schema, 'oneOf', datetime_format, schemas_cache)
     elif schema.get('format'):
         if schema['format'] == 'date-time':
             field = FIELDS_VIA_FORMATS['date-time'](
@@ -160,9 +276,16 @@ def make_marshmallow_schema(
     ):
         field = HashmapSchema
     elif schema['type'] == 'object':
-        field = _make_object_field(schema, as_nested=as_nested, datetime_format=datetime_format)
+        field = _make_object_field(
+            schema,
+            as_nested=as_nested,
+            datetime_format=datetime_format,
+            schemas_cache=schemas_cache,
+        )
     elif schema['type'] == 'array':
-        field = _make_array_field(schema, datetime_format=datetime_format)
+        field = _make_array_field(
+            schema, datetime_format=datetime_format, schemas_cache=schemas_cache
+        )
     else:
         field = FIELDS_VIA_TYPES[schema['type']]()
 
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from pathlib import Path
 
 from flask import Blueprint
@@ -8,7 +9,9 @@ from flask import url_for
 from .first.specification import Specification
 
 
-def add_swagger_ui_blueprint(app: Flask, spec: Specification, swagger_ui_path: str or Path) -> None:
+def add_swagger_ui_blueprint(
+    app: Flask, get_spec: Callable[[], Specification], swagger_ui_path: str or Path
+) -> None:
     swagger_ui = Blueprint(
         'swagger_ui',
         __name__,
@@ -27,6 +30,6 @@ def add_swagger_ui_blueprint(app: Flask, spec: Specification, swagger_ui_path: s
 
     @swagger_ui.route('/openapi.json')
     def get_file_spec():
-        return spec.raw_spec
+        return get_spec().raw_spec
 
     app.register_blueprint(swagger_ui)
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+import yaml
+from flask import Flask
+from flask_first import First
+
+from src.flask_first.first.loaders import load_from_file
+from src.flask_first.first.loaders import load_from_json
+from src.flask_first.first.loaders.yaml_loader import SafeLoader
+from tests.conftest import BASEDIR
+
+
+def _yaml_spec_to_json(tmp_path: Path, yaml_spec_path: Path) -> Path:
+    with open(yaml_spec_path) as f:
+        spec = yaml.safe_load(f)
+
+    json_spec_path = Path(tmp_path, 'openapi.json')
+    with open(json_spec_path, 'w') as f:
+        json.dump(spec, f)
+
+    return json_spec_path
+
+
+def test_loaders__json__same_as_yaml(tmp_path):
+    yaml_spec_path = Path(BASEDIR, 'specs/v3.1.0/ref.openapi.yaml')
+    json_spec_path = _yaml_spec_to_json(tmp_path, yaml_spec_path)
+
+    assert load_from_json(json_spec_path) == load_from_file(yaml_spec_path)
+    assert load_from_file(json_spec_path) == load_from_file(yaml_spec_path)
+
+
+def test_loaders__json__yaml_referenced_file(tmp_path):
+    Path(tmp_path, 'openapi.json').write_text(
+        json.dumps(
+            {
+                'openapi': '3.1.0',
+                'info': {'title': 'Mixed files', 'version': '1.0.0'},
+                'paths': {'/endpoint': {'$ref': 'paths.yaml#/Endpoint'}},
+            }
+        )
+    )
+    Path(tmp_path, 'paths.yaml').write_text(
+        yaml.dump({'Endpoint': {'get': {'responses': {'200': {'description': 'OK'}}}}})
+    )
+
+    spec = load_from_file(Path(tmp_path, 'openapi.json'))
+    assert spec['paths']['/endpoint'] == {'get': {'responses': {'200': {'description': 'OK'}}}}
+
+
+def test_loaders__json__app(tmp_path):
+    json_spec_path = _yaml_spec_to_json(tmp_path, Path(BASEDIR, 'specs/v3.1.0/mini.openapi.yaml'))
+
+    app = Flask('json_spec')
+    first = First(json_spec_path, app)
+
+    def mini_endpoint() -> dict:
+        return {'message': 'OK'}
+
+    first.add_view_func(mini_endpoint)
+
+    r = app.test_client().get('/mini_endpoint')
+    assert r.status_code == 200
+    assert r.json == {'message': 'OK'}
+
+
+def test_loaders__yaml__libyaml_loader():
+    assert SafeLoader is getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
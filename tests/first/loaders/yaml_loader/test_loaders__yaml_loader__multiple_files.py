@@ -2,6 +2,7 @@ import pytest
 
 from src.flask_first.first.exceptions import FirstYAMLReaderError
 from src.flask_first.first.loaders.yaml_loader import load_from_yaml
+from src.flask_first.first.loaders.yaml_loader import YAMLReader
 
 
 def test_loaders__yaml__multiple__response_ref(fx_spec_minimal, fx_spec_as_file):
@@ -33,6 +34,46 @@ def test_loader__internal__multiple__non_exist_file(fx_spec_minimal, fx_spec_as_
     assert str(e.value) == f'No such file or directory: <{non_exist_file_name}>'
 
 
+def test_loader__internal__multiple__first_non_exist_file(fx_spec_minimal, fx_spec_as_file):
+    fx_spec_minimal['paths'] = {
+        f'/endpoint_{i}': {'$ref': f'non_exist_file_{i}.yaml#/endpoint'} for i in range(10)
+    }
+    spec_file = fx_spec_as_file(fx_spec_minimal, validate=False)
+
+    with pytest.raises(FirstYAMLReaderError) as e:
+        load_from_yaml(spec_file)
+
+    assert str(e.value) == 'No such file or directory: <non_exist_file_0.yaml>'
+
+
+@pytest.mark.parametrize('max_workers', [None, 1, 4])
+def test_loaders__yaml__multiple__parallel(fx_spec_minimal, fx_spec_as_file, max_workers):
+    fx_spec_minimal['paths'] = {}
+    for i in range(10):
+        schema_spec = {'Message': {'type': 'string', 'description': f'Message {i}'}}
+        schema_file = fx_spec_as_file(schema_spec, validate=False, file_name=f'schema_{i}.yaml')
+
+        endpoint_spec = {'endpoint': {'get': {'responses': {'200': {'description': 'OK'}}}}}
+        endpoint_spec['endpoint']['get']['responses']['200']['content'] = {
+            'application/json': {'schema': {'$ref': f'{schema_file.name}#/Message'}}
+        }
+        endpoint_file = fx_spec_as_file(
+            endpoint_spec, validate=False, file_name=f'endpoint_{i}.yaml'
+        )
+        fx_spec_minimal['paths'][f'/endpoint_{i}'] = {'$ref': f'{endpoint_file.name}#/endpoint'}
+    spec_file = fx_spec_as_file(fx_spec_minimal, validate=False)
+
+    reader = YAMLReader(spec_file, max_workers=max_workers).load()
+
+    assert list(reader.store) == [
+        'openapi.yaml',
+        *[f'endpoint_{i}.yaml' for i in range(10)],
+        *[f'schema_{i}.yaml' for i in range(10)],
+    ]
+    for i in range(10):
+        assert reader.store[f'schema_{i}.yaml']['Message']['description'] == f'Message {i}'
+
+
 def test_loaders__yaml__multiple__method_as_ref(fx_spec_minimal, fx_spec_as_file, fx_create_app):
     method_spec = {'CORS': {'summary': 'CORS support'}}
     method_spec_file = fx_spec_as_file(method_spec, validate=False, file_name='CORS.openapi.yaml')
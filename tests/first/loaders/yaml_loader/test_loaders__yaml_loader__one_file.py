@@ -109,3 +109,44 @@ def test_loader__internal__reader__bad_ref(fx_spec_minimal, fx_spec_as_file, bad
         load_from_yaml(spec_file)
 
     assert str(e.value) == f'"$ref" with value <{bad_ref}> is not valid.'
+
+
+def test_loader__internal__resolver__shared_ref(fx_spec_minimal, fx_spec_as_file):
+    schema_ref = {'$ref': '#/components/schemas/Message'}
+    get_operation = fx_spec_minimal['paths']['/endpoint']['get']
+    get_operation['responses']['200']['content']['application/json']['schema'] = schema_ref
+    fx_spec_minimal['paths']['/endpoint']['post'] = deepcopy(get_operation)
+    fx_spec_minimal['paths']['/endpoint']['post']['operationId'] = 'post_endpoint'
+    fx_spec_minimal['components'] = {
+        'schemas': {'Message': {'type': 'object', 'properties': {'message': {'type': 'string'}}}}
+    }
+
+    spec_file = fx_spec_as_file(fx_spec_minimal)
+    spec_obj = load_from_yaml(spec_file)
+
+    def get_schema(method: str) -> dict:
+        response = spec_obj['paths']['/endpoint'][method]['responses']['200']
+        return response['content']['application/json']['schema']
+
+    assert get_schema('get') == fx_spec_minimal['components']['schemas']['Message']
+    assert get_schema('get') is get_schema('post')
+    assert get_schema('get') is spec_obj['components']['schemas']['Message']
+
+
+def test_loader__internal__resolver__circular_ref(fx_spec_minimal, fx_spec_as_file):
+    fx_spec_minimal['paths']['/endpoint']['get']['responses']['200'] = {
+        '$ref': '#/components/responses/First'
+    }
+    fx_spec_minimal['components'] = {
+        'responses': {
+            'First': {'$ref': '#/components/responses/Second'},
+            'Second': {'$ref': '#/components/responses/First'},
+        }
+    }
+
+    spec_file = fx_spec_as_file(fx_spec_minimal, validate=False)
+
+    with pytest.raises(FirstResolverError) as e:
+        load_from_yaml(spec_file)
+
+    assert 'is circular' in str(e.value)
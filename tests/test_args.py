@@ -1,7 +1,9 @@
 from pathlib import Path
 
 import pytest
+from flask import Flask
 from flask import request
+from flask_first import First
 from flask_first.first.exceptions import FirstRequestArgsValidation
 from flask_first.first.exceptions import FirstRequestPathArgsValidation
 
@@ -72,3 +74,53 @@ def test_specification__endpoint_without_args(fx_create_app):
     r = test_client.get('/without_args_endpoint')
     assert r.status_code == 200
     assert r.json['message'] == 'No args.'
+
+
+def test_args__styles(fx_make_spec_file):
+    def query_param(name: str, schema: dict, **kwargs) -> dict:
+        return {'name': name, 'in': 'query', 'schema': schema, **kwargs}
+
+    integers = {'type': 'array', 'items': {'type': 'integer'}}
+    first = First(
+        fx_make_spec_file(
+            parameters=[
+                query_param('ids', integers),
+                query_param('form', integers, explode=False),
+                query_param('space', integers, style='spaceDelimited'),
+                query_param('pipe', integers, style='pipeDelimited'),
+                query_param(
+                    'filter',
+                    {'type': 'object', 'properties': {'min': {'type': 'integer'}}},
+                    style='deepObject',
+                ),
+                query_param(
+                    'point',
+                    {'type': 'object', 'properties': {'x': {'type': 'integer'}}},
+                ),
+            ]
+        ),
+        Flask('styles'),
+    )
+    first.app.debug = True
+
+    def get_endpoint() -> dict:
+        return request.extensions['first']['args']
+
+    first.add_view_func(get_endpoint)
+    client = first.app.test_client()
+
+    r = client.get('/endpoint?ids=1&form=1,2&space=3%204&pipe=5|6&filter[min]=7&x=8')
+    assert r.json == {
+        'ids': [1],
+        'form': [1, 2],
+        'space': [3, 4],
+        'pipe': [5, 6],
+        'filter': {'min': 7},
+        'point': {'x': 8},
+    }
+    assert client.get('/endpoint?ids=1&ids=2').json == {'ids': [1, 2]}
+
+    with pytest.raises(FirstRequestArgsValidation):
+        client.get('/endpoint?filter[max]=1')
+    with pytest.raises(FirstRequestArgsValidation):
+        client.get('/endpoint?unknown[min]=1')
@@ -0,0 +1,123 @@
+from pathlib import Path
+
+import pytest
+import yaml
+from flask import Flask
+from flask import request
+from flask_first import First
+from flask_first.first import specification
+from flask_first.first.exceptions import FirstRequestJSONValidation
+from flask_first.first.loaders.yaml_loader import YAMLReader
+from flask_first.schema.schema_compiler import CompiledLoader
+
+from .conftest import BASEDIR
+
+
+def _create_first(path_to_spec, validation_engine: str = 'compiled') -> First:
+    app = Flask('artifact')
+    app.debug = True
+    app.config['FIRST_VALIDATION_ENGINE'] = validation_engine
+    first = First(path_to_spec, app)
+
+    def post_endpoint() -> tuple:
+        return request.extensions['first']['json'], 201
+
+    first.add_view_func(post_endpoint)
+    return first
+
+
+def _compile(spec_path, artifact_path) -> None:
+    app = _create_first(spec_path).app
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=['first', 'compile', '-o', str(artifact_path)])
+    assert result.exit_code == 0, result.output
+
+
+def test_artifact__workers_start_without_loading(fx_make_spec_file, tmp_path, monkeypatch):
+    spec_path = fx_make_spec_file()
+    artifact_path = tmp_path / 'artifact.py'
+    _compile(spec_path, artifact_path)
+
+    def fail_loading(*args, **kwargs):
+        pytest.fail('Specification must be loaded from artifact.')
+
+    monkeypatch.setattr(YAMLReader, 'load', fail_loading)
+    monkeypatch.setattr(specification, 'make_marshmallow_schema', fail_loading)
+    first = _create_first(artifact_path)
+    assert first.spec.path == spec_path
+
+    client = first.app.test_client()
+    r = client.post('/endpoint', json={'message': 'OK'})
+    assert r.status_code == 201
+    assert r.json == {'message': 'OK'}
+
+    operation = first._operations[('post_endpoint', 'POST')]
+    assert isinstance(operation.json_loader, CompiledLoader)
+    assert (
+        operation.json_loader.function
+        is first.spec.prebuilt_validators[('/endpoint', 'post', 'json')]
+    )
+
+    monkeypatch.undo()
+    with pytest.raises(FirstRequestJSONValidation):
+        client.post('/endpoint', json={'message': 1})
+
+
+def test_artifact__stale(fx_make_spec_file, tmp_path):
+    spec_path = fx_make_spec_file()
+    artifact_path = tmp_path / 'artifact.py'
+    _compile(spec_path, artifact_path)
+
+    spec = yaml.safe_load(spec_path.read_text())
+    spec['info']['title'] = 'Changed title'
+    spec_path.write_text(yaml.dump(spec))
+
+    with pytest.warns(UserWarning, match='stale'):
+        first = _create_first(artifact_path)
+    assert first.spec.raw_spec['info']['title'] == 'Changed title'
+    assert not first.spec.prebuilt_validators
+
+
+def test_artifact__shared_refs(fx_make_spec_file, tmp_path):
+    spec_path = fx_make_spec_file()
+    spec = yaml.safe_load(spec_path.read_text())
+    spec['components'] = {'schemas': {'Message': {'type': 'string'}}}
+    spec['paths']['/endpoint']['post']['requestBody']['content']['application/json']['schema'] = {
+        '$ref': '#/components/schemas/Message'
+    }
+    spec_path.write_text(yaml.dump(spec))
+    artifact_path = tmp_path / 'artifact.py'
+    _compile(spec_path, artifact_path)
+
+    # Every file of specification is stored in artifact once, links are resolved at import.
+    assert artifact_path.read_text().count("'$ref': '#/components/schemas/Message'") == 1
+    raw_spec = _create_first(artifact_path).spec.raw_spec
+    request_body = raw_spec['paths']['/endpoint']['post']['requestBody']
+    schema = request_body['content']['application/json']['schema']
+    assert schema is raw_spec['components']['schemas']['Message']
+
+
+def test_artifact__marshmallow_engine(fx_make_spec_file, tmp_path):
+    spec_path = fx_make_spec_file()
+    artifact_path = tmp_path / 'artifact.py'
+    _compile(spec_path, artifact_path)
+
+    first = _create_first(artifact_path, validation_engine='marshmallow')
+    assert not first.spec.prebuilt_validators
+    r = first.app.test_client().post('/endpoint', json={'message': 'OK'})
+    assert r.status_code == 201
+
+
+def test_artifact__not_json_request_body(tmp_path):
+    app = Flask('artifact')
+    app.config['FIRST_VALIDATION_ENGINE'] = 'compiled'
+    First(Path(BASEDIR, 'specs/v3.1.0/files.openapi.yaml'), app)
+    artifact_path = tmp_path / 'artifact.py'
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=['first', 'compile', '-o', str(artifact_path)])
+    assert result.exit_code == 0, result.output
+
+    app = Flask('artifact')
+    app.config['FIRST_VALIDATION_ENGINE'] = 'compiled'
+    spec = First(artifact_path, app).spec
+    assert ('/files', 'post', 'json') not in spec.prebuilt_validators
@@ -1,7 +1,12 @@
 from pathlib import Path
 
 import pytest
+from flask import Flask
 from flask import request
+from flask_first import First
+from flask_first.first import RequestSerializer
+from flask_first.first import Specification
+from flask_first.first.exceptions import FirstEndpointValidation
 
 from .conftest import BASEDIR
 
@@ -35,3 +40,110 @@ def test_specification__non_case_sensitive_url(fx_create_app, url):
 
     r = test_client.get(url)
     assert r.status_code == 404
+
+
+def test_endpoints__dispatch_table(fx_make_spec_file):
+    app = Flask('dispatch_table')
+    first = First(fx_make_spec_file(), app)
+
+    def get_endpoint() -> dict:
+        return {'message': 'OK'}
+
+    def post_endpoint() -> tuple:
+        return request.extensions['first']['json'], 201
+
+    first.add_view_func(get_endpoint)
+    first.add_view_func(post_endpoint)
+
+    operation = first._operations[('post_endpoint', 'POST')]
+    assert (operation.route, operation.method) == ('/endpoint', 'post')
+    assert ('get_endpoint', 'POST') not in first._operations
+
+    with app.test_client() as test_client:
+        assert test_client.get('/endpoint').json == {'message': 'OK'}
+        assert test_client.post('/endpoint', json={'message': 'OK'}).status_code == 201
+
+
+def test_endpoints__serializer_without_operation(fx_make_spec_file):
+    spec = Specification(fx_make_spec_file())
+
+    RequestSerializer(spec, 'POST', '/endpoint', json={'message': 'OK'}).validate()
+
+    with pytest.raises(FirstEndpointValidation):
+        RequestSerializer(spec, 'GET', '/non_exist_endpoint').validate()
+
+
+def test_endpoints__serializer_not_declared_headers(fx_make_spec_file):
+    parameters = [
+        {'name': 'X-Tenant', 'in': 'header', 'schema': {'type': 'string'}},
+        {'name': 'session', 'in': 'cookie', 'schema': {'type': 'string'}},
+    ]
+    spec = Specification(fx_make_spec_file(parameters=parameters))
+
+    serializer = RequestSerializer(
+        spec,
+        'GET',
+        '/endpoint',
+        headers={'Host': 'localhost', 'x-tenant': 'first'},
+        cookies={'session': 'id', 'other': 'value'},
+    )
+    serializer.validate()
+    assert serializer.serialized_headers == {'X-Tenant': 'first'}
+    assert serializer.serialized_cookies == {'session': 'id'}
+
+    spec = Specification(fx_make_spec_file())
+    serializer = RequestSerializer(
+        spec, 'GET', '/endpoint', headers={'Host': 'localhost'}, cookies={'session': 'id'}
+    )
+    serializer.validate()
+    assert serializer.serialized_headers == {}
+    assert serializer.serialized_cookies == {}
+
+
+def test_endpoints__compact_operation(fx_make_spec_file):
+    app = Flask('compact_operation')
+    first = First(fx_make_spec_file(), app)
+
+    def post_endpoint() -> tuple:
+        return request.extensions['first']['json'], 201
+
+    first.add_view_func(post_endpoint)
+    operation = first._operations[('post_endpoint', 'POST')]
+    operation.prepare()
+
+    for obj in (operation, operation.parameters, operation.request_body):
+        assert not hasattr(obj, '__dict__')
+    assert not operation.parameters
+    assert operation.request_body.json_schema is operation.json_schema
+
+    response = operation.responses['201']
+    assert not hasattr(response, '__dict__')
+    assert response.content_types == {'application/json'}
+    assert response.json_schema is not None
+
+    # Nested dicts of the specification stay available for tooling.
+    assert 'responses' in first.spec.deserialized_spec['paths']['/endpoint']['post']
+
+
+def test_endpoints__not_in_spec(fx_make_spec_file, monkeypatch):
+    app = Flask('not_in_spec')
+    first = First(fx_make_spec_file(), app)
+
+    def get_endpoint() -> dict:
+        return {'message': 'OK'}
+
+    first.add_view_func(get_endpoint)
+
+    @app.route('/health', methods=['POST'])
+    def health() -> dict:
+        return {'status': 'OK'}
+
+    assert not app.before_request_funcs
+
+    def fail_validating(*args, **kwargs):
+        pytest.fail('Request to endpoint not in specification must not be validated.')
+
+    with app.test_client() as test_client:
+        assert test_client.get('/endpoint').json == {'message': 'OK'}
+        monkeypatch.setattr(First, '_validating_request', fail_validating)
+        assert test_client.post('/health', json={'unknown': 1}).json == {'status': 'OK'}
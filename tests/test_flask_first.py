@@ -7,6 +7,9 @@ from flask import jsonify
 from flask import request
 from flask import Response
 from flask_first import First
+from flask_first.first.exceptions import FirstRequestCookiesValidation
+from flask_first.first.exceptions import FirstRequestHeadersValidation
+from flask_first.first.exceptions import FirstRequestJSONValidation
 from flask_first.first.exceptions import FirstRequestPathArgsValidation
 
 from .conftest import BASEDIR
@@ -202,6 +205,43 @@ def test_specification__one_of():
         assert test_client.get('/one_of_endpoint').status_code == 200
 
 
+def test_specification__one_of_discriminator():
+    app = Flask('testing_one_of_discriminator')
+    app.debug = 1
+    app.testing = 1
+    app.config['FIRST_RESPONSE_VALIDATION'] = True
+    first = First(Path(BASEDIR, 'specs/v3.1.0/discriminator.openapi.yaml'), app)
+    pet_schema = first.spec.raw_spec['components']['schemas']['Pet']
+    assert set(pet_schema) == {'oneOf', 'discriminator'}
+    assert first.spec._schemas_cache.get_discriminator_branches(pet_schema) == {
+        'cat': 0,
+        'dog': 1,
+        'Cat': 0,
+        'Dog': 1,
+    }
+
+    def create_pet() -> dict:
+        # Data validated via `oneOf` is serialized into the key of the keyword.
+        return request.extensions['first']['json']['oneOf']
+
+    first.add_view_func(create_pet)
+
+    with app.test_client() as test_client:
+        for pet in (
+            {'pet_type': 'cat', 'name': 'Tom'},
+            {'pet_type': 'dog', 'bark': True},
+            {'pet_type': 'Cat', 'name': 'Tom'},
+        ):
+            assert test_client.post('/pets', json=pet).json == pet
+
+        # Only schema chosen by discriminator is used, though the value matches other schema.
+        with pytest.raises(FirstRequestJSONValidation):
+            test_client.post('/pets', json={'pet_type': 'cat', 'bark': True})
+
+        with pytest.raises(FirstRequestJSONValidation):
+            test_client.post('/pets', json={'pet_type': 'bird', 'name': 'Tweety', 'bark': True})
+
+
 def test_specification__any_of():
     app = Flask('testing_any_of')
     app.debug = 1
@@ -256,6 +296,40 @@ def test_specification__headers():
         assert r.json['message'] == 'test_header'
 
 
+def test_specification__declared_headers_and_cookies(fx_make_spec_file):
+    first = First(
+        fx_make_spec_file(
+            parameters=[
+                {'name': 'X-Request-Id', 'in': 'header', 'schema': {'type': 'integer'}},
+                {'name': 'session', 'in': 'cookie', 'schema': {'type': 'integer'}},
+            ]
+        ),
+        Flask('declared_headers_and_cookies'),
+    )
+    first.app.debug = True
+
+    def get_endpoint() -> dict:
+        return {
+            'headers': request.extensions['first']['headers'],
+            'cookies': request.extensions['first']['cookies'],
+        }
+
+    first.add_view_func(get_endpoint)
+    client = first.app.test_client()
+
+    client.set_cookie('session', '2')
+    client.set_cookie('undeclared', 'value')
+    r = client.get('/endpoint', headers={'x-request-id': '1', 'User-Agent': 'tests'})
+    assert r.json == {'headers': {'X-Request-Id': 1}, 'cookies': {'session': 2}}
+
+    with pytest.raises(FirstRequestHeadersValidation):
+        client.get('/endpoint', headers={'X-Request-Id': 'not_integer'})
+
+    client.set_cookie('session', 'not_integer')
+    with pytest.raises(FirstRequestCookiesValidation):
+        client.get('/endpoint')
+
+
 def test_specification__registration_function():
     def mini_endpoint() -> dict:
         return {'message': 'test_factory_app'}
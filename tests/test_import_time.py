@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+# Modules imported only on first usage: validators of specification, PyYAML and Swagger UI.
+DEFERRED_MODULES = (
+    'openapi_spec_validator',
+    'jsonschema',
+    'yaml',
+    'flask_first.swagger_ui',
+    'flask_first.first.validator',
+)
+
+
+def _imported_modules(code: str) -> dict[str, int]:
+    """Modules imported by code with cumulative time of import in microseconds."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_import_time__heavy_modules_are_deferred():
+    modules = _imported_modules('import flask_first')
+
+    assert 'flask_first' in modules
+    for deferred_module in DEFERRED_MODULES:
+        imported = [
+            name
+            for name in modules
+            if name == deferred_module or name.startswith(f'{deferred_module}.')
+        ]
+        assert imported == [], f'<{deferred_module}> is imported with <flask_first>'
+
+
+def test_import_time__modules_are_imported_on_usage(fx_make_spec_file):
+    code = (
+        'from flask import Flask;'
+        'from flask_first import First;'
+        'app = Flask("import_time");'
+        'app.config["FIRST_EXPERIMENTAL_VALIDATOR"] = True;'
+        f'First({str(fx_make_spec_file())!r}, app, swagger_ui_path="/docs")'
+    )
+    modules = _imported_modules(code)
+
+    for deferred_module in ('yaml', 'flask_first.swagger_ui', 'flask_first.first.validator'):
+        assert deferred_module in modules
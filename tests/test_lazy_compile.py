@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from flask import Flask
+from flask_first import First
+from flask_first.first.specification import LazyConvertedMapping
+
+from .conftest import BASEDIR
+
+
+def _create_first(lazy_compile: bool or str) -> First:
+    app = Flask('lazy_compile')
+    app.config['FIRST_RESPONSE_VALIDATION'] = True
+    app.config['FIRST_LAZY_COMPILE'] = lazy_compile
+    return First(Path(BASEDIR, 'specs/v3.1.0/openapi.yaml'), app)
+
+
+def test_lazy_compile__on_first_access():
+    first = _create_first(True)
+    path_item = first.spec.deserialized_spec['paths']['/items']
+    assert isinstance(path_item, LazyConvertedMapping)
+    assert not path_item._converted
+
+    def items_list() -> list:
+        return []
+
+    first.add_view_func(items_list)
+    assert first.app.test_client().get('/items').status_code == 200
+    assert list(path_item._converted) == ['get']
+
+
+def test_lazy_compile__same_as_eager():
+    eager_spec = _create_first(False).spec.deserialized_spec
+    lazy_first = _create_first(True)
+    lazy_first.spec.warm_up()
+    lazy_spec = lazy_first.spec.deserialized_spec
+
+    assert lazy_spec['paths'].keys() == eager_spec['paths'].keys()
+    for path, path_item in eager_spec['paths'].items():
+        assert lazy_spec['paths'][path].keys() == path_item.keys()
+    assert lazy_spec['components'].keys() == eager_spec['components'].keys()
+
+
+def test_lazy_compile__thread_safe():
+    first = _create_first(True)
+    path_item = first.spec.deserialized_spec['paths']['/items']
+
+    with ThreadPoolExecutor(8) as executor:
+        operations = list(executor.map(lambda _: path_item['post'], range(32)))
+
+    assert all(operation is operations[0] for operation in operations)
+
+
+def test_lazy_compile__background_warm_up():
+    first = _create_first('background')
+    assert first.spec.warm_up_thread is None
+
+    def items_list() -> list:
+        return []
+
+    first.add_view_func(items_list)
+    assert first.app.test_client().get('/items').status_code == 200
+    first.spec.warm_up_thread.join(timeout=10)
+
+    assert not first.spec.warm_up_thread.is_alive()
+    for lazy_mapping in first.spec._lazy_mappings:
+        assert lazy_mapping._converted.keys() == lazy_mapping._source.keys()
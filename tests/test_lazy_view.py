@@ -0,0 +1,71 @@
+import sys
+from copy import deepcopy
+
+import pytest
+from flask import Flask
+from flask_first import First
+from flask_first.first.exceptions import FirstException
+
+LAZY_VIEWS = '''
+from flask import request
+
+
+def get_endpoint() -> dict:
+    return {'message': 'OK'}
+
+
+def post_endpoint() -> tuple:
+    return request.extensions['first']['json'], 201
+'''
+
+
+@pytest.fixture
+def fx_lazy_views_module(tmp_path, monkeypatch):
+    (tmp_path / 'lazy_views.py').write_text(LAZY_VIEWS)
+    monkeypatch.syspath_prepend(tmp_path)
+    yield 'lazy_views'
+    sys.modules.pop('lazy_views', None)
+
+
+def test_lazy_view__extension(fx_make_minimal_spec, fx_make_spec_file, fx_lazy_views_module):
+    paths = deepcopy(fx_make_minimal_spec['paths'])
+    paths['/endpoint']['get']['x-first-handler'] = 'lazy_views:get_endpoint'
+    first = First(fx_make_spec_file(paths=paths), Flask('lazy_view'))
+
+    assert first.add_lazy_view_funcs() == ['post_endpoint']
+    assert 'lazy_views' not in sys.modules
+
+    client = first.app.test_client()
+    assert client.get('/endpoint').json == {'message': 'OK'}
+    assert 'lazy_views' in sys.modules
+
+
+def test_lazy_view__template(fx_make_spec_file, fx_lazy_views_module):
+    first = First(fx_make_spec_file(), Flask('lazy_view'))
+
+    def get_endpoint() -> dict:
+        return {'message': 'Registered'}
+
+    first.add_view_func(get_endpoint)
+    assert first.add_lazy_view_funcs('lazy_views:{operation_id}') == []
+    assert 'lazy_views' not in sys.modules
+
+    client = first.app.test_client()
+    assert client.get('/endpoint').json == {'message': 'Registered'}
+    assert 'lazy_views' not in sys.modules
+    r = client.post('/endpoint', json={'message': 'OK'})
+    assert r.status_code == 201
+    assert r.json == {'message': 'OK'}
+
+
+def test_lazy_view__handler_not_found(fx_make_spec_file):
+    app = Flask('lazy_view')
+    app.debug = True
+    first = First(fx_make_spec_file(), app)
+    first.add_lazy_view_funcs('non_existent_views:{operation_id}')
+
+    with pytest.raises(FirstException):
+        app.test_client().get('/endpoint')
+
+    with pytest.raises(FirstException):
+        First(fx_make_spec_file(), Flask('lazy_view')).add_lazy_view_funcs('lazy_views')
@@ -0,0 +1,102 @@
+import pytest
+import yaml
+from flask import Flask
+from flask import request
+from flask_first import First
+from flask_first.middleware import FirstWSGIMiddleware
+
+
+@pytest.fixture
+def fx_middleware_app(fx_make_minimal_spec, fx_make_spec_file):
+    paths = dict(fx_make_minimal_spec['paths'])
+    paths['/items/{item_id}'] = {
+        'parameters': [
+            {'name': 'item_id', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}},
+            {'name': 'page', 'in': 'query', 'schema': {'type': 'integer'}},
+        ],
+        'get': {
+            'operationId': 'get_item',
+            'responses': {'200': {'description': 'OK'}},
+        },
+    }
+    app = Flask('middleware')
+    first = First(fx_make_spec_file(paths=paths), app)
+
+    def post_endpoint() -> tuple:
+        return request.extensions['first']['json'], 201
+
+    def get_item(item_id: int) -> dict:
+        return {
+            'view_args': request.extensions['first']['view_args'],
+            'args': request.extensions['first']['args'],
+        }
+
+    first.add_view_func(post_endpoint)
+    first.add_view_func(get_item)
+
+    @app.route('/health', methods=['POST'])
+    def health() -> dict:
+        return {'status': 'OK'}
+
+    app.wsgi_app = FirstWSGIMiddleware(app.wsgi_app, first)
+    return app
+
+
+def _fail(*args, **kwargs):
+    pytest.fail('Request must not be validated by view function.')
+
+
+def test_middleware__valid_request_is_not_validated_again(fx_middleware_app, monkeypatch):
+    monkeypatch.setattr(First, '_validating_request', _fail)
+    client = fx_middleware_app.test_client()
+
+    r = client.post('/endpoint', json={'message': 'OK'})
+    assert r.status_code == 201
+    assert r.json == {'message': 'OK'}
+
+    r = client.get('/items/5', query_string={'page': '2'})
+    assert r.json == {'view_args': {'item_id': 5}, 'args': {'page': 2}}
+
+
+def test_middleware__invalid_request(fx_middleware_app):
+    fx_middleware_app.before_request(_fail)
+    client = fx_middleware_app.test_client()
+
+    r = client.post('/endpoint', json={'message': 1})
+    assert r.status_code == 400
+    assert 'message' in r.json
+
+    assert client.get('/items/5', query_string={'page': 'first'}).status_code == 400
+    assert client.post('/endpoint', data='{', content_type='application/json').status_code == 400
+
+
+def test_middleware__request_not_in_spec(fx_middleware_app):
+    client = fx_middleware_app.test_client()
+    assert client.post('/health', json={'unknown': 1}).json == {'status': 'OK'}
+    assert client.get('/items/first').status_code == 404
+
+
+def test_middleware__body_too_large(fx_middleware_app, monkeypatch):
+    fx_middleware_app.config['MAX_CONTENT_LENGTH'] = 100
+    client = fx_middleware_app.test_client()
+    assert client.post('/endpoint', json={'message': 'OK'}).status_code == 201
+
+    monkeypatch.setattr(fx_middleware_app.wsgi_app, 'wsgi_app', _fail)
+    assert client.post('/endpoint', json={'message': 'OK' * 100}).status_code == 413
+
+
+def test_middleware__reloaded_spec(fx_middleware_app):
+    middleware = fx_middleware_app.wsgi_app
+    first = middleware.first
+    route_matcher = middleware.route_matcher
+
+    spec_path = first.spec.path
+    spec = yaml.safe_load(spec_path.read_text())
+    spec['paths']['/items/{item_id}']['parameters'][1]['schema']['type'] = 'string'
+    spec_path.write_text(yaml.dump(spec))
+    first.reload_spec()
+
+    assert middleware.route_matcher is not route_matcher
+    assert middleware.route_matcher.spec is first.spec
+    r = fx_middleware_app.test_client().get('/items/5', query_string={'page': 'first'})
+    assert r.json == {'view_args': {'item_id': 5}, 'args': {'page': 'first'}}
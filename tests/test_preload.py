@@ -0,0 +1,75 @@
+import gc
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from flask import request
+from flask_first import First
+
+from .conftest import BASEDIR
+
+
+@pytest.fixture
+def fx_unfreeze():
+    yield
+    gc.unfreeze()
+
+
+def test_preload__freeze(fx_make_spec_file, fx_unfreeze):
+    app = Flask('preload')
+    app.config['FIRST_LAZY_COMPILE'] = True
+    app.config['FIRST_PRELOAD_FREEZE'] = True
+    first = First(fx_make_spec_file(), app)
+    assert first.frozen
+    assert gc.get_freeze_count() > 0
+    assert all(mapping._converted for mapping in first.spec._lazy_mappings)
+
+    def post_endpoint() -> tuple:
+        return request.extensions['first']['json'], 201
+
+    first.add_view_func(post_endpoint)
+    operation = first._operations[('post_endpoint', 'POST')]
+    assert operation._request_body is not None
+
+    r = app.test_client().post('/endpoint', json={'message': 'OK'})
+    assert r.status_code == 201
+    assert r.json == {'message': 'OK'}
+
+
+def test_preload__freeze_registered_operations(fx_make_spec_file, fx_unfreeze):
+    app = Flask('preload')
+    first = First(fx_make_spec_file(), app)
+
+    def post_endpoint() -> tuple:
+        return request.extensions['first']['json'], 201
+
+    first.add_view_func(post_endpoint)
+    operation = first._operations[('post_endpoint', 'POST')]
+    assert not hasattr(operation, '_request_body')
+
+    first.freeze()
+    assert operation._request_body is not None
+    assert gc.get_freeze_count() > 0
+
+
+def test_preload__freeze_not_json_request_body(fx_unfreeze):
+    app = Flask('preload')
+    app.config['FIRST_PRELOAD_FREEZE'] = True
+    first = First(Path(BASEDIR, 'specs/v3.1.0/files.openapi.yaml'), app)
+
+    def upload_file() -> tuple:
+        assert request.files.get('file')
+        return '', 204
+
+    first.add_view_func(upload_file)
+    operation = first._operations[('upload_file', 'POST')]
+    assert operation._request_body is None
+    assert operation.json_schema is None
+    first.freeze()
+
+    r = app.test_client().post(
+        '/files',
+        headers={'Content-Type': 'multipart/form-data'},
+        data={'file': open(Path(BASEDIR, 'content/img.png'), mode='rb')},
+    )
+    assert r.status_code == 204
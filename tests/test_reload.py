@@ -0,0 +1,170 @@
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+from flask import Flask
+from flask import request
+from flask_first import First
+from flask_first.first.exceptions import FirstException
+from flask_first.first.exceptions import FirstRequestJSONValidation
+from flask_first.first.loaders.yaml_loader import YAMLReader
+
+from .conftest import BASEDIR
+
+
+def _operation(operation_id: str, schema_ref: str) -> dict:
+    return {
+        'operationId': operation_id,
+        'requestBody': {'content': {'application/json': {'schema': {'$ref': schema_ref}}}},
+        'responses': {'200': {'description': 'OK'}},
+    }
+
+
+@pytest.fixture
+def fx_multiple_files_spec(tmp_path):
+    files = {
+        'openapi.yaml': {
+            'openapi': '3.1.0',
+            'info': {'title': 'API for testing Flask-First', 'version': '1.0.0'},
+            'paths': {
+                '/first': {'post': _operation('first_endpoint', 'first.yaml#/First')},
+                '/second': {'$ref': 'second.yaml#/SecondPath'},
+            },
+        },
+        'first.yaml': {
+            'First': {'type': 'object', 'properties': {'message': {'type': 'string'}}},
+        },
+        'second.yaml': {
+            'SecondPath': {'post': _operation('second_endpoint', '#/Second')},
+            'Second': {'type': 'object', 'properties': {'message': {'type': 'string'}}},
+        },
+    }
+
+    def write(file_name: str, content: dict) -> None:
+        with open(tmp_path / file_name, 'w') as f:
+            yaml.dump(content, f)
+
+    for file_name, content in files.items():
+        write(file_name, content)
+
+    return tmp_path / 'openapi.yaml', files, write
+
+
+def _create_first(path_to_spec) -> First:
+    app = Flask('reload')
+    app.debug = True
+    first = First(path_to_spec, app)
+
+    def first_endpoint() -> dict:
+        return request.extensions['first']['json']
+
+    def second_endpoint() -> dict:
+        return request.extensions['first']['json']
+
+    first.add_view_func(first_endpoint)
+    first.add_view_func(second_endpoint)
+    return first
+
+
+def test_reload__not_changed_files_are_not_read(fx_multiple_files_spec, monkeypatch):
+    spec_path, files, write = fx_multiple_files_spec
+    reader = YAMLReader(spec_path).load()
+
+    files['first.yaml']['First']['properties']['message']['type'] = 'integer'
+    write('first.yaml', files['first.yaml'])
+    new_reader = YAMLReader(spec_path).load(previous=reader)
+
+    assert new_reader.store['openapi.yaml'] is reader.store['openapi.yaml']
+    assert new_reader.store['second.yaml'] is reader.store['second.yaml']
+    assert new_reader.store['first.yaml'] is not reader.store['first.yaml']
+    assert new_reader.changed_operations(reader, [('/first', 'post'), ('/second', 'post')]) == {
+        ('/first', 'post')
+    }
+
+
+def test_reload__only_changed_operations(fx_multiple_files_spec):
+    spec_path, files, write = fx_multiple_files_spec
+    first = _create_first(spec_path)
+    client = first.app.test_client()
+    assert client.post('/second', json={'message': 'OK'}).json == {'message': 'OK'}
+    first_operation = first._operations[('first_endpoint', 'POST')]
+    second_operation = first._operations[('second_endpoint', 'POST')]
+
+    files['second.yaml']['Second']['properties']['message']['type'] = 'integer'
+    write('second.yaml', files['second.yaml'])
+
+    assert first.reload_spec() == {('/second', 'post')}
+    assert first._operations[('first_endpoint', 'POST')] is first_operation
+    assert first._operations[('second_endpoint', 'POST')] is not second_operation
+    assert client.post('/second', json={'message': 1}).json == {'message': 1}
+    with pytest.raises(FirstRequestJSONValidation):
+        client.post('/second', json={'message': 'OK'})
+
+    assert first.reload_spec() == set()
+
+
+def test_reload__moved_operation(fx_multiple_files_spec):
+    spec_path, files, write = fx_multiple_files_spec
+    first = _create_first(spec_path)
+    spec = first.spec
+    operations = first._operations
+
+    files['openapi.yaml']['paths']['/moved'] = files['openapi.yaml']['paths'].pop('/first')
+    write('openapi.yaml', files['openapi.yaml'])
+
+    with pytest.raises(FirstException):
+        first.reload_spec()
+    assert first.spec is spec
+    assert first._operations is operations
+
+
+def test_reload__watch(fx_multiple_files_spec):
+    spec_path, files, write = fx_multiple_files_spec
+    first = _create_first(spec_path)
+    spec = first.spec
+    first.watch_spec(interval=0.01)
+
+    try:
+        files['first.yaml']['First']['properties']['message']['type'] = 'integer'
+        write('first.yaml', files['first.yaml'])
+
+        for _ in range(500):
+            if first.spec is not spec:
+                break
+            time.sleep(0.01)
+    finally:
+        first.stop_watching_spec()
+
+    assert first.spec is not spec
+    assert first.app.test_client().post('/first', json={'message': 1}).json == {'message': 1}
+
+
+def test_reload__not_json_request_body(tmp_path):
+    spec_path = tmp_path / 'openapi.yaml'
+    spec = yaml.safe_load(Path(BASEDIR, 'specs/v3.1.0/files.openapi.yaml').read_text())
+    spec_path.write_text(yaml.dump(spec))
+    app = Flask('reload')
+    first = First(spec_path, app)
+
+    def upload_file() -> tuple:
+        assert request.files.get('file')
+        return '', 204
+
+    first.add_view_func(upload_file)
+    operation = first._operations[('upload_file', 'POST')]
+
+    spec['paths']['/files']['post']['summary'] = 'Upload file.'
+    spec_path.write_text(yaml.dump(spec))
+
+    assert first.reload_spec() == {('/files', 'post')}
+    new_operation = first._operations[('upload_file', 'POST')]
+    assert new_operation is not operation
+    assert new_operation.request_body is None
+
+    r = app.test_client().post(
+        '/files',
+        headers={'Content-Type': 'multipart/form-data'},
+        data={'file': open(Path(BASEDIR, 'content/img.png'), mode='rb')},
+    )
+    assert r.status_code == 204
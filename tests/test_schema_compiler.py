@@ -0,0 +1,192 @@
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from flask import request
+from flask_first import First
+from flask_first.first.exceptions import FirstException
+from flask_first.first.exceptions import FirstRequestArgsValidation
+from flask_first.first.exceptions import FirstRequestJSONValidation
+from flask_first.schema.schema_compiler import compile_schema
+from flask_first.schema.schema_compiler import CompiledLoader
+from flask_first.schema.schema_maker import make_marshmallow_schema
+from marshmallow import EXCLUDE
+from marshmallow import RAISE
+from marshmallow import ValidationError
+
+from .conftest import BASEDIR
+
+ITEM_SCHEMA = {
+    'type': 'object',
+    'required': ['uuid', 'name'],
+    'properties': {
+        'uuid': {'type': 'string', 'format': 'uuid'},
+        'name': {'type': 'string', 'minLength': 1, 'maxLength': 5, 'pattern': '^[a-z]+$'},
+        'count': {'type': 'integer', 'minimum': 0, 'maximum': 10},
+        'price': {'type': 'number', 'nullable': True},
+        'is_active': {'type': 'boolean'},
+        'kind': {'type': 'string', 'enum': ['a', 'b']},
+        'created': {'type': 'string', 'format': 'date-time'},
+        'tags': {'type': 'array', 'items': {'type': 'integer'}},
+        'children': {
+            'type': 'array',
+            'items': {'type': 'object', 'properties': {'id': {'type': 'integer'}}},
+        },
+        'owner': {
+            'type': 'object',
+            'nullable': True,
+            'properties': {'name': {'type': 'string'}},
+        },
+    },
+}
+UUID = '7c5d8bd8-59b9-4c2f-8e5c-0d0bb6d8e3f5'
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {'uuid': UUID, 'name': 'abc'},
+        {
+            'uuid': UUID,
+            'name': 'abc',
+            'count': '10',
+            'price': 1,
+            'is_active': 'true',
+            'kind': 'b',
+            'created': '2024-01-01T10:00:00+00:00',
+            'tags': [1, '2'],
+            'children': [{'id': 1}, {}],
+            'owner': None,
+        },
+        {'uuid': UUID, 'name': 'abc', 'price': None, 'owner': {'name': 'x'}},
+        {'uuid': UUID},
+        {'uuid': 'not uuid', 'name': 'abc'},
+        {'uuid': UUID, 'name': ''},
+        {'uuid': UUID, 'name': 'abcdef'},
+        {'uuid': UUID, 'name': 'ABC'},
+        {'uuid': UUID, 'name': 1},
+        {'uuid': UUID, 'name': 'abc', 'count': 11},
+        {'uuid': UUID, 'name': 'abc', 'count': True},
+        {'uuid': UUID, 'name': 'abc', 'count': 1.5},
+        {'uuid': UUID, 'name': 'abc', 'count': None},
+        {'uuid': UUID, 'name': 'abc', 'price': 'nan'},
+        {'uuid': UUID, 'name': 'abc', 'is_active': 'maybe'},
+        {'uuid': UUID, 'name': 'abc', 'kind': 'c'},
+        {'uuid': UUID, 'name': 'abc', 'created': 'yesterday'},
+        {'uuid': UUID, 'name': 'abc', 'tags': [1, None]},
+        {'uuid': UUID, 'name': 'abc', 'children': [{'id': 1, 'unknown': 1}]},
+        {'uuid': UUID, 'name': 'abc', 'unknown': 1},
+        [],
+        None,
+    ],
+)
+@pytest.mark.parametrize('unknown', [RAISE, EXCLUDE])
+def test_schema_compiler__same_as_marshmallow(data, unknown):
+    schema = make_marshmallow_schema(ITEM_SCHEMA)(unknown=unknown)
+    loader = CompiledLoader(compile_schema(ITEM_SCHEMA, unknown=unknown), schema.load)
+
+    try:
+        expected = schema.load(data)
+    except ValidationError as e:
+        with pytest.raises(ValidationError) as compiled_error:
+            loader.load(data)
+        assert compiled_error.value.messages == e.messages
+    else:
+        assert loader.load(data) == expected
+
+
+@pytest.mark.parametrize(
+    'schema, data',
+    [
+        ({'type': 'array', 'items': {'type': 'string', 'format': 'date'}}, ['2024-01-01']),
+        ({'type': 'array', 'items': {'type': 'string', 'format': 'date'}}, ['01.01.2024']),
+        ({'type': 'array', 'nullable': True, 'items': {'type': 'number'}}, None),
+        ({'type': 'integer', 'enum': [1, 2]}, 3),
+        ({'type': 'string', 'format': 'email'}, 'user@example.com'),
+    ],
+)
+def test_schema_compiler__fields_same_as_marshmallow(schema, data):
+    field = make_marshmallow_schema(schema)
+    loader = CompiledLoader(compile_schema(schema), field.deserialize)
+
+    try:
+        expected = field.deserialize(data)
+    except ValidationError as e:
+        with pytest.raises(ValidationError) as compiled_error:
+            loader.load(data)
+        assert compiled_error.value.messages == e.messages
+    else:
+        assert loader.function(data) == expected
+
+
+def test_schema_compiler__valid_data_loaded_without_marshmallow():
+    data = {
+        'uuid': UUID,
+        'name': 'abc',
+        'count': '10',
+        'price': 1,
+        'is_active': 'true',
+        'created': '2024-01-01T10:00:00+00:00',
+        'tags': [1, '2'],
+        'children': [{'id': 1}],
+        'owner': {'name': 'x'},
+    }
+    function = compile_schema(ITEM_SCHEMA)
+    assert function(data) == make_marshmallow_schema(ITEM_SCHEMA)().load(data)
+
+
+def test_schema_compiler__not_compiled_schemas():
+    assert compile_schema({'oneOf': [{'type': 'string'}, {'type': 'integer'}]}) is None
+    assert compile_schema({'type': 'object', 'additionalProperties': {'oneOf': []}}) is None
+
+
+def _create_first(path_to_spec: str, validation_engine: str) -> First:
+    app = Flask('validation_engine')
+    app.debug = True
+    app.config['FIRST_RESPONSE_VALIDATION'] = True
+    app.config['FIRST_VALIDATION_ENGINE'] = validation_engine
+    return First(Path(BASEDIR, 'specs/v3.1.0', path_to_spec), app)
+
+
+@pytest.mark.parametrize('validation_engine', ['marshmallow', 'compiled'])
+def test_schema_compiler__validation_engine(validation_engine):
+    first = _create_first('openapi.yaml', validation_engine)
+
+    def create_item() -> tuple:
+        return {'uuid': UUID, **request.extensions['first']['json']}, 201
+
+    first.add_view_func(create_item)
+    client = first.app.test_client()
+
+    r = client.post('/items', json={'name': 'item'})
+    assert r.status_code == 201
+    assert r.json['name'] == 'item'
+
+    with pytest.raises(FirstRequestJSONValidation):
+        client.post('/items', json={'name': 1})
+
+
+@pytest.mark.parametrize('validation_engine', ['marshmallow', 'compiled'])
+def test_schema_compiler__validation_engine_args(validation_engine):
+    first = _create_first('args.openapi.yaml', validation_engine)
+
+    def mini_endpoint() -> dict:
+        return {'non_exist_arg': request.extensions['first']['args']['exist_arg']}
+
+    first.add_view_func(mini_endpoint)
+    client = first.app.test_client()
+
+    r = client.get('/parameters_endpoint', query_string={'exist_arg': 'EXIST_ARG'})
+    assert r.status_code == 200
+    assert r.json == {'non_exist_arg': 'EXIST_ARG'}
+
+    with pytest.raises(FirstRequestArgsValidation):
+        client.get('/parameters_endpoint', query_string={'non_exist_arg': 'NON_EXIST_ARG'})
+
+    operation = first._operations[('mini_endpoint', 'GET')]
+    assert isinstance(operation.args_loader, CompiledLoader) is (validation_engine == 'compiled')
+
+
+def test_schema_compiler__unknown_validation_engine():
+    with pytest.raises(FirstException):
+        _create_first('openapi.yaml', 'unknown')
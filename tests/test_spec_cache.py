@@ -0,0 +1,98 @@
+from datetime import date
+
+import pytest
+import yaml
+from flask import Flask
+from flask_first import First
+from flask_first.first.exceptions import FirstOpenAPIValidation
+from flask_first.first.loaders.yaml_loader import YAMLReader
+
+
+def _create_app(spec_path, cache_dir, spec_validation: str = 'always') -> Flask:
+    app = Flask('spec_cache')
+    app.config['FIRST_SPEC_CACHE_DIR'] = cache_dir
+    app.config['FIRST_SPEC_VALIDATION'] = spec_validation
+    First(spec_path, app)
+    return app
+
+
+def test_spec_cache__warm_start_skips_loading(fx_make_spec_file, tmp_path, monkeypatch):
+    spec_path = fx_make_spec_file()
+    cache_dir = tmp_path / 'cache'
+
+    cold_app = _create_app(spec_path, cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    def fail_loading(*args, **kwargs):
+        pytest.fail('Specification must be loaded from cache.')
+
+    monkeypatch.setattr(YAMLReader, 'load', fail_loading)
+    warm_app = _create_app(spec_path, cache_dir)
+
+    cold_spec = cold_app.extensions['first'].spec
+    warm_spec = warm_app.extensions['first'].spec
+    assert warm_spec.raw_spec == cold_spec.raw_spec
+    assert warm_spec.resolved_spec == cold_spec.resolved_spec
+    assert warm_spec.deserialized_spec.keys() == cold_spec.deserialized_spec.keys()
+
+
+def test_spec_cache__validation_policy(fx_make_spec_file, tmp_path):
+    spec_path = fx_make_spec_file()
+    spec = yaml.safe_load(spec_path.read_text())
+    del spec['info']
+    spec_path.write_text(yaml.dump(spec))
+    cache_dir = tmp_path / 'cache'
+
+    with pytest.raises(FirstOpenAPIValidation):
+        _create_app(spec_path, cache_dir)
+    assert not cache_dir.exists()
+
+    _create_app(spec_path, cache_dir, spec_validation='off')
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # Specification cached without validation is validated by policy of the next start.
+    with pytest.raises(FirstOpenAPIValidation):
+        _create_app(spec_path, cache_dir)
+
+    with pytest.raises(FirstOpenAPIValidation):
+        _create_app(spec_path, cache_dir, spec_validation='once')
+
+
+def test_spec_cache__changed_file_invalidates_cache(fx_make_spec_file, tmp_path):
+    spec_path = fx_make_spec_file()
+    cache_dir = tmp_path / 'cache'
+    _create_app(spec_path, cache_dir)
+
+    spec = yaml.safe_load(spec_path.read_text())
+    spec['info']['title'] = 'Changed title'
+    spec_path.write_text(yaml.dump(spec))
+
+    app = _create_app(spec_path, cache_dir)
+    assert app.extensions['first'].spec.raw_spec['info']['title'] == 'Changed title'
+
+
+def test_spec_cache__shared_refs(fx_make_spec_file, tmp_path):
+    spec_path = fx_make_spec_file()
+    spec = yaml.safe_load(spec_path.read_text())
+    spec['components'] = {'schemas': {'Message': {'type': 'string'}}}
+    request_body = spec['paths']['/endpoint']['post']['requestBody']
+    request_body['content']['application/json']['schema'] = {'$ref': '#/components/schemas/Message'}
+    spec_path.write_text(yaml.dump(spec))
+    cache_dir = tmp_path / 'cache'
+    _create_app(spec_path, cache_dir)
+
+    raw_spec = _create_app(spec_path, cache_dir).extensions['first'].spec.raw_spec
+    request_body = raw_spec['paths']['/endpoint']['post']['requestBody']
+    schema = request_body['content']['application/json']['schema']
+    assert schema is raw_spec['components']['schemas']['Message']
+
+
+def test_spec_cache__not_json_values(fx_make_spec_file, tmp_path):
+    spec_path = fx_make_spec_file()
+    spec_path.write_text(spec_path.read_text() + 'x-released: 2024-01-01\n')
+    cache_dir = tmp_path / 'cache'
+
+    with pytest.warns(UserWarning, match='Cache of specification not saved'):
+        app = _create_app(spec_path, cache_dir)
+    assert not cache_dir.exists()
+    assert app.extensions['first'].spec.raw_spec['x-released'] == date(2024, 1, 1)
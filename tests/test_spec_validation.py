@@ -0,0 +1,92 @@
+import pytest
+import yaml
+from flask import Flask
+from flask_first import First
+from flask_first.first.exceptions import FirstException
+from flask_first.first.specification import Specification
+
+
+def _create_app(spec_path, markers_dir, spec_validation: str) -> Flask:
+    app = Flask('spec_validation')
+    app.config['FIRST_SPEC_CACHE_DIR'] = markers_dir
+    app.config['FIRST_SPEC_VALIDATION'] = spec_validation
+    First(spec_path, app)
+    return app
+
+
+def _fail_validating(*args, **kwargs):
+    pytest.fail('Specification must not be validated.')
+
+
+def test_spec_validation__once(fx_make_spec_file, tmp_path, monkeypatch):
+    spec_path = fx_make_spec_file()
+    markers_dir = tmp_path / 'markers'
+    _create_app(spec_path, markers_dir, 'once')
+    assert len(list(markers_dir.glob('*.validated'))) == 1
+
+    # Cache of specification is removed, so only marker allows skipping validation.
+    for cache_file in markers_dir.glob('*.json'):
+        cache_file.unlink()
+
+    with monkeypatch.context() as m:
+        m.setattr(Specification, '_validating_openapi_file', _fail_validating)
+        _create_app(spec_path, markers_dir, 'once')
+
+
+def test_spec_validation__once__changed_file(fx_make_spec_file, tmp_path):
+    spec_path = fx_make_spec_file()
+    markers_dir = tmp_path / 'markers'
+    _create_app(spec_path, markers_dir, 'once')
+
+    spec = yaml.safe_load(spec_path.read_text())
+    spec['info']['title'] = 'Changed title'
+    spec_path.write_text(yaml.dump(spec))
+    _create_app(spec_path, markers_dir, 'once')
+
+    assert len(list(markers_dir.glob('*.validated'))) == 2
+
+
+def test_spec_validation__off(fx_make_spec_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(Specification, '_validating_openapi_file', _fail_validating)
+    _create_app(fx_make_spec_file(), tmp_path / 'markers', 'off')
+
+
+def test_spec_validation__unknown_policy(fx_make_spec_file):
+    with pytest.raises(FirstException):
+        Specification(fx_make_spec_file(), spec_validation='sometimes')
+
+
+def test_spec_validation__cli(fx_make_spec_file, tmp_path, monkeypatch):
+    spec_path = fx_make_spec_file()
+    markers_dir = tmp_path / 'markers'
+    app = _create_app(spec_path, markers_dir, 'off')
+    assert not list(markers_dir.glob('*.validated'))
+
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=['first', 'validate'])
+    assert result.exit_code == 0, result.output
+    assert len(list(markers_dir.glob('*.validated'))) == 1
+
+    for cache_file in markers_dir.glob('*.json'):
+        cache_file.unlink()
+    monkeypatch.setattr(Specification, '_validating_openapi_file', _fail_validating)
+    _create_app(spec_path, markers_dir, 'once')
+
+
+def test_spec_validation__once__writable_markers_dir(fx_make_spec_file, tmp_path, monkeypatch):
+    spec_path = fx_make_spec_file()
+    markers_dir = tmp_path / 'markers'
+    _create_app(spec_path, markers_dir, 'once')
+    assert markers_dir.stat().st_mode & 0o777 == 0o700
+
+    for cache_file in markers_dir.glob('*.json'):
+        cache_file.unlink()
+    # Markers in directory writable by other users are not trusted.
+    markers_dir.chmod(0o777)
+    validated = []
+    monkeypatch.setattr(
+        Specification, '_validating_openapi_file', lambda *args: validated.append(args)
+    )
+    with pytest.warns(UserWarning, match='Marker of validated specification not saved'):
+        _create_app(spec_path, markers_dir, 'once')
+    assert len(validated) == 1
@@ -1,9 +1,17 @@
+from copy import deepcopy
 from pathlib import Path
 
 import pytest
 from flask import Flask
 from flask_first import First
 from flask_first.first.exceptions import FirstOpenAPIValidation
+from flask_first.first.loaders import load_from_file
+from flask_first.first.validator import OpenAPI310ValidationError
+from flask_first.first.validator import PARAMETER_LOCATIONS
+from flask_first.first.validator import TYPES
+from flask_first.first.validator import Validator
+from openapi_spec_validator import validate
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
 
 from .conftest import BASEDIR
 
@@ -60,3 +68,83 @@ def test_spec_validator(fx_make_spec_file):
     r = app.test_client().get('/endpoint', follow_redirects=True)
     assert r.status_code == 200
     assert r.json['message'] == 'OK'
+
+
+@pytest.mark.parametrize(
+    'spec',
+    [*Path(BASEDIR, 'specs/v3.1.0').iterdir(), Path(BASEDIR, 'specs/multiple_files/valid')],
+    ids=lambda path: path.name,
+)
+def test_spec_validator__same_as_openapi_spec_validator(spec):
+    if spec.is_dir():
+        spec = Path(spec, 'openapi.yaml')
+    raw_spec = load_from_file(spec)
+
+    try:
+        validate(raw_spec)
+    except (OpenAPIValidationError, TypeError):
+        assert Validator(raw_spec).get_errors() != []
+    else:
+        assert Validator(raw_spec).get_errors() == []
+
+
+def test_spec_validator__not_string_keys(fx_make_minimal_spec):
+    spec = deepcopy(fx_make_minimal_spec)
+    responses = spec['paths']['/endpoint']['get']['responses']
+    responses[200] = responses.pop('200')
+
+    with pytest.raises(TypeError):
+        validate(spec)
+    assert Validator(spec).get_errors() == [
+        '#/paths/~1endpoint/get/responses/200: key must be string, not <int>'
+    ]
+
+
+def test_spec_validator__errors(fx_make_minimal_spec):
+    spec = deepcopy(fx_make_minimal_spec)
+    operation = spec['paths']['/endpoint']['get']
+    operation['parameters'] = [
+        {'name': 'id', 'in': 'path', 'schema': {'type': 'integer'}},
+        {'name': 'page', 'in': 'body', 'schema': {'type': 'integer'}},
+    ]
+    operation['responses']['200']['content']['application/json']['schema'] = {
+        'type': 'text',
+        'minLength': -1,
+        'required': 'message',
+    }
+    spec['paths']['/endpoint/{uuid}'] = {'get': {'operationId': operation['operationId']}}
+
+    errors = Validator(spec).get_errors()
+
+    schema_path = '#/paths/~1endpoint/get/responses/200/content/application~1json/schema'
+    assert set(errors) == {
+        '#/paths/~1endpoint/get/parameters/0: path parameter <id> must be required',
+        f"#/paths/~1endpoint/get/parameters/1/in: value <'body'> not in <{PARAMETER_LOCATIONS}>",
+        f"{schema_path}/type: type <'text'> not in <{TYPES}>",
+        f'{schema_path}/minLength: must be non-negative integer, not <-1>',
+        f'{schema_path}/required: must be array, not <str>',
+        (
+            '#/paths/~1endpoint~1{uuid}/get/operationId: operationId <get_endpoint> is already'
+            ' used in <#/paths/~1endpoint/get>'
+        ),
+        '#/paths/~1endpoint~1{uuid}/get: path parameter <uuid> is not defined',
+    }
+    with pytest.raises(OpenAPI310ValidationError):
+        Validator(spec).validate()
+
+
+def test_spec_validator__shared_node_checked_once(fx_make_minimal_spec):
+    spec = deepcopy(fx_make_minimal_spec)
+    schema = {'type': 'object', 'properties': {'message': {'type': 'text'}}}
+    for route in ('/first', '/second'):
+        spec['paths'][route] = {
+            'post': {
+                'requestBody': {'content': {'application/json': {'schema': schema}}},
+                'responses': {'200': {'description': 'OK'}},
+            }
+        }
+
+    errors = Validator(spec).get_errors()
+
+    assert len(errors) == 1
+    assert errors[0].startswith('#/paths/~1first/post/requestBody')
@@ -5,6 +5,7 @@ from flask import Flask
 from flask import request
 from flask_first import First
 from flask_first.first.exceptions import FirstOpenAPIValidation
+from marshmallow import Schema
 
 from .conftest import BASEDIR
 
@@ -67,3 +68,82 @@ def test_specification__nullable_parameter():
     r = app.test_client().post('/nullable_endpoint', json={'message': None})
     assert r.status_code == 200, r.json
     assert r.json == {'message': None}
+
+
+def test_specification__equal_schemas_made_once(fx_make_spec_file):
+    app = Flask('testing_app')
+    first = First(fx_make_spec_file(), app)
+
+    operations = first.spec.deserialized_spec['paths']['/endpoint']
+    get_schema = operations['get']['responses']['200']['content']['application/json']['schema']
+    post_schema = operations['post']['requestBody']['content']['application/json']['schema']
+
+    assert get_schema is post_schema
+
+
+def test_specification__component_made_once():
+    app = Flask('testing_app')
+    first = First(Path(BASEDIR, 'specs/v3.1.0/param_as_list.openapi.yaml'), app)
+
+    spec = first.spec.deserialized_spec
+    response = spec['paths']['/parameters_endpoint']['get']['responses']['400']
+    assert (
+        response['content']['application/json']['schema'] is spec['components']['schemas']['ERROR']
+    )
+
+
+def test_specification__schemas_not_made_per_request(monkeypatch):
+    app = Flask('testing_app')
+    app.config['FIRST_RESPONSE_VALIDATION'] = True
+    first = First(Path(BASEDIR, 'specs/v3.1.0/all_of.openapi.yaml'), app)
+
+    def all_of_endpoint() -> dict:
+        # Data validated via `allOf` is serialized into the key of the keyword.
+        return request.extensions['first']['json']['allOf']
+
+    first.add_view_func(all_of_endpoint)
+
+    test_client = app.test_client()
+    payload = {'id': 1, 'name': 'Test_name'}
+    assert test_client.post('/all_of_endpoint', json=payload).json == payload
+
+    made_schemas = []
+    schema_init = Schema.__init__
+
+    def counting_init(self, *args, **kwargs):
+        made_schemas.append(self)
+        schema_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Schema, '__init__', counting_init)
+
+    assert test_client.post('/all_of_endpoint', json=payload).json == payload
+    assert made_schemas == []
+
+
+def test_specification__nodes_shared_with_raw_spec():
+    app = Flask('testing_app')
+    first = First(Path(BASEDIR, 'specs/v3.1.0/param_as_list.openapi.yaml'), app)
+    spec = first.spec
+
+    assert spec.resolved_spec['info'] is spec.raw_spec['info']
+    assert spec.deserialized_spec['info'] is spec.raw_spec['info']
+
+    raw_path_item = spec.raw_spec['paths']['/parameters_endpoint']
+    resolved_operation = spec.resolved_spec['paths']['/parameters_endpoint']['get']
+    assert resolved_operation is not raw_path_item['get']
+    assert resolved_operation['responses'] is raw_path_item['get']['responses']
+    assert 'args' in resolved_operation['parameters']
+    assert isinstance(raw_path_item['parameters'], list)
+    assert 'parameters' not in raw_path_item['get']
+
+
+def test_specification__converted_nodes_not_kept():
+    path_to_spec = Path(BASEDIR, 'specs/v3.1.0/param_as_list.openapi.yaml')
+    assert not len(First(path_to_spec, Flask('eager_app')).spec._converted_nodes)
+
+    lazy_app = Flask('lazy_app')
+    lazy_app.config['FIRST_LAZY_COMPILE'] = True
+    spec = First(path_to_spec, lazy_app).spec
+    spec.warm_up()
+    assert not len(spec._converted_nodes)
+    assert '/parameters_endpoint' in spec.deserialized_spec['paths']
@@ -0,0 +1,99 @@
+from copy import deepcopy
+
+import pytest
+from flask import Flask
+from flask import request
+from flask_first import First
+from flask_first.first.exceptions import FirstException
+from flask_first.first.exceptions import FirstRequestArgsValidation
+from flask_first.first.validation_cache import CacheInfo
+from flask_first.first.validation_cache import ValidationCache
+
+PARAMETERS = [
+    {'name': 'page', 'in': 'query', 'schema': {'type': 'integer'}},
+    {'name': 'X-Tenant', 'in': 'header', 'schema': {'type': 'string'}},
+]
+
+
+@pytest.fixture
+def fx_make_cached_first(fx_make_minimal_spec, fx_make_spec_file):
+    def _make_first(cache_size) -> First:
+        paths = deepcopy(fx_make_minimal_spec['paths'])
+        paths['/endpoint']['parameters'] = PARAMETERS
+        paths['/endpoint']['get']['x-first-validation-cache'] = cache_size
+        first = First(fx_make_spec_file(paths=paths), Flask('validation_cache'))
+        first.app.debug = True
+
+        def get_endpoint() -> dict:
+            return {
+                'args': request.extensions['first']['args'],
+                'headers': request.extensions['first']['headers'],
+            }
+
+        first.add_view_func(get_endpoint)
+        return first
+
+    return _make_first
+
+
+def test_validation_cache__hits(fx_make_cached_first):
+    first = fx_make_cached_first(2)
+    client = first.app.test_client()
+
+    for _ in range(3):
+        assert client.get('/endpoint?page=1').json == {'args': {'page': 1}, 'headers': {}}
+    assert first.validation_cache_info() == {'get_endpoint': CacheInfo(2, 1, 2, 1)}
+
+    r = client.get('/endpoint?page=1', headers={'x-tenant': 'other'})
+    assert r.json == {'args': {'page': 1}, 'headers': {'X-Tenant': 'other'}}
+    assert first.validation_cache_info()['get_endpoint'] == CacheInfo(2, 2, 2, 2)
+
+    client.get('/endpoint?page=2')
+    assert first.validation_cache_info()['get_endpoint'].currsize == 2
+
+
+def test_validation_cache__copy_of_data(fx_make_cached_first):
+    first = fx_make_cached_first(10)
+
+    def changing_view(**kwargs) -> dict:
+        args = request.extensions['first']['args']
+        page = args['page']
+        args['page'] = 100
+        return {'page': page}
+
+    # Wrapper of First validates request and calls the changed view function.
+    first.app.view_functions['get_endpoint'] = first._make_validating_view(changing_view)
+    client = first.app.test_client()
+
+    for _ in range(3):
+        assert client.get('/endpoint?page=1').json == {'page': 1}
+    assert first.validation_cache_info()['get_endpoint'].hits == 2
+
+
+def test_validation_cache__errors(fx_make_cached_first):
+    first = fx_make_cached_first(10)
+    client = first.app.test_client()
+
+    for _ in range(2):
+        with pytest.raises(FirstRequestArgsValidation):
+            client.get('/endpoint?page=not_integer')
+    assert first.validation_cache_info()['get_endpoint'] == CacheInfo(1, 1, 10, 1)
+
+
+def test_validation_cache__invalid_size(fx_make_cached_first):
+    first = fx_make_cached_first(0)
+
+    with pytest.raises(FirstException):
+        first.app.test_client().get('/endpoint')
+
+
+def test_validation_cache__lru():
+    cache = ValidationCache(2)
+    cache.set(('a',), 1)
+    cache.set(('b',), 2)
+    assert cache.get(('a',)) == 1
+    cache.set(('c',), 3)
+
+    assert cache.get(('b',)) is ValidationCache.MISSING
+    assert cache.get(('a',)) == 1
+    assert cache.cache_info() == CacheInfo(2, 1, 2, 2)
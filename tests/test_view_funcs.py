@@ -0,0 +1,73 @@
+import sys
+
+import pytest
+from flask import Flask
+from flask_first import First
+from flask_first.first.exceptions import FirstException
+
+VIEWS_GET = '''
+from views.helpers import helper
+
+
+def get_endpoint() -> dict:
+    return {'message': helper()}
+'''
+VIEWS_HELPERS = '''
+def helper() -> str:
+    return 'OK'
+
+
+def post_endpoint() -> tuple:
+    return {'message': 'OK'}, 201
+'''
+
+
+@pytest.fixture
+def fx_views_package(tmp_path, monkeypatch):
+    package_dir = tmp_path / 'views'
+    (package_dir / 'nested').mkdir(parents=True)
+    (package_dir / '__init__.py').write_text('')
+    (package_dir / 'nested' / '__init__.py').write_text('')
+    (package_dir / 'nested' / 'get.py').write_text(VIEWS_GET)
+    (package_dir / 'helpers.py').write_text(VIEWS_HELPERS)
+    monkeypatch.syspath_prepend(tmp_path)
+    yield __import__('views')
+    for name in list(sys.modules):
+        if name == 'views' or name.startswith('views.'):
+            del sys.modules[name]
+
+
+def test_view_funcs__package(fx_make_spec_file, fx_views_package):
+    first = First(fx_make_spec_file(), Flask('view_funcs'))
+
+    assert first.add_view_funcs(fx_views_package) == []
+    assert set(first._operations) == {('get_endpoint', 'GET'), ('post_endpoint', 'POST')}
+
+    client = first.app.test_client()
+    assert client.get('/endpoint').json == {'message': 'OK'}
+    assert client.post('/endpoint', json={'message': 'OK'}).status_code == 201
+
+
+def test_view_funcs__iterable(fx_make_spec_file):
+    first = First(fx_make_spec_file(), Flask('view_funcs'))
+    assert first.unmapped_operations() == ['get_endpoint', 'post_endpoint']
+
+    def get_endpoint() -> dict:
+        return {'message': 'OK'}
+
+    assert first.add_view_funcs([get_endpoint]) == ['post_endpoint']
+    assert first.app.test_client().get('/endpoint').json == {'message': 'OK'}
+
+
+def test_view_funcs__several_functions_of_operation(fx_make_spec_file):
+    first = First(fx_make_spec_file(), Flask('view_funcs'))
+
+    def make_view_func():
+        def get_endpoint() -> dict:
+            return {}
+
+        return get_endpoint
+
+    with pytest.raises(FirstException):
+        first.add_view_funcs([make_view_func(), make_view_func()])
+    assert not first._operations